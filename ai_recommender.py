@@ -0,0 +1,139 @@
+"""
+AI 직무 추천 모듈
+
+Groq 호출을 백그라운드 스레드에서 실행해 대시보드가 규칙 기반 결과를 먼저 그릴 수 있게 합니다.
+같은 요청이 진행 중이면 새로 호출하지 않고 진행 중인 작업을 공유하며, 스트리밍을 지원하는
+클라이언트에서는 토큰이 도착하는 대로 결과 텍스트가 늘어납니다.
+"""
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentation import span
+from response_cache import make_cache_key
+
+AI_ERROR_MESSAGE = "[오류] AI 응답 생성에 실패했습니다. API 키 또는 네트워크 상태를 확인해주세요."
+RECOMMENDATION_SYSTEM_PROMPT = "You are a highly-skilled Korean career consultant. Your primary mission is to provide ONE single best job recommendation based on the user's profile and market data."
+
+
+def build_recommendation_messages(profile_text, context_text):
+    user_prompt = f"""
+        당신은 최고의 커리어 코치입니다. 아래의 **[사용자 프로필]**과 **[시장 데이터]**를 종합적으로 분석하여, 이 사용자에게 가장 적합하다고 생각되는 **단 1개의 직무**를 추천하고 그 이유를 설명해주세요.
+
+        **[사용자 프로필]**
+        {profile_text}
+
+        **[참고용 시장 데이터]**
+        {context_text}
+
+        **[수행할 작업 및 출력 형식]**
+        아래 형식을 반드시 지켜서, 추천 직무와 그 사유를 **한국어로** 명확하게 작성해주세요.
+
+        - **추천 직무:** `여기에 추천하는 직무명 하나만 정확히 기입` (예: 데이터 분석)
+        - **추천 사유:** `사용자의 성향, 관심사, 경력 수준과 시장 데이터(기술스택, 경력분포 등)를 연결하여, 왜 이 직무가 최적의 선택인지 2~3문장으로 요약 설명`
+        """
+    return [{"role": "system", "content": RECOMMENDATION_SYSTEM_PROMPT}, {"role": "user", "content": user_prompt}]
+
+
+def parse_recommended_job(text, valid_jobs):
+    """AI 응답에서 '추천 직무'를 추출합니다. 목록에 없는 직무면 None을 반환합니다."""
+    if not text or "[오류]" in text:
+        return None
+    match = re.search(r"추천 직무:\s*(.+)", text)
+    if not match:
+        return None
+    candidate = match.group(1).strip().strip("*` ").strip()
+    return candidate if candidate in valid_jobs else None
+
+
+class RecommendationTask:
+    """백그라운드에서 채워지는 추천 결과. 메인 스레드는 text()로 중간 결과를 읽습니다."""
+
+    def __init__(self, key):
+        self.key = key
+        self._chunks = []
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.started = time.monotonic()
+        self.finished = None
+
+    def append(self, chunk):
+        with self._lock:
+            self._chunks.append(chunk)
+
+    def finish(self, text=None):
+        if text is not None:
+            with self._lock:
+                self._chunks = [text]
+        self.finished = time.monotonic()
+        self._done.set()
+
+    def text(self):
+        with self._lock:
+            return "".join(self._chunks)
+
+    def done(self):
+        return self._done.is_set()
+
+    def elapsed(self):
+        """요청 후 완료까지(진행 중이면 지금까지) 걸린 초."""
+        return (self.finished or time.monotonic()) - self.started
+
+
+class RecommendationService:
+    """세션 간 공유되는 추천 실행기. 동일한 요청은 한 번만 호출합니다."""
+
+    def __init__(self, cache=None, max_workers=4):
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-recommend")
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, client, model, temp, max_tokens, profile_text, context_text):
+        if client is None: return None
+        key = make_cache_key(model, temp, max_tokens, profile_text, context_text)
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            task = RecommendationTask(key)
+            task.finish(cached)
+            return task
+        with self._lock:
+            task = self._in_flight.get(key)
+            if task is None:
+                task = RecommendationTask(key)
+                self._in_flight[key] = task
+                self._executor.submit(self._run, task, client, model, temp, max_tokens, profile_text, context_text)
+        return task
+
+    def _run(self, task, client, model, temp, max_tokens, profile_text, context_text):
+        try:
+            started = time.perf_counter()
+            tokens = 0
+            messages = build_recommendation_messages(profile_text, context_text)
+            with span("llm.recommend"):
+                try:
+                    stream = client.chat.completions.create(model=model, messages=messages, temperature=temp, max_tokens=max_tokens, stream=True)
+                except TypeError:
+                    # 스트리밍을 지원하지 않는 클라이언트는 전체 응답을 한 번에 받습니다.
+                    response = client.chat.completions.create(model=model, messages=messages, temperature=temp, max_tokens=max_tokens)
+                    content = response.choices[0].message.content
+                    tokens = getattr(getattr(response, "usage", None), "total_tokens", 0)
+                else:
+                    # 스트림을 읽는 중의 오류는 다시 요청하지 않고 아래에서 실패로 처리합니다.
+                    for chunk in stream:
+                        if not chunk.choices: continue
+                        delta = getattr(chunk.choices[0].delta, "content", None)
+                        if delta: task.append(delta)
+                        usage = getattr(getattr(chunk, "x_groq", None), "usage", None)
+                        if usage is not None: tokens = getattr(usage, "total_tokens", tokens)
+                    content = task.text()
+            if self.cache is not None and content:
+                self.cache.set(task.key, content, latency=time.perf_counter() - started, tokens=tokens)
+            task.finish(content)
+        except Exception as e:
+            print(f"[Error] AI 응답 실패: {str(e)}")
+            task.finish(AI_ERROR_MESSAGE)
+        finally:
+            with self._lock:
+                self._in_flight.pop(task.key, None)
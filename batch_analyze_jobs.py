@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+채용공고 일괄 AI 분석 스크립트
+
+data/rallit_*.csv의 공고를 조금씩 읽어(스트리밍) 스레드 풀로 Groq에 분석을 요청하고,
+구조화된 결과를 data/jd_analysis.db의 jd_analysis_results 테이블에 저장합니다.
+대시보드의 'AI 채용공고 분석' 탭은 이 테이블을 읽어 LLM을 다시 호출하지 않습니다.
+
+- 토큰 버킷으로 분당 요청 수를 제한하고, 429/5xx/네트워크 오류는 지수 백오프로 재시도합니다.
+- 결과는 건마다 저장되므로 중단 후 다시 실행하면 이미 성공한 공고(내용이 같은 경우)는 건너뜁니다.
+
+    GROQ_API_KEY=... python batch_analyze_jobs.py --rpm 30 --concurrency 4
+    python batch_analyze_jobs.py --offline --limit 20   # 로컬 대역 클라이언트로 실행
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from jd_analysis import (DEFAULT_RESULTS_DB, build_jd_messages, completed_hashes, connect_results, content_hash,
+                         parse_jd_analysis, posting_to_text, save_result)
+from posting_store import DEFAULT_CSV_PATTERN
+
+DEFAULT_MODEL = "llama3-70b-8192"
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷. acquire()는 토큰이 생길 때까지 기다립니다."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1.0):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_seconds = (tokens - self._tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+def network_errors():
+    """재시도할 연결·타임아웃 예외 클래스. groq가 설치되지 않았으면 대역 클라이언트의 예외만 씁니다."""
+    from groq_standin import StandInConnectionError
+    try:
+        from groq import APIConnectionError, APITimeoutError
+    except ImportError:
+        return (StandInConnectionError,)
+    return (APIConnectionError, APITimeoutError, StandInConnectionError)
+
+
+def is_retryable(error):
+    """408/409/429, 5xx 응답과 연결·타임아웃 오류만 재시도합니다. 그 밖의 예외(파싱 오류 등)는 바로 실패로 처리합니다."""
+    if isinstance(error, network_errors()):
+        return True
+    status = getattr(error, "status_code", None)
+    return isinstance(status, int) and (status in (408, 409, 429) or status >= 500)
+
+
+def call_with_retry(func, retries=5, base_delay=1.0, max_delay=60.0):
+    """func()를 실행하고 (결과, 시도 횟수)를 반환합니다. 재시도 간격은 지수 백오프 + 지터입니다."""
+    for attempt in range(1, retries + 2):
+        try:
+            return func(), attempt
+        except Exception as e:
+            if attempt > retries or not is_retryable(e):
+                e.attempts = attempt
+                raise
+            time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1))))
+
+
+def iter_postings(csv_pattern=DEFAULT_CSV_PATTERN, chunksize=200):
+    """CSV 파일들을 chunksize 행씩 읽어 url 기준으로 중복 없이 공고(dict)를 하나씩 내보냅니다."""
+    seen = set()
+    for path in sorted(glob.glob(csv_pattern)):
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            if "url" not in chunk.columns:
+                print(f"[Warning] url 컬럼이 없어 건너뜁니다: {path}")
+                break
+            for posting in chunk.to_dict("records"):
+                url = posting.get("url")
+                if pd.isna(url) or url in seen:
+                    continue
+                seen.add(url)
+                yield posting
+
+
+def analyze_posting(client, posting, model, temperature, max_tokens, bucket, retries):
+    text = posting_to_text(posting)
+    record = {"url": posting["url"], "content_hash": content_hash(text), "model": model,
+              "title": posting.get("title"), "companyName": posting.get("companyName")}
+
+    def request():
+        bucket.acquire()
+        return client.chat.completions.create(messages=build_jd_messages(text), model=model, temperature=temperature, max_tokens=max_tokens)
+
+    started = time.perf_counter()
+    try:
+        response, attempts = call_with_retry(request, retries=retries)
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}", attempts=getattr(e, "attempts", 1))
+    else:
+        content = response.choices[0].message.content
+        usage = getattr(response, "usage", None)
+        record.update(status="ok", raw_response=content, parsed=parse_jd_analysis(content), attempts=attempts,
+                      tokens=getattr(usage, "total_tokens", 0) or 0)
+    record["latency"] = time.perf_counter() - started
+    return record
+
+
+def run_batch(client, model=DEFAULT_MODEL, csv_pattern=DEFAULT_CSV_PATTERN, db_path=DEFAULT_RESULTS_DB, rpm=30,
+              concurrency=4, retries=5, temperature=0.2, max_tokens=1500, limit=None, force=False):
+    """공고를 분석해 저장하고 {"ok", "error", "skipped", "seconds"}를 반환합니다."""
+    conn = connect_results(db_path)
+    done = {} if force else completed_hashes(conn, model)
+    bucket = TokenBucket(rpm / 60.0, capacity=concurrency)  # 시작 시 동시 실행 수만큼만 한꺼번에 보냅니다.
+    report = {"ok": 0, "error": 0, "skipped": 0}
+    started = time.perf_counter()
+    pending = set()
+
+    def save(futures):
+        for future in futures:
+            pending.discard(future)
+            record = future.result()
+            save_result(conn, record)
+            conn.commit()
+            report[record["status"]] += 1
+            total = report["ok"] + report["error"]
+            if record["status"] == "error" or total % 10 == 0:
+                print(f"[{total}] {record['status']:5} {record.get('title')} ({record['attempts']}회 시도){' - ' + record['error'] if record.get('error') else ''}")
+
+    submitted = 0
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="jd-batch")
+    try:
+        for posting in iter_postings(csv_pattern):
+            if limit is not None and submitted >= limit:
+                break
+            if done.get(posting["url"]) == content_hash(posting_to_text(posting)):
+                report["skipped"] += 1
+                continue
+            # 대기 중인 작업은 동시 실행 수의 2배까지만 두어 메모리 사용을 제한합니다.
+            while len(pending) >= concurrency * 2:
+                save(wait(pending, return_when=FIRST_COMPLETED).done)
+            pending.add(executor.submit(analyze_posting, client, posting, model, temperature, max_tokens, bucket, retries))
+            submitted += 1
+            save([f for f in pending if f.done()])
+        while pending:
+            save(wait(pending, return_when=FIRST_COMPLETED).done)
+    except KeyboardInterrupt:
+        print("\n⏹️ 중단합니다. 완료된 결과는 저장되어 있으며, 다시 실행하면 이어서 분석합니다.")
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        conn.close()
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rallit 채용공고 일괄 AI 분석")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--csv-pattern", default=DEFAULT_CSV_PATTERN)
+    parser.add_argument("--db", default=DEFAULT_RESULTS_DB, help="결과를 저장할 SQLite 파일")
+    parser.add_argument("--rpm", type=int, default=30, help="분당 최대 요청 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수")
+    parser.add_argument("--retries", type=int, default=5, help="요청당 최대 재시도 횟수")
+    parser.add_argument("--temperature", type=float, default=0.2)
+    parser.add_argument("--max-tokens", type=int, default=1500)
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 분석할 최대 공고 수")
+    parser.add_argument("--force", action="store_true", help="이미 분석된 공고도 다시 분석")
+    parser.add_argument("--offline", action="store_true", help="Groq 대신 로컬 대역 클라이언트 사용")
+    parser.add_argument("--offline-latency", type=float, default=0.05, help=argparse.SUPPRESS)
+    parser.add_argument("--offline-failure-rate", type=float, default=0.0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.offline:
+        from groq_standin import StandInGroqClient
+        client = StandInGroqClient(latency=args.offline_latency, failure_rate=args.offline_failure_rate)
+    else:
+        api_key = os.environ.get("GROQ_API_KEY")
+        if not api_key:
+            print("❌ GROQ_API_KEY 환경 변수를 설정하거나 --offline으로 실행해주세요.")
+            sys.exit(1)
+        from groq import Groq
+        client = Groq(api_key=api_key)
+
+    print(f"🚀 채용공고 분석 시작 (모델 {args.model}, 분당 {args.rpm}회, 동시 {args.concurrency}개)")
+    try:
+        report = run_batch(client, model=args.model, csv_pattern=args.csv_pattern, db_path=args.db, rpm=args.rpm,
+                           concurrency=args.concurrency, retries=args.retries, temperature=args.temperature,
+                           max_tokens=args.max_tokens, limit=args.limit, force=args.force)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    print(f"✅ 성공 {report['ok']}건, 실패 {report['error']}건, 건너뜀 {report['skipped']}건 ({report['seconds']:.1f}초) -> {args.db}")
+
+
+if __name__ == "__main__":
+    main()
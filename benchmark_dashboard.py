@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Job-Fit Insight Dashboard 성능/부하 측정 스크립트
+
+무거운 모듈의 콜드 임포트 시간과, Streamlit AppTest로 대시보드를 헤드리스 실행했을 때의
+첫 실행(콜드 스타트), 위젯 조작별 재실행 시간, 최대 메모리(RSS), 캐시 적중률, 동시 세션 처리 시간을 측정합니다.
+
+- 데이터는 data/의 Rallit CSV와 KOSIS 통계표를 배수(--scales)만큼 복제한 합성 작업 폴더에서 읽습니다.
+  작업 폴더는 한 번 만들면 재사용하며, DB 구성(setup_database)과 공고 저장소 적재까지 미리 끝내 둡니다.
+- Groq는 groq_standin의 대역 클라이언트로 바꿔 실제 API 호출 없이 AI 경로까지 실행합니다.
+- 각 배수는 새 파이썬 프로세스에서 측정되므로 이전 실행의 캐시가 섞이지 않습니다.
+- --baseline으로 이전 JSON 결과를 주면 허용 범위(--tolerance)를 넘게 느려진 항목을 보고하고 종료 코드 2로 끝납니다.
+
+    python benchmark_dashboard.py
+    python benchmark_dashboard.py --scales 1,10,100 --sessions 8 --output bench.json
+    python benchmark_dashboard.py --scales 1,10 --baseline bench.json --tolerance 0.2
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+HEAVY_MODULES = ["streamlit", "pandas", "plotly.express", "groq", "wordcloud", "matplotlib.pyplot"]
+
+# (이름, 위젯 key, 번갈아 설정할 값 목록) - 값이 None이면 현재 위젯의 선택지를 사용합니다.
+RERUN_SCENARIOS = [
+    ("관심 직무 변경", "interest_job", None),
+    ("희망 경력 변경", "career_level", None),
+    ("기술스택 직무 변경", "skill_job", None),
+    ("경력분포 직무 변경", "pie_job", None),
+    ("조회 월 변경", "selected_month_v4", None),
+]
+
+KOSIS_EMPLOYMENT_PREFIX = "성_연령별_경제활동인구_"
+# 측정 전에 지우는 실행 산출물 (응답·워드클라우드 캐시가 남아 있으면 콜드 스타트가 아니게 됩니다)
+RUNTIME_ARTIFACTS = ["llm_cache.db*", "jd_analysis.db*", "metrics.*", "wordcloud_cache"]
+WORKSPACE_MARKER = ".bench_ready"
+# 이보다 작은 차이는 측정 잡음으로 보고 회귀로 판정하지 않습니다.
+MIN_REGRESSION_DELTA_MS = 5.0
+MIN_REGRESSION_DELTA_MB = 10.0
+
+
+def measure_cold_import(module):
+    code = f"import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1]) * 1000
+
+
+# --- 합성 데이터 작업 폴더 ---
+def _source_fingerprint(data_dir):
+    return sorted((p.name, p.stat().st_size) for p in Path(data_dir).iterdir() if p.suffix in (".csv", ".xlsx"))
+
+
+def scale_rallit_csv(src, dst, scale):
+    """공고를 scale배로 복제합니다. url과 id는 복제본마다 달라져 중복 제거에 걸리지 않습니다."""
+    import pandas as pd
+
+    df = pd.read_csv(src, dtype=str)
+    copies = []
+    for k in range(scale):
+        copy = df.copy()
+        if k:
+            if "url" in copy.columns:
+                copy["url"] = copy["url"] + f"?copy={k}"
+            if "id" in copy.columns:
+                copy["id"] = copy["id"] + f"{k:04d}"
+        copies.append(copy)
+    scaled = pd.concat(copies, ignore_index=True)
+    scaled.to_csv(dst, index=False)
+    return len(scaled)
+
+
+def scale_kosis_workbook(src, dst, scale):
+    """헤더 두 줄은 그대로 두고 본문(성별 × 연령계층 블록)을 scale배로 복제합니다. 복제본의 연령계층 이름에는 번호를 붙입니다."""
+    import pandas as pd
+
+    raw = pd.read_excel(src, header=None, dtype=object)
+    header, body = raw.iloc[:2], raw.iloc[2:]
+    copies = [header]
+    for k in range(scale):
+        copy = body.copy()
+        if k:
+            copy.iloc[:, 1] = copy.iloc[:, 1].astype(str) + f" #{k}"
+        copies.append(copy)
+    scaled = pd.concat(copies, ignore_index=True)
+    scaled.to_excel(dst, header=False, index=False)
+    return len(scaled) - len(header)
+
+
+def prepare_workspace(scale, root, rebuild=False):
+    """scale배 합성 데이터로 DB까지 구성된 작업 폴더를 만들고 (경로, 데이터 규모)를 반환합니다."""
+    source_dir = REPO_DIR / "data"
+    workspace = Path(root) / f"scale_{scale}"
+    marker = workspace / WORKSPACE_MARKER
+    fingerprint = _source_fingerprint(source_dir)
+    if not rebuild and marker.exists():
+        saved = json.loads(marker.read_text(encoding="utf-8"))
+        if saved.get("fingerprint") == [list(f) for f in fingerprint]:
+            return workspace, saved["dataset"]
+
+    print(f"🧪 {scale}배 합성 데이터 생성 중: {workspace}", file=sys.stderr)
+    started = time.perf_counter()
+    shutil.rmtree(workspace, ignore_errors=True)
+    data_dir = workspace / "data"
+    data_dir.mkdir(parents=True)
+    dataset = {"postings": 0, "kosis_rows": 0}
+    for path in sorted(source_dir.glob("rallit_*.csv")):
+        dataset["postings"] += scale_rallit_csv(path, data_dir / path.name, scale)
+    for path in sorted(source_dir.glob("*.xlsx")):
+        if path.name.startswith(KOSIS_EMPLOYMENT_PREFIX):
+            dataset["kosis_rows"] += scale_kosis_workbook(path, data_dir / path.name, scale)
+        else:
+            shutil.copy2(path, data_dir / path.name)  # 대시보드가 읽지 않는 통계표는 원본 그대로 둡니다.
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_DIR), os.environ.get("PYTHONPATH")]))}
+    setup = "import setup_database, posting_store; setup_database.create_db_and_tables(); posting_store.sync_postings()"
+    result = subprocess.run([sys.executable, "-c", setup], cwd=workspace, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"합성 DB 구성 실패 ({scale}배):\n{result.stderr}")
+    dataset["setup_seconds"] = round(time.perf_counter() - started, 2)
+    marker.write_text(json.dumps({"fingerprint": fingerprint, "dataset": dataset}, ensure_ascii=False), encoding="utf-8")
+    return workspace, dataset
+
+
+def write_bench_secrets(workspace):
+    secrets = Path(workspace) / ".streamlit" / "secrets.toml"
+    secrets.parent.mkdir(exist_ok=True)
+    secrets.write_text('GROQ_API_KEY = "benchmark"  # 대역 클라이언트를 쓰므로 실제 키가 아닙니다.\n', encoding="utf-8")
+
+
+def clear_runtime_artifacts(workspace):
+    for pattern in RUNTIME_ARTIFACTS:
+        for path in (Path(workspace) / "data").glob(pattern):
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+
+# --- 자식 프로세스: AppTest 측정 ---
+def install_stub_groq(latency):
+    """import groq가 groq_standin 대역 클라이언트를 돌려주도록 합니다."""
+    from groq_standin import StandInGroqClient
+
+    module = types.ModuleType("groq")
+    module.Groq = lambda api_key=None, **kwargs: StandInGroqClient(latency=latency)
+    sys.modules["groq"] = module
+
+
+def share_script_cache():
+    """
+    AppTest는 실행마다 ScriptCache를 새로 만들어 스크립트를 다시 컴파일합니다. 여러 스레드가 동시에 컴파일하면
+    파이썬 3.11의 AST 생성이 충돌하므로, 실제 서버처럼 프로세스 하나가 캐시 하나를 공유하게 합니다.
+    """
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test
+
+    shared = ScriptCache()
+    if hasattr(app_test, "ScriptCache"):
+        app_test.ScriptCache = lambda: shared
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _find_widget(at, key):
+    try:
+        return at.selectbox(key=key)
+    except KeyError:
+        return None
+
+
+def _new_app(script):
+    from streamlit.testing.v1 import AppTest
+
+    # API 키는 작업 폴더의 .streamlit/secrets.toml에서 읽습니다. at.secrets는 실행마다 전역 st.secrets를
+    # 바꿨다 되돌리므로 동시 세션에서 쓰면 서로 덮어씁니다.
+    return AppTest.from_file(script, default_timeout=120)
+
+
+def _timed_run(at):
+    started = time.perf_counter()
+    at.run()
+    return (time.perf_counter() - started) * 1000
+
+
+def run_scenarios(at, repeat, offset=0):
+    """시나리오마다 위젯 값을 바꿔 가며 repeat번 재실행하고 ({시나리오: [ms...]}, 오류 목록)을 반환합니다."""
+    reruns, errors = {}, []
+    for label, key, values in RERUN_SCENARIOS:
+        widget = _find_widget(at, key)
+        if widget is None:
+            continue
+        options = values or list(widget.options)
+        timings = []
+        for i in range(repeat):
+            widget = _find_widget(at, key)
+            if widget is None:
+                errors.append(f"위젯을 찾을 수 없습니다: {key}")
+                break
+            widget.set_value(options[(offset + i + 1) % len(options)])
+            timings.append(_timed_run(at))
+        reruns[label] = timings
+        errors.extend(e.message for e in at.exception)
+    return reruns, errors
+
+
+def run_concurrent_sessions(script, sessions, repeat):
+    """sessions개 세션을 스레드로 동시에 실행합니다. 캐시는 실제 서버처럼 프로세스 안에서 공유됩니다."""
+    timings, errors, lock = [], [], threading.Lock()
+
+    def session(index):
+        try:
+            at = _new_app(script)
+            first = _timed_run(at)
+            reruns, session_errors = run_scenarios(at, repeat, offset=index)
+            session_errors = [e.message for e in at.exception] + session_errors
+        except Exception as e:
+            first, reruns, session_errors = None, {}, [f"{type(e).__name__}: {e}"]
+        with lock:
+            timings.extend(t for values in reruns.values() for t in values)
+            if first is not None:
+                timings.append(first)
+            errors.extend(session_errors)
+
+    threads = [threading.Thread(target=session, args=(i,), name=f"bench-session-{i}") for i in range(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ordered = sorted(timings)
+    return {"count": sessions, "wall_ms": (time.perf_counter() - started) * 1000, "runs": len(ordered),
+            "p50_ms": _quantile(ordered, 0.5), "p95_ms": _quantile(ordered, 0.95), "errors": errors}
+
+
+def _quantile(sorted_values, q):
+    from instrumentation import percentile
+
+    return percentile(sorted_values, q)
+
+
+def run_app_benchmark(script, repeat, sessions, llm_latency):
+    """(자식 프로세스에서 실행) 콜드 스타트, 재실행 시간, 최대 RSS, 캐시 지표, 동시 세션 결과를 반환합니다."""
+    install_stub_groq(llm_latency)
+    share_script_cache()
+    from instrumentation import default_metrics
+
+    at = _new_app(script)
+    cold_start_ms = _timed_run(at)
+    errors = [e.message for e in at.exception]
+    reruns = {"재실행 (변경 없음)": [_timed_run(at)]}
+    scenario_reruns, scenario_errors = run_scenarios(at, repeat)
+    reruns.update(scenario_reruns)
+    errors.extend(scenario_errors)
+    single_rss = peak_rss_mb()
+
+    concurrency = run_concurrent_sessions(script, sessions, repeat) if sessions > 1 else None
+    summary = default_metrics().summary()
+    stages = {stage: {"count": s["count"], "p50_ms": s["p50_ms"], "p95_ms": s["p95_ms"]} for stage, s in summary["stages"].items()}
+    return {"cold_start_ms": cold_start_ms, "reruns_ms": reruns, "peak_rss_mb": single_rss,
+            "peak_rss_sessions_mb": peak_rss_mb() if concurrency else None, "cache": summary["gauges"],
+            "stages": stages, "sessions": concurrency, "errors": errors}
+
+
+# --- 회귀 비교 ---
+def comparable_metrics(result):
+    """{지표 이름: (값, 단위)} - 기준 결과와 비교할 값들입니다."""
+    values = {"cold_start_ms": (result["cold_start_ms"], "ms")}
+    for label, timings in result["reruns_ms"].items():
+        values[f"rerun[{label}].p50_ms"] = (statistics.median(timings), "ms")
+    if result.get("sessions"):
+        values["sessions.p95_ms"] = (result["sessions"]["p95_ms"], "ms")
+    if result.get("peak_rss_mb") is not None:
+        values["peak_rss_mb"] = (result["peak_rss_mb"], "mb")
+    return values
+
+
+def find_regressions(report, baseline, tolerance):
+    regressions = []
+    previous = {entry["scale"]: entry for entry in baseline.get("scales", [])}
+    for entry in report["scales"]:
+        old = previous.get(entry["scale"])
+        if old is None:
+            continue
+        old_values = comparable_metrics(old)
+        for name, (value, unit) in comparable_metrics(entry).items():
+            if name not in old_values:
+                continue
+            base = old_values[name][0]
+            floor = MIN_REGRESSION_DELTA_MB if unit == "mb" else MIN_REGRESSION_DELTA_MS
+            if value > base * (1 + tolerance) and value - base > floor:
+                regressions.append({"scale": entry["scale"], "metric": name, "baseline": base, "current": value,
+                                    "change": value / base - 1 if base else None})
+    return regressions
+
+
+def print_report(report):
+    print(f"📦 모듈 콜드 임포트 ({report['script']})")
+    for module, ms in report["cold_import_ms"].items():
+        print(f"  {module:<20} {'설치 안 됨' if ms is None else f'{ms:8.1f} ms'}")
+    for entry in report["scales"]:
+        dataset = entry["dataset"]
+        print(f"\n📊 {entry['scale']}배 (공고 {dataset['postings']:,}건, KOSIS {dataset['kosis_rows']:,}행)")
+        print(f"🚀 콜드 스타트 (첫 실행): {entry['cold_start_ms']:.1f} ms")
+        print("🔁 재실행 (중앙값 / 최대)")
+        for label, timings in entry["reruns_ms"].items():
+            print(f"  {label:<16} {statistics.median(timings):8.1f} ms / {max(timings):8.1f} ms")
+        if entry["peak_rss_mb"] is not None:
+            print(f"🧠 최대 RSS: {entry['peak_rss_mb']:.0f} MB" + (f" (동시 세션 후 {entry['peak_rss_sessions_mb']:.0f} MB)" if entry["peak_rss_sessions_mb"] else ""))
+        if entry["cache"]:
+            print("🗃️ 캐시 적중률: " + ", ".join(f"{name.removesuffix('.hit_ratio')} {value:.0%}" for name, value in sorted(entry["cache"].items()) if name.endswith(".hit_ratio")))
+        sessions = entry["sessions"]
+        if sessions:
+            print(f"👥 동시 세션 {sessions['count']}개: 전체 {sessions['wall_ms']:.0f} ms, 실행 {sessions['runs']}회 p50 {sessions['p50_ms']:.1f} ms / p95 {sessions['p95_ms']:.1f} ms")
+        errors = entry["errors"] + (sessions["errors"] if sessions else [])
+        if errors:
+            print("⚠️ 실행 중 오류:", *sorted(set(errors)), sep="\n  ")
+    if "regressions" in report:
+        if report["regressions"]:
+            print("\n❌ 기준 대비 성능 저하:")
+            for r in report["regressions"]:
+                print(f"  {r['scale']}배 {r['metric']}: {r['baseline']:.1f} -> {r['current']:.1f}" + (f" ({r['change']:+.0%})" if r["change"] is not None else ""))
+        else:
+            print("\n✅ 기준 대비 성능 저하 없음")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 콜드 스타트/재실행/부하 측정")
+    parser.add_argument("--script", default=str(REPO_DIR / "job_fit_dashboard.py"), help="측정할 Streamlit 스크립트")
+    parser.add_argument("--repeat", type=int, default=5, help="시나리오별 재실행 횟수")
+    parser.add_argument("--scales", default="1", help="합성 데이터 배수 목록 (예: 1,10,100,1000)")
+    parser.add_argument("--sessions", type=int, default=4, help="동시에 실행할 세션 수 (1이면 생략)")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="대역 Groq 클라이언트의 응답 지연(초)")
+    parser.add_argument("--workdir", default=str(Path(tempfile.gettempdir()) / "jobfit_bench"), help="합성 데이터 작업 폴더")
+    parser.add_argument("--rebuild", action="store_true", help="합성 데이터를 다시 생성")
+    parser.add_argument("--baseline", help="비교할 이전 JSON 결과")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 보지 않는 최대 증가 비율")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_app_benchmark(args.script, args.repeat, args.sessions, args.llm_latency), ensure_ascii=False))
+        return
+
+    script = str(Path(args.script).resolve())
+    report = {"script": args.script, "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+              "cold_import_ms": {module: measure_cold_import(module) for module in HEAVY_MODULES}, "scales": []}
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_DIR), os.environ.get("PYTHONPATH")]))}
+    for scale in (int(s) for s in args.scales.split(",") if s.strip()):
+        workspace, dataset = prepare_workspace(scale, args.workdir, args.rebuild)
+        clear_runtime_artifacts(workspace)
+        write_bench_secrets(workspace)
+        child = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--child", "--script", script, "--repeat", str(args.repeat),
+                                "--sessions", str(args.sessions), "--llm-latency", str(args.llm_latency)],
+                               capture_output=True, text=True, cwd=workspace, env=env)
+        if child.returncode != 0:
+            print(child.stderr)
+            sys.exit(1)
+        report["scales"].append({"scale": scale, "dataset": dataset, **json.loads(child.stdout.strip().splitlines()[-1])})
+
+    if args.baseline:
+        report["regressions"] = find_regressions(report, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.tolerance)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    if report.get("regressions"):
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+AI 커리어 상담 대화 관리 모듈
+
+세션마다 최근 메시지만 원문으로 보관하고, 오래된 메시지는 한 줄 요약으로 접어 메모리와 재렌더링 비용을 제한합니다.
+API에는 토큰 예산 안에 드는 최근 대화와 요약만 보냅니다. 응답은 스트리밍으로 받아 도착하는 대로 화면에 표시하며,
+이전 대화 없이 받은 답변은 (프로필, 정규화된 질문) 단위로 공유 응답 캐시에 저장해 같은 질문에 재사용합니다.
+"""
+import re
+import time
+
+from context_builder import estimate_tokens
+from response_cache import make_cache_key
+
+CHAT_SYSTEM_PROMPT = "You are a friendly and insightful career counselor. Your primary language for all responses is Korean."
+CHAT_GREETING = "안녕하세요! 프로필을 바탕으로 커리어에 대해 무엇이든 물어보세요."
+SUMMARY_LINE_CHARS = 80
+
+
+def normalize_question(question):
+    """대소문자·공백·끝 문장부호 차이를 없앤 질문. FAQ 캐시 키에 씁니다."""
+    return re.sub(r"\s+", " ", question).strip().rstrip("?!.？！。 ").casefold()
+
+
+def chat_cache_key(model, temperature, max_tokens, profile_text, question):
+    return make_cache_key(model, temperature, max_tokens, profile_text, "chat:" + normalize_question(question))
+
+
+def _first_sentence(text):
+    text = re.sub(r"[#*`>|]+", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    sentence = re.split(r"(?<=[.?!다요])\s", text, maxsplit=1)[0]
+    return sentence if len(sentence) <= SUMMARY_LINE_CHARS else sentence[:SUMMARY_LINE_CHARS - 1] + "…"
+
+
+class ChatHistory:
+    """최근 max_messages개 메시지와 그 이전 대화의 요약을 보관합니다. st.session_state에 넣어 씁니다."""
+
+    def __init__(self, max_messages=20, window_tokens=1500, summary_tokens=300):
+        self.max_messages = max_messages
+        self.window_tokens = window_tokens
+        self.summary_tokens = summary_tokens
+        self.messages = []
+        self.summary_lines = []
+        self.folded = 0
+
+    def append(self, role, content):
+        self.messages.append({"role": role, "content": content})
+        while len(self.messages) > self.max_messages:
+            self._fold(self.messages.pop(0))
+
+    def _fold(self, message):
+        prefix = "Q" if message["role"] == "user" else "A"
+        self.summary_lines.append(f"{prefix}: {_first_sentence(message['content'])}")
+        self.folded += 1
+        while len(self.summary_lines) > 1 and estimate_tokens("\n".join(self.summary_lines)) > self.summary_tokens:
+            self.summary_lines.pop(0)
+
+    @property
+    def summary(self):
+        return "\n".join(self.summary_lines)
+
+    def api_messages(self, user_content, system_prompt=CHAT_SYSTEM_PROMPT):
+        """system + (요약) + 토큰 예산 안의 최근 메시지 + 새 질문 순서의 API 메시지 목록을 만듭니다."""
+        recent, used = [], estimate_tokens(user_content)
+        for message in reversed(self.messages):
+            cost = estimate_tokens(message["content"])
+            if used + cost > self.window_tokens:
+                break
+            recent.append(message)
+            used += cost
+        messages = [{"role": "system", "content": system_prompt}]
+        if self.summary_lines:
+            messages.append({"role": "system", "content": "이전 대화 요약:\n" + self.summary})
+        messages.extend(reversed(recent))
+        messages.append({"role": "user", "content": user_content})
+        return messages
+
+
+def stream_chat_completion(client, messages, model, temperature, max_tokens, on_finish=None):
+    """응답 텍스트 조각을 도착하는 대로 내보내는 제너레이터. 끝나면 on_finish(전체 텍스트, 지연 시간, 토큰 수)를 호출합니다."""
+    started = time.perf_counter()
+    chunks, tokens = [], 0
+    try:
+        stream = client.chat.completions.create(messages=messages, model=model, temperature=temperature, max_tokens=max_tokens, stream=True)
+    except TypeError:
+        # 스트리밍을 지원하지 않는 클라이언트는 전체 응답을 한 번에 받습니다.
+        response = client.chat.completions.create(messages=messages, model=model, temperature=temperature, max_tokens=max_tokens)
+        chunks.append(response.choices[0].message.content or "")
+        tokens = getattr(getattr(response, "usage", None), "total_tokens", 0)
+        yield chunks[0]
+    else:
+        for chunk in stream:
+            if not chunk.choices: continue
+            delta = getattr(chunk.choices[0].delta, "content", None)
+            if delta:
+                chunks.append(delta)
+                yield delta
+            usage = getattr(getattr(chunk, "x_groq", None), "usage", None)
+            if usage is not None: tokens = getattr(usage, "total_tokens", tokens)
+    if on_finish is not None:
+        on_finish("".join(chunks), time.perf_counter() - started, tokens)
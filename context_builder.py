@@ -0,0 +1,105 @@
+"""
+AI 분석용 시장 데이터 컨텍스트 생성기
+
+(관심 직무, 희망 경력, 토큰 예산, 데이터 버전)마다 프롬프트에 넣을 마크다운을 한 번만 만들고
+크기가 제한된 LRU 캐시에 보관합니다. 토큰 수는 토크나이저 없이 문자 종류로 어림하며,
+예산 안에서 기술스택 → 경력 분포 → 채용 공고 순으로 채우되, 공고는 앞에서부터 자르지 않고
+공고 색인의 관련도 순위(BM25 + 주요 기술스택 가산점)대로 고릅니다.
+"""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from posting_index import rank_postings, skill_weights
+
+DEFAULT_CONTEXT_TOKEN_BUDGET = 800
+EMPTY_CONTEXT = "분석할 시장 데이터가 부족합니다."
+POSTING_COLUMNS = ["title", "companyName", "jobLevels"]
+
+
+def estimate_tokens(text):
+    """토큰 수 어림값. 영문·숫자·기호는 4글자에 1토큰, 한글 등 비ASCII 문자는 1글자에 1토큰으로 셉니다."""
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _cell(value):
+    return "" if value is None or value is pd.NA or (isinstance(value, float) and pd.isna(value)) else str(value).replace("|", "/").replace("\n", " ")
+
+
+def markdown_table(columns, rows):
+    """tabulate 없이 파이프 형식 마크다운 표를 만듭니다."""
+    lines = ["| " + " | ".join(columns) + " |", "|" + "|".join(":---" for _ in columns) + "|"]
+    lines.extend("| " + " | ".join(_cell(v) for v in row) + " |" for row in rows)
+    return "\n".join(lines)
+
+
+class ContextBuilder:
+    def __init__(self, queries, max_entries=256, token_budget=DEFAULT_CONTEXT_TOKEN_BUDGET, max_postings=10):
+        self._queries = queries
+        self.max_entries = max_entries
+        self.token_budget = token_budget
+        self.max_postings = max_postings
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.last_tokens = 0
+
+    def build(self, rallit_df, posting_index, interest_job, career_level, token_budget=None):
+        """컨텍스트 마크다운을 반환합니다. 같은 조건·같은 데이터 버전이면 저장된 문자열을 그대로 돌려줍니다."""
+        token_budget = token_budget or self.token_budget
+        key = (interest_job, career_level, token_budget, self._queries.data_version(), posting_index.get("version"))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                self.last_tokens = cached[1]
+                return cached[0]
+            self.misses += 1
+        text = self._render(rallit_df, posting_index, interest_job, career_level, token_budget)
+        tokens = estimate_tokens(text)
+        with self._lock:
+            self._cache[key] = (text, tokens)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            self.last_tokens = tokens
+        return text
+
+    def _render(self, rallit_df, posting_index, interest_job, career_level, token_budget):
+        sections, remaining = [], token_budget
+
+        def add_table(title, columns, rows):
+            # 표 전체가 예산을 넘으면 들어가는 행까지만 넣습니다.
+            nonlocal remaining
+            header = f"### [{title}]\n"
+            kept = []
+            cost = estimate_tokens(header + markdown_table(columns, []))
+            for row in rows:
+                row_cost = estimate_tokens(markdown_table(columns, [row]).rsplit("\n", 1)[-1]) + 1
+                if cost + row_cost > remaining:
+                    break
+                kept.append(row)
+                cost += row_cost
+            if kept:
+                sections.append(header + markdown_table(columns, kept) + "\n\n")
+                remaining -= cost
+
+        skills_info = self._queries.skills_for_job(interest_job)
+        if not skills_info.empty:
+            add_table(f"{interest_job} 직무 시장의 주요 기술스택", ["기술스택", "빈도"], skills_info[["기술스택", "빈도"]].itertuples(index=False, name=None))
+        levels_info = self._queries.levels_for_job(interest_job)
+        if not levels_info.empty:
+            add_table(f"{interest_job} 직무 시장의 경력 레벨 분포", ["jobLevels", "공고수"], levels_info[["jobLevels", "공고수"]].itertuples(index=False, name=None))
+        if rallit_df is not None and all(col in rallit_df.columns for col in POSTING_COLUMNS):
+            row_ids = rank_postings(posting_index, interest_job, career_level, skill_weights(skills_info), self.max_postings)
+            add_table("현재 조건에 맞는 채용 공고 예시", POSTING_COLUMNS, rallit_df[POSTING_COLUMNS].iloc[row_ids].itertuples(index=False, name=None))
+        return "".join(sections) if sections else EMPTY_CONTEXT
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache),
+                    "hit_ratio": self.hits / total if total else 0.0, "last_tokens": self.last_tokens}
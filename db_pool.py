@@ -0,0 +1,137 @@
+"""
+SQLite 연결 풀
+
+Streamlit 세션마다 스레드가 다르므로, 연결 하나를 모두가 공유하는 대신 읽기 전용 연결 여러 개를
+대여/반납 방식으로 나눠 씁니다. WAL 모드의 DB에서는 읽기끼리 서로 막지 않으며,
+대여 대기 시간을 기록해 풀 크기가 충분한지 확인할 수 있습니다.
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024  # 256MB
+DEFAULT_CACHE_SIZE_KIB = 32 * 1024     # 연결당 32MB 페이지 캐시
+
+
+def enable_wal(conn):
+    """쓰기 가능한 연결에서 WAL 저널 모드를 켭니다. 설정은 DB 파일에 유지됩니다."""
+    return conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+
+
+class ConnectionPool:
+    def __init__(self, db_path, size=DEFAULT_POOL_SIZE, read_only=True, timeout=30.0,
+                 mmap_size=DEFAULT_MMAP_SIZE, cache_size_kib=DEFAULT_CACHE_SIZE_KIB, wait_samples=1000):
+        self.db_path = Path(db_path).resolve()
+        self.size = size
+        self.read_only = read_only
+        self.timeout = timeout
+        self.mmap_size = mmap_size
+        self.cache_size_kib = cache_size_kib
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=wait_samples)
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._in_use = 0
+        self._closed = False
+
+    def _connect(self):
+        mode = "ro" if self.read_only else "rw"
+        conn = sqlite3.connect(f"{self.db_path.as_uri()}?mode={mode}", uri=True, check_same_thread=False, timeout=self.timeout)
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if self.read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"{self.timeout}초 동안 사용 가능한 DB 연결이 없습니다 (풀 크기 {self.size}).")
+
+    @contextmanager
+    def connection(self):
+        started = time.perf_counter()
+        conn = self._acquire()
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            self._waits.append(waited)
+            self._in_use += 1
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                if not self._closed:
+                    self._idle.put_nowait(conn)
+                    conn = None
+            if conn is not None:  # 풀을 닫을 때 대여 중이던 연결은 반납할 때 닫습니다.
+                conn.close()
+
+    def data_version(self):
+        """DB와 WAL 파일의 (수정 시각, 크기). 다른 프로세스가 DB를 갱신하면 값이 바뀝니다."""
+        version = []
+        for suffix in ("", "-wal"):
+            try:
+                stat = os.stat(f"{self.db_path}{suffix}")
+                version.extend([stat.st_mtime_ns, stat.st_size])
+            except FileNotFoundError:
+                version.extend([0, 0])
+        return tuple(version)
+
+    def journal_mode(self):
+        with self.connection() as conn:
+            return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    def stats(self):
+        with self._lock:
+            waits = sorted(self._waits)
+            stats = {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "checkouts": self._checkouts,
+                "avg_wait_ms": (self._total_wait / self._checkouts * 1000) if self._checkouts else 0.0,
+                "max_wait_ms": self._max_wait * 1000,
+            }
+        stats["p95_wait_ms"] = waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000 if waits else 0.0
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
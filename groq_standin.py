@@ -0,0 +1,72 @@
+"""
+로컬 Groq 대역 클라이언트
+
+API 키나 네트워크 없이 배치 스크립트와 대시보드를 실행해 볼 수 있도록 groq.Groq의
+client.chat.completions.create(...) 인터페이스를 흉내 냅니다. 지연 시간, 실패율(429 흉내),
+스트리밍을 지원하며 응답은 프롬프트에서 읽은 정보로 만든 고정 형식의 한국어 텍스트입니다.
+"""
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+
+class StandInRateLimitError(Exception):
+    status_code = 429
+
+
+class StandInConnectionError(Exception):
+    """groq.APIConnectionError 대역. 상태 코드 없이 연결이 끊긴 경우를 흉내 냅니다."""
+
+
+def _reply_for(messages):
+    prompt = messages[-1]["content"] if messages else ""
+    if "채용공고" in prompt:
+        skills = re.search(r"기술 키워드:\s*(.+)", prompt)
+        level = re.search(r"경력:\s*(.+)", prompt)
+        title = re.search(r"공고명:\s*(.+)", prompt)
+        role = title.group(1).strip() if title else "해당 직무"
+        return (
+            f"### 📝 핵심 요약 (3가지)\n- {role} 업무 수행\n- 유관 부서와 협업\n- 서비스 품질 개선\n\n"
+            f"### 🛠️ 요구 기술 스택\n- {skills.group(1).strip() if skills else '협업 도구'}\n\n"
+            f"### 📈 예상 경력 수준\n- {level.group(1).strip() if level else '경력 무관'}\n\n"
+            "### 🗣️ 면접 예상 질문 (3가지)\n1. 최근 프로젝트에서 맡은 역할은?\n2. 가장 어려웠던 문제와 해결 과정은?\n3. 선호하는 협업 방식은?"
+        )
+    if "추천 직무" in prompt:
+        return "- **추천 직무:** 백엔드\n- **추천 사유:** 로컬 대역 클라이언트의 고정 응답입니다."
+    return "로컬 대역 클라이언트의 응답입니다."
+
+
+class _Completions:
+    def __init__(self, owner):
+        self._owner = owner
+
+    def create(self, messages, model=None, temperature=None, max_tokens=None, stream=False, **kwargs):
+        owner = self._owner
+        with owner._lock:
+            owner.calls += 1
+            fail = owner._random.random() < owner.failure_rate
+        time.sleep(owner.latency)
+        if fail:
+            raise StandInRateLimitError("rate limit exceeded (stand-in)")
+        content = _reply_for(messages)
+        tokens = len(content) // 2
+        if stream:
+            return (SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))]) for piece in re.findall(r".{1,16}", content, flags=re.S))
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=0, completion_tokens=tokens, total_tokens=tokens),
+        )
+
+
+class StandInGroqClient:
+    """groq.Groq 대역. latency초 대기 후 응답하며, failure_rate 확률로 429 오류를 냅니다."""
+
+    def __init__(self, latency=0.05, failure_rate=0.0, seed=None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self.chat = SimpleNamespace(completions=_Completions(self))
@@ -0,0 +1,229 @@
+"""
+성능 계측 모듈
+
+대시보드의 주요 단계(데이터 로딩, 컨텍스트 생성, LLM 호출, 점수 계산, 그래프 생성 등)를 span()/timed()로 감싸
+소요 시간을 기록합니다. 단계별 최근 측정값은 메모리에 보관해 p50/p95를 바로 계산하고, 백그라운드 스레드가
+주기적으로 SQLite(data/metrics.db)에 쌓고 오래된 행을 정리하며 Prometheus 텍스트 파일(data/metrics.prom)로도 내보냅니다.
+run_dashboard.py --workers로 띄운 워커는 JOBFIT_WORKER 환경 변수의 번호로 data/metrics.<번호>.prom에 따로 쓰고,
+모든 지표에 worker 레이블을 붙입니다.
+Streamlit은 세션마다 스크립트를 별도 스레드에서 실행하므로, 재실행 단위의 기록은 스레드별로 모읍니다.
+"""
+import functools
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_METRICS_DB = "data/metrics.db"
+DEFAULT_PROMETHEUS_PATH = "data/metrics.prom"
+WORKER_ENV = "JOBFIT_WORKER"
+
+
+def percentile(sorted_values, q):
+    """정렬된 값의 q 분위수(최근접 순위). 값이 없으면 0입니다."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def _prom_name(name):
+    return "jobfit_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def prometheus_path_for(worker):
+    """워커마다 다른 Prometheus 파일 경로. 워커 번호가 없으면(단일 프로세스) 기본 경로입니다."""
+    if worker is None:
+        return DEFAULT_PROMETHEUS_PATH
+    path = Path(DEFAULT_PROMETHEUS_PATH)
+    return str(path.with_name(f"{path.stem}.{worker}{path.suffix}"))
+
+
+class Metrics:
+    def __init__(self, db_path=DEFAULT_METRICS_DB, prometheus_path=DEFAULT_PROMETHEUS_PATH, samples_per_stage=1000,
+                 retention_seconds=7 * 24 * 3600, max_rows=200_000, flush_interval=10.0, worker=None):
+        self.db_path = db_path
+        self.prometheus_path = prometheus_path
+        self.worker = worker
+        self.retention_seconds = retention_seconds
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self._samples = defaultdict(lambda: deque(maxlen=samples_per_stage))
+        self._counts = defaultdict(int)
+        self._totals = defaultdict(float)
+        self._errors = defaultdict(int)
+        self._gauges = {}
+        self._pending = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._flusher = None
+        self._stop = threading.Event()
+
+    # --- 기록 ---
+    def observe(self, stage, seconds, ok=True):
+        ms = seconds * 1000
+        with self._lock:
+            self._samples[stage].append(ms)
+            self._counts[stage] += 1
+            self._totals[stage] += ms
+            if not ok:
+                self._errors[stage] += 1
+            self._pending.append((time.time(), stage, ms, int(ok)))
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is not None:
+            rerun.append((stage, ms))
+        self._ensure_flusher()
+
+    @contextmanager
+    def span(self, stage):
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.observe(stage, time.perf_counter() - started, ok)
+
+    def gauge(self, name, value):
+        """캐시 적중률처럼 시점 값인 지표를 기록합니다."""
+        with self._lock:
+            self._gauges[name] = float(value)
+
+    # --- 재실행 단위 ---
+    def begin_rerun(self):
+        self._local.rerun = []
+        self._local.rerun_started = time.perf_counter()
+
+    def end_rerun(self, stage="rerun.total"):
+        """현재 스레드의 재실행 기록을 닫고 [(단계, ms), ...]를 반환합니다."""
+        spans = getattr(self._local, "rerun", None)
+        if spans is None:
+            return []
+        self._local.rerun = None
+        elapsed = time.perf_counter() - self._local.rerun_started
+        self.observe(stage, elapsed)
+        return spans + [(stage, elapsed * 1000)]
+
+    def current_rerun(self):
+        return list(getattr(self._local, "rerun", None) or [])
+
+    # --- 조회 ---
+    def summary(self):
+        """{단계: {count, errors, p50_ms, p95_ms, avg_ms}}와 게이지 값을 반환합니다."""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+            counts, totals, errors = dict(self._counts), dict(self._totals), dict(self._errors)
+            gauges = dict(self._gauges)
+        stages = {
+            stage: {"count": counts[stage], "errors": errors.get(stage, 0), "p50_ms": percentile(values, 0.5),
+                    "p95_ms": percentile(values, 0.95), "avg_ms": totals[stage] / counts[stage]}
+            for stage, values in samples.items()
+        }
+        return {"stages": stages, "gauges": gauges}
+
+    # --- 내보내기 ---
+    def _ensure_flusher(self):
+        if self._flusher is None and (self.db_path or self.prometheus_path):
+            with self._lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+                    self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[Warning] 성능 지표 저장 실패: {e}")
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            gauges = dict(self._gauges)
+        if self.db_path:
+            self._write_sqlite(pending, gauges)
+        if self.prometheus_path:
+            self.write_prometheus(self.prometheus_path)
+
+    def _write_sqlite(self, pending, gauges):
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS metric_spans (ts REAL NOT NULL, pid INTEGER NOT NULL, stage TEXT NOT NULL, ms REAL NOT NULL, ok INTEGER NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_metric_spans_stage_ts ON metric_spans(stage, ts)")
+            conn.execute("CREATE TABLE IF NOT EXISTS metric_gauges (name TEXT NOT NULL, pid INTEGER NOT NULL, value REAL NOT NULL, ts REAL NOT NULL, PRIMARY KEY (name, pid))")
+            pid, now = os.getpid(), time.time()
+            conn.executemany("INSERT INTO metric_spans (ts, pid, stage, ms, ok) VALUES (?,?,?,?,?)", ((ts, pid, stage, ms, ok) for ts, stage, ms, ok in pending))
+            conn.executemany("INSERT OR REPLACE INTO metric_gauges (name, pid, value, ts) VALUES (?,?,?,?)", ((name, pid, value, now) for name, value in gauges.items()))
+            # 보관 기간과 최대 행 수를 넘는 오래된 기록은 지웁니다.
+            conn.execute("DELETE FROM metric_spans WHERE ts < ?", (now - self.retention_seconds,))
+            conn.execute("DELETE FROM metric_spans WHERE rowid <= (SELECT MAX(rowid) FROM metric_spans) - ?", (self.max_rows,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def write_prometheus(self, path):
+        summary = self.summary()
+        worker_label = f'worker="{self.worker}"' if self.worker is not None else ""
+        lines = ["# TYPE jobfit_stage_duration_ms summary"]
+        for stage, s in sorted(summary["stages"].items()):
+            label = ",".join(filter(None, [f'stage="{stage}"', worker_label]))
+            lines.append(f'jobfit_stage_duration_ms{{{label},quantile="0.5"}} {s["p50_ms"]:.3f}')
+            lines.append(f'jobfit_stage_duration_ms{{{label},quantile="0.95"}} {s["p95_ms"]:.3f}')
+            lines.append(f'jobfit_stage_duration_ms_sum{{{label}}} {s["avg_ms"] * s["count"]:.3f}')
+            lines.append(f'jobfit_stage_duration_ms_count{{{label}}} {s["count"]}')
+        lines.append("# TYPE jobfit_stage_errors_total counter")
+        for stage, s in sorted(summary["stages"].items()):
+            label = ",".join(filter(None, [f'stage="{stage}"', worker_label]))
+            lines.append(f'jobfit_stage_errors_total{{{label}}} {s["errors"]}')
+        for name, value in sorted(summary["gauges"].items()):
+            lines.append(f"# TYPE {_prom_name(name)} gauge")
+            lines.append(f"{_prom_name(name)}{{{worker_label}}} {value:.6f}" if worker_label else f"{_prom_name(name)} {value:.6f}")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # 같은 파일을 쓰는 다른 스레드·프로세스와 임시 파일이 겹치지 않도록 고유한 이름을 씁니다.
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=Path(path).parent, prefix=f"{Path(path).name}.", suffix=".tmp", delete=False) as tmp:
+            tmp.write("\n".join(lines) + "\n")
+        try:
+            os.chmod(tmp.name, 0o644)  # 임시 파일은 소유자만 읽을 수 있으므로 수집기가 읽을 수 있게 엽니다.
+            os.replace(tmp.name, path)
+        except OSError:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+
+
+_default_metrics = None
+_default_lock = threading.Lock()
+
+
+def default_metrics():
+    """프로세스 전체가 공유하는 Metrics. 처음 호출할 때 만듭니다."""
+    global _default_metrics
+    if _default_metrics is None:
+        with _default_lock:
+            if _default_metrics is None:
+                worker = os.environ.get(WORKER_ENV) or None
+                _default_metrics = Metrics(prometheus_path=prometheus_path_for(worker), worker=worker)
+    return _default_metrics
+
+
+def span(stage):
+    return default_metrics().span(stage)
+
+
+def timed(stage):
+    """기본 Metrics에 기록하는 데코레이터. 모듈을 불러올 때가 아니라 호출할 때 Metrics를 찾습니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with default_metrics().span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,143 @@
+"""
+채용공고(JD) AI 분석 모듈
+
+대시보드의 'AI 채용공고 분석' 탭과 배치 스크립트(batch_analyze_jobs.py)가 같은 프롬프트와
+파싱 규칙을 쓰도록 모아둡니다. 배치 결과는 data/jd_analysis.db의 jd_analysis_results 테이블에
+구조화해 저장하며, 대시보드는 이 테이블을 먼저 조회합니다.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_RESULTS_DB = "data/jd_analysis.db"
+RESULTS_TABLE = "jd_analysis_results"
+
+JD_SYSTEM_PROMPT = "You are a professional HR analyst who provides structured summaries. All your responses must be in Korean."
+JD_OUTPUT_FORMAT = "**[출력 형식]**\n### 📝 핵심 요약 (3가지)\n- [핵심 역할 및 책임 1]\n- [핵심 역할 및 책임 2]\n- [핵심 역할 및 책임 3]\n\n### 🛠️ 요구 기술 스택\n- [기술 1], [기술 2], ...\n\n### 📈 예상 경력 수준\n- [예: 신입, 1~3년차, 5년 이상 등]\n\n### 🗣️ 면접 예상 질문 (3가지)\n1. [기술 또는 경험 관련 질문 1]\n2. [문제 해결 능력 관련 질문 2]\n3. [조직 문화 적합성 관련 질문 3]"
+# 출력 형식의 섹션 제목 -> 결과 필드
+JD_SECTIONS = {"핵심 요약": "summary", "요구 기술 스택": "skills", "예상 경력 수준": "career_level", "면접 예상 질문": "interview_questions"}
+POSTING_FIELDS = [("title", "공고명"), ("companyName", "회사"), ("jobLevels", "경력"), ("jobSkillKeywords", "기술 키워드"), ("addressRegion", "근무 지역"), ("startedAt", "게시일"), ("endedAt", "마감일")]
+
+
+def build_jd_messages(job_description):
+    user_prompt = f"아래 채용공고를 분석해서, 지정된 형식에 맞춰 **반드시 한국어로** 요약해줘.\n\n**[채용공고 원문]**\n---\n{job_description}\n---\n\n{JD_OUTPUT_FORMAT}"
+    return [{"role": "system", "content": JD_SYSTEM_PROMPT}, {"role": "user", "content": user_prompt}]
+
+
+def posting_to_text(posting):
+    """Rallit 공고 한 행(dict/Series)을 분석용 JD 텍스트로 만듭니다."""
+    lines = []
+    for column, label in POSTING_FIELDS:
+        value = posting.get(column)
+        if value is not None and not pd.isna(value) and str(value).strip():
+            lines.append(f"{label}: {value}")
+    return "\n".join(lines)
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _section_items(body):
+    items = []
+    for line in body.splitlines():
+        line = re.sub(r"^\s*(?:[-*•]|\d+[.)])\s*", "", line).strip()
+        if line:
+            items.append(line.strip("*` ").strip())
+    return items
+
+
+def parse_jd_analysis(markdown):
+    """AI 응답 마크다운을 {summary, skills, career_level, interview_questions}로 나눕니다. 없는 섹션은 비워 둡니다."""
+    result = {"summary": [], "skills": [], "career_level": "", "interview_questions": []}
+    for heading, body in re.findall(r"^#{2,4}\s*(.+?)\s*$\n(.*?)(?=^#{2,4}\s|\Z)", markdown or "", flags=re.M | re.S):
+        field = next((f for title, f in JD_SECTIONS.items() if title in heading), None)
+        if field is None:
+            continue
+        items = _section_items(body)
+        if field == "skills":
+            result[field] = [s.strip() for item in items for s in item.split(",") if s.strip()]
+        elif field == "career_level":
+            result[field] = items[0] if items else ""
+        else:
+            result[field] = items
+    return result
+
+
+def connect_results(db_path=DEFAULT_RESULTS_DB):
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(f"""
+    CREATE TABLE IF NOT EXISTS {RESULTS_TABLE} (
+        url TEXT PRIMARY KEY,
+        content_hash TEXT NOT NULL,
+        model TEXT NOT NULL,
+        title TEXT,
+        companyName TEXT,
+        status TEXT NOT NULL,
+        summary TEXT,
+        skills TEXT,
+        career_level TEXT,
+        interview_questions TEXT,
+        raw_response TEXT,
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        latency REAL NOT NULL DEFAULT 0,
+        tokens INTEGER NOT NULL DEFAULT 0,
+        analyzed_at REAL NOT NULL
+    )
+    """)
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{RESULTS_TABLE}_hash ON {RESULTS_TABLE}(content_hash, model)")
+    return conn
+
+
+def save_result(conn, record):
+    """분석 결과 한 건을 저장합니다. 같은 url은 덮어씁니다."""
+    parsed = record.get("parsed") or {}
+    conn.execute(
+        f"""INSERT OR REPLACE INTO {RESULTS_TABLE}
+        (url, content_hash, model, title, companyName, status, summary, skills, career_level, interview_questions,
+         raw_response, error, attempts, latency, tokens, analyzed_at)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        (record["url"], record["content_hash"], record["model"], record.get("title"), record.get("companyName"),
+         record["status"], json.dumps(parsed.get("summary", []), ensure_ascii=False), json.dumps(parsed.get("skills", []), ensure_ascii=False),
+         parsed.get("career_level", ""), json.dumps(parsed.get("interview_questions", []), ensure_ascii=False),
+         record.get("raw_response"), record.get("error"), record.get("attempts", 0), record.get("latency", 0.0),
+         record.get("tokens", 0), time.time()),
+    )
+
+
+def completed_hashes(conn, model):
+    """이미 성공한 (url -> content_hash). 재실행 시 체크포인트로 씁니다."""
+    return dict(conn.execute(f"SELECT url, content_hash FROM {RESULTS_TABLE} WHERE status = 'ok' AND model = ?", (model,)))
+
+
+def results_version(db_path=DEFAULT_RESULTS_DB):
+    """결과 DB와 WAL 파일의 (수정 시각, 크기). 배치가 새 결과를 쓰면 값이 바뀝니다."""
+    version = []
+    for suffix in ("", "-wal"):
+        path = Path(f"{db_path}{suffix}")
+        version.extend([path.stat().st_mtime_ns, path.stat().st_size] if path.exists() else [0, 0])
+    return tuple(version)
+
+
+def load_jd_results(db_path=DEFAULT_RESULTS_DB):
+    """대시보드용: 성공한 분석 결과를 DataFrame으로 반환합니다. 저장소가 없으면 None입니다."""
+    if not Path(db_path).exists():
+        return None
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        df = pd.read_sql(f"SELECT url, title, companyName, model, summary, skills, career_level, interview_questions, raw_response, analyzed_at FROM {RESULTS_TABLE} WHERE status = 'ok' ORDER BY companyName, title", conn)
+    except pd.io.sql.DatabaseError:
+        return None
+    finally:
+        conn.close()
+    for column in ("summary", "skills", "interview_questions"):
+        df[column] = df[column].map(json.loads)
+    return df if not df.empty else None
@@ -1,14 +1,22 @@
 import streamlit as st
 import pandas as pd
-import sqlite3
-import plotly.express as px
 from pathlib import Path
-import glob
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-import platform
-from groq import Groq
-import re
+from response_cache import ResponseCache
+from ai_recommender import AI_ERROR_MESSAGE, RecommendationService, parse_recommended_job
+from career_chat import CHAT_GREETING, ChatHistory, chat_cache_key, stream_chat_completion
+from jd_analysis import build_jd_messages, load_jd_results, results_version
+from job_fit_scoring import JobFitScorer
+from job_taxonomy import CAREER_OPTIONS, WORK_ENV_OPTIONS, WORK_STYLE_OPTIONS, job_category_map
+from posting_index import DEFAULT_INDEX_DIR, build_posting_index, search_postings, skill_weights
+from posting_store import load_postings
+from posting_columnar import DEFAULT_COLUMNAR_PATH, load_compact_postings
+from market_queries import MarketQueries
+from db_pool import DEFAULT_POOL_SIZE, ConnectionPool
+from context_builder import DEFAULT_CONTEXT_TOKEN_BUDGET, ContextBuilder
+from instrumentation import default_metrics, span, timed
+from wordcloud_cache import WordCloudCache
+
+AI_POLL_SECONDS = 1.0  # AI 추천 완료 여부를 확인하는 간격
 
 # --- 1. 페이지 기본 설정 ---
 st.set_page_config(
@@ -33,186 +41,371 @@ st.markdown("""
 
 # --- 3. 데이터 로딩 및 처리 함수 ---
 @st.cache_resource
-def init_connection(db_path="data/job_fit_insight.db"):
+def init_connection(db_path="data/job_fit_insight.db", pool_size=DEFAULT_POOL_SIZE):
     db_file = Path(db_path)
     if not db_file.exists():
         st.error(f"데이터베이스 파일('{db_path}')을 찾을 수 없습니다. `setup_database.py`를 먼저 실행해주세요.")
         st.stop()
-    return sqlite3.connect(db_file, check_same_thread=False)
+    # 세션(스레드)마다 읽기 전용 연결을 대여/반납하는 풀
+    return ConnectionPool(db_file, size=pool_size)
+
+@st.cache_resource
+def get_response_cache():
+    # 모든 세션이 공유하는 AI 응답 캐시 (메모리 LRU + data/llm_cache.db)
+    return ResponseCache()
+
+@st.cache_resource
+def get_recommendation_service():
+    # 세션 간 공유되는 백그라운드 추천 실행기 (동일 요청은 한 번만 호출)
+    return RecommendationService(cache=get_response_cache())
+
+@st.cache_resource
+def get_market_queries(_pool):
+    # 위젯별 조회 결과를 (쿼리, 매개변수, 데이터 버전) 단위로 캐시하는 공유 조회 계층
+    return MarketQueries(_pool)
 
-def generate_sample_youth_data():
-    data = {'성별': ['남성', '여성', '남성', '여성'], '연령계층별': ['15-29세', '15-29세', '30-39세', '30-39세'], '2025.03_실업률': [6.8, 6.1, 3.1, 3.5], '2025.03_경제활동인구': [2450000, 2150000, 3400000, 3100000], '2025.03_취업자': [2283000, 2018000, 3295000, 2990000], '2025.04_실업률': [7.0, 6.3, 3.2, 3.6], '2025.04_경제활동인구': [2460000, 2160000, 3420000, 3120000], '2025.04_취업자': [2287000, 2023000, 3310000, 3010000], '2025.05_실업률': [6.9, 6.2, 3.0, 3.4], '2025.05_경제활동인구': [2470000, 2170000, 3430000, 3130000], '2025.05_취업자': [2299000, 2035000, 3325000, 3020000]}
-    return pd.DataFrame(data)
+@st.cache_resource(max_entries=1)
+def get_job_fit_scorer(_pool, data_version):
+    # DB의 job_fit_weights로 만든 가중치 행렬 (DB가 바뀌면 다시 읽고, 이전 버전의 행렬은 버립니다)
+    with _pool.connection() as conn:
+        return JobFitScorer.from_connection(conn)
+
+@st.cache_resource
+def get_context_builder(_queries):
+    # AI 프롬프트용 시장 데이터 컨텍스트를 조건별로 캐시하는 생성기
+    return ContextBuilder(_queries)
+
+@st.cache_resource
+def get_wordcloud_cache(_queries):
+    # 직무별 워드 클라우드 PNG를 백그라운드에서 미리 그려 둡니다.
+    cache = WordCloudCache()
+    frequencies_by_job = {}
+    for job in _queries.skill_jobs():
+        skills = _queries.skills_for_job(job)
+        frequencies_by_job[job] = dict(zip(skills['기술스택'], skills['빈도']))
+    cache.warm_async(frequencies_by_job)
+    return cache
 
 @st.cache_data
-def load_all_data(_conn):
-    skills_df = pd.read_sql("SELECT * FROM top10_skills_per_job", _conn)
-    levels_df = pd.read_sql("SELECT * FROM joblevel_counts", _conn)
+def load_jd_analysis(version):
+    # batch_analyze_jobs.py가 저장한 공고별 분석 결과 (결과 DB가 바뀌면 다시 읽습니다)
+    return load_jd_results()
+
+@st.cache_resource
+def get_groq_client(api_key):
+    from groq import Groq  # API 키가 있을 때만 불러옵니다.
+    return Groq(api_key=api_key)
+
+# cache_data는 호출마다 DataFrame을 역직렬화해 복사하므로, 읽기 전용 공고는 cache_resource로 한 벌만 공유합니다.
+@st.cache_resource
+def load_all_data():
     rallit_df = None
     try:
-        csv_files = glob.glob(str(Path("data") / "rallit_*.csv"))
-        if csv_files:
-            rallit_df = pd.concat([pd.read_csv(f) for f in csv_files], ignore_index=True).drop_duplicates(subset=['url']).reset_index(drop=True)
+        # 바뀐 rallit_*.csv만 증분 적재한 뒤, url 기준 중복 제거된 공고를 읽습니다.
+        # 컬럼형 파일(python posting_columnar.py build)이 있으면 필요한 컬럼만 메모리 매핑으로 읽습니다.
+        # 이때는 공고 색인도 파일로 저장해 두고 다른 워커 프로세스와 메모리 매핑으로 공유합니다.
+        compact = Path(DEFAULT_COLUMNAR_PATH).exists()
+        rallit_df = load_compact_postings() if compact else load_postings()
     except Exception as e:
+        compact = False
         print(f"Error loading Rallit CSVs: {e}")
-    try:
-        youth_df = pd.read_sql("SELECT * FROM youth_summary", _conn)
-    except pd.io.sql.DatabaseError:
-        youth_df = generate_sample_youth_data()
-    
-    overall_data = youth_df.groupby('연령계층별', as_index=False).sum(numeric_only=True)
-    overall_data["성별"] = "전체"
-    rate_cols = [col for col in youth_df.columns if "_실업률" in col]
-    mean_rates = youth_df.groupby('연령계층별')[rate_cols].mean().reset_index()
-    for col in rate_cols:
-        overall_data[col] = overall_data['연령계층별'].map(mean_rates.set_index('연령계층별')[col])
-    youth_df = pd.concat([youth_df, overall_data], ignore_index=True)
-
-    id_vars = ["성별", "연령계층별"]
-    unemp_long = youth_df.melt(id_vars=id_vars, value_vars=rate_cols, var_name="월", value_name="실업률")
-    pop_long = youth_df.melt(id_vars=id_vars, value_vars=[c for c in youth_df.columns if "_경제활동인구" in c], var_name="월", value_name="경제활동인구")
-    emp_long = youth_df.melt(id_vars=id_vars, value_vars=[c for c in youth_df.columns if "_취업자" in c], var_name="월", value_name="취업자")
-    unemp_long["월"], pop_long["월"], emp_long["월"] = [df["월"].str.replace(s, "") for df, s in [(unemp_long, "_실업률"), (pop_long, "_경제활동인구"), (emp_long, "_취업자")]]
-    trend_df = unemp_long.merge(pop_long, on=id_vars + ["월"]).merge(emp_long, on=id_vars + ["월"])
-    trend_df["월"] = pd.to_datetime(trend_df["월"], format="%Y.%m").dt.strftime("%Y.%m")
-    trend_df = trend_df.sort_values("월")
-    return trend_df, skills_df, levels_df, rallit_df
+    posting_index = build_posting_index(rallit_df, cache_dir=DEFAULT_INDEX_DIR if compact else None)
+    return rallit_df, posting_index
 
-@st.cache_data
-def create_word_cloud(df):
-    d = dict(zip(df['기술스택'], df['빈도']))
-    system = platform.system()
-    font_path = 'NanumGothic.ttf' if Path('NanumGothic.ttf').exists() else ('malgun' if system == 'Windows' else None)
-    if font_path is None:
-        return None
-    wc = WordCloud(font_path=font_path, background_color='white', width=400, height=300, colormap='viridis').generate_from_frequencies(d)
-    return wc
-
-def show_trend_chart(df, age_group):
-    st.markdown("---")
-    st.markdown(f"#### 📈 {age_group} 고용 시계열 추이 (전체 성별 기준)")
-    overall = df[(df["성별"] == "전체") & (df["연령계층별"] == age_group)].sort_values("월")
-    if overall.empty:
-        st.info("선택된 연령대의 시계열 데이터가 없습니다.")
-        return
-    col = st.selectbox("📊 시계열 항목 선택", ["실업률", "경제활동인구", "취업자"], key="trend_col")
+# --- 그래프 생성 (입력별로 캐시, plotly는 처음 그릴 때 불러옵니다) ---
+@st.cache_data(max_entries=64)
+@timed("figure.trend_line")
+def trend_line_figure(_queries, age_group, col, data_version):
+    import plotly.express as px
+    overall = _queries.trend_for(age_group, "전체").sort_values("월")
     fig = px.line(overall, x="월", y=col, title=f"{col} 월별 추이", markers=True)
     if col == "실업률":
         hovertemplate = "<b>월</b>: %{x}<br><b>실업률</b>: %{y:.1f}%"
     else:
         hovertemplate = f"<b>월</b>: %{{x}}<br><b>{col}</b>: %{{y:,.0f}}명"
     fig.update_traces(line_shape="spline", hovertemplate=hovertemplate)
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+@st.cache_data(max_entries=64)
+@timed("figure.skill_bar")
+def skill_bar_figure(_queries, job, title, data_version, compact=False):
+    import plotly.express as px
+    fig = px.bar(_queries.skills_for_job(job).sort_values("빈도", ascending=True), x="빈도", y="기술스택", orientation='h', title=title)
+    if compact: fig.update_layout(yaxis_title="", height=400)
+    return fig
+
+@st.cache_data(max_entries=64)
+@timed("figure.level_pie")
+def level_pie_figure(_queries, job, data_version):
+    import plotly.express as px
+    fig = px.pie(_queries.levels_for_job(job), names='jobLevels', values='공고수', title=f"'{job}' 직무 경력 분포", hole=0.3)
+    fig.update_traces(textinfo='percent+label')
+    return fig
+
+@st.cache_data(max_entries=8)
+@timed("figure.level_counts")
+def level_counts_figure(_queries, data_version):
+    import plotly.express as px
+    return px.bar(_queries.level_counts(), x="jobLevels", y="공고수", color="직무", title="전체 직무별 경력 분포", category_orders={"jobLevels": ["JUNIOR", "MIDDLE", "SENIOR"]}, labels={"jobLevels": "경력 수준", "공고수": "채용 공고 수"})
+
+def show_trend_chart(queries, age_group):
+    st.markdown("---")
+    st.markdown(f"#### 📈 {age_group} 고용 시계열 추이 (전체 성별 기준)")
+    if queries.trend_for(age_group, "전체").empty:
+        st.info("선택된 연령대의 시계열 데이터가 없습니다.")
+        return
+    col = st.selectbox("📊 시계열 항목 선택", ["실업률", "경제활동인구", "취업자"], key="trend_col")
+    st.plotly_chart(trend_line_figure(queries, age_group, col, queries.data_version()), use_container_width=True)
+
+def render_top_job_card(top_job, score_df, work_style, work_env, interest_job, badge="AI 기반"):
+    st.markdown('<div class="highlight-card" style="height: 100%;">', unsafe_allow_html=True)
+    st.markdown(f"<h4>🏆 최적 추천 직무 ({badge})</h4><h1>{top_job}</h1>", unsafe_allow_html=True)
+    final_score = score_df[score_df['직무'] == top_job]['적합도'].values[0] if top_job in score_df['직무'].values else 80
+    st.progress(int(final_score) / 100)
+    st.markdown(f"**규칙 기반 적합도: {final_score}%** (참고용)")
+    st.markdown("---")
+    st.markdown("##### 🔍 분석 요약")
+    st.markdown(f"✓ **'{work_style}'** 성향과 **'{work_env}'** 환경 선호,")
+    st.markdown(f"✓ 그리고 **'{interest_job}'** 직무에 대한 관심을 종합했을 때,")
+    st.markdown(f"➔ **<span style='color:#ff6b35; font-weight:bold;'>{top_job}</span>** 직무를 가장 추천합니다!", unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_top_job_skills(top_job, queries, interest_job, wordcloud_cache):
+    skills_to_show_top = queries.skills_for_job(top_job)
+    skills_to_show_interest = queries.skills_for_job(interest_job)
+    levels_to_show_top = queries.levels_for_job(top_job)
+    if not skills_to_show_top.empty:
+        st.markdown(f"##### ✨ **'{top_job}' 직무 핵심 역량**")
+        skill_tabs = st.tabs(["📊 기술 스택 빈도", "☁️ 워드 클라우드"])
+        with skill_tabs[0]:
+            st.plotly_chart(skill_bar_figure(queries, top_job, f"'{top_job}' 핵심 기술", queries.data_version(), compact=True), use_container_width=True)
+        with skill_tabs[1]:
+            wordcloud_png = wordcloud_cache.get_png(dict(zip(skills_to_show_top['기술스택'], skills_to_show_top['빈도'])))
+            if wordcloud_png: st.image(wordcloud_png, use_container_width=True)
+            else: st.info("워드 클라우드를 생성하기 위한 한글 폰트를 찾을 수 없습니다.")
+    elif not skills_to_show_interest.empty:
+        st.info(f"'{top_job}'의 스킬 정보가 없어, 관심 직무 **'{interest_job}'**의 정보를 대신 표시합니다.")
+    elif not levels_to_show_top.empty:
+        with st.container(border=True):
+            st.warning(f"'{top_job}' 직무의 상세 스킬 정보가 아직 준비되지 않았습니다.")
+            st.info(f"대신 시장의 **'{top_job}' 직무 경력 분포**를 확인해보세요!")
+            st.plotly_chart(level_pie_figure(queries, top_job, queries.data_version()), use_container_width=True)
+    else:
+        with st.container(border=True):
+            st.warning("추천 직무에 대한 상세 정보가 부족합니다.")
+            st.info("상단의 **'시장 동향 분석'** 탭에서 다양한 직무의 트렌드를 직접 탐색해보세요!")
+
+@st.fragment(run_every=AI_POLL_SECONDS)
+def render_ai_reason(ai_task, ai_timeout):
+    """
+    AI 추천 사유를 주기적으로 갱신합니다. 스크립트 스레드를 붙잡고 기다리지 않으므로 위젯 조작이 밀리지 않으며,
+    제한 시간 안에 추천 직무가 도착하면 페이지를 한 번만 다시 그려 추천 카드에 반영합니다.
+    """
+    text = ai_task.text()
+    if not ai_task.done():
+        if ai_task.elapsed() > ai_timeout:
+            st.info(f"AI 응답이 {ai_timeout}초 안에 도착하지 않아 규칙 기반 추천 직무를 표시합니다. 잠시 후 새로고침하면 AI 결과가 반영됩니다.")
+        else:
+            st.markdown(text or "AI가 추천 사유를 작성 중입니다...")
+        return
+    st.markdown(text)
+    if ai_task.elapsed() <= ai_timeout and parse_recommended_job(text, job_category_map) and st.session_state.get("ai_rerun_for") != ai_task.key:
+        st.session_state.ai_rerun_for = ai_task.key
+        default_metrics().observe("ai.wait", ai_task.elapsed())
+        st.rerun()
+
+# --- 시장 동향 탭 (각 탭은 fragment로, 탭 안의 위젯을 조작하면 해당 탭만 다시 실행됩니다) ---
+@st.fragment
+def render_employment_tab(queries):
+    age_options = queries.trend_age_groups()
+    if age_options:
+        selected_age = st.selectbox("🔎 연령 계층 선택", age_options, index=age_options.index("15-29세") if "15-29세" in age_options else 0)
+        st.markdown(f"#### **📊 {selected_age} 고용지표**")
+        month_options = queries.trend_months(selected_age)
+        selected_month = st.selectbox("🗓️ 조회할 월 선택", month_options, key="selected_month_v4")
+        filtered_trend = queries.trend_for(selected_age, "전체")
+        current_overall_series = filtered_trend[filtered_trend["월"] == selected_month]
+        if not current_overall_series.empty:
+            current_overall = current_overall_series.iloc[0]
+            current_unemployment_rate, current_active_pop_k, current_employed_pop_k = current_overall['실업률'], current_overall['경제활동인구'] / 1000, current_overall['취업자'] / 1000
+            delta_unemployment, delta_active, delta_employed = None, None, None
+            prev_month_index = month_options.index(selected_month) + 1
+            if prev_month_index < len(month_options):
+                prev_month = month_options[prev_month_index]
+                prev_overall_series = filtered_trend[filtered_trend["월"] == prev_month]
+                if not prev_overall_series.empty:
+                    prev_overall = prev_overall_series.iloc[0]
+                    delta_unemployment = f"{current_unemployment_rate - prev_overall['실업률']:.1f}%p"
+                    delta_active = f"{(current_active_pop_k - prev_overall['경제활동인구']/1000):,.0f} 천명"
+                    delta_employed = f"{(current_employed_pop_k - prev_overall['취업자']/1000):,.0f} 천명"
+            m_col1, m_col2, m_col3 = st.columns(3)
+            m_col1.metric(label="실업률 (전체)", value=f"{current_unemployment_rate:.1f}%", delta=delta_unemployment, delta_color="inverse")
+            m_col2.metric(label="경제활동인구 (단위: 천명)", value=f"{current_active_pop_k:,.0f}", delta=delta_active)
+            m_col3.metric(label="취업자 수 (단위: 천명)", value=f"{current_employed_pop_k:,.0f}", delta=delta_employed)
+            show_trend_chart(queries, selected_age)
+        else: st.warning(f"'{selected_age}', '{selected_month}'에 대한 데이터가 없습니다.")
+    else: st.warning("고용지표 데이터를 불러오지 못했습니다.")
+
+@st.fragment
+def render_skills_tab(queries):
+    st.markdown("#### **🛠️ 직무별 상위 기술스택 TOP 10**")
+    job_to_show = st.selectbox("분석할 직무 선택", queries.skill_jobs(), key="skill_job")
+    st.plotly_chart(skill_bar_figure(queries, job_to_show, f"'{job_to_show}' 직무 주요 기술스택", queries.data_version()), use_container_width=True)
+
+@st.fragment
+def render_levels_tab(queries):
+    st.markdown("#### **📈 직무별 공고 경력레벨 분포**")
+    c1, c2 = st.columns(2)
+    with c1:
+        st.plotly_chart(level_counts_figure(queries, queries.data_version()), use_container_width=True)
+    with c2:
+        st.markdown("#### **🎯 특정 직무 경력 분포**")
+        selected_pie_job = st.selectbox("직무 선택", queries.level_jobs(), key="pie_job")
+        if not queries.levels_for_job(selected_pie_job).empty:
+            st.plotly_chart(level_pie_figure(queries, selected_pie_job, queries.data_version()), use_container_width=True)
+        else: st.info(f"'{selected_pie_job}' 직무에 대한 경력 분포 데이터가 없습니다.")
+
+def render_stored_jd_results(jd_results):
+    if jd_results is None:
+        st.caption("💡 `python batch_analyze_jobs.py`로 수집된 공고를 미리 분석해 두면 여기에서 바로 볼 수 있습니다.")
+        return
+    st.markdown(f"##### 📚 미리 분석된 채용 공고 ({len(jd_results):,}건)")
+    labels = (jd_results["companyName"].fillna("") + " | " + jd_results["title"].fillna("")).tolist()
+    selected = st.selectbox("공고 선택", range(len(labels)), format_func=labels.__getitem__, key="stored_jd")
+    row = jd_results.iloc[selected]
+    st.markdown(f"**{row['title']}** · {row['companyName']} · [공고 보기]({row['url']})")
+    st.markdown("### 📝 핵심 요약\n" + "\n".join(f"- {item}" for item in row["summary"]))
+    st.markdown("### 🛠️ 요구 기술 스택\n" + ", ".join(row["skills"]))
+    st.markdown(f"### 📈 예상 경력 수준\n{row['career_level']}")
+    st.markdown("### 🗣️ 면접 예상 질문\n" + "\n".join(f"{i}. {q}" for i, q in enumerate(row["interview_questions"], 1)))
+
+@st.fragment
+def render_jd_analysis_tab(client, jd_results, selected_model, temperature, max_tokens):
+    render_stored_jd_results(jd_results)
+    st.markdown("---")
+    st.markdown("##### 채용 공고를 입력하면 AI가 분석해 드립니다.")
+    job_desc_input = st.text_area("여기에 채용 공고를 붙여넣으세요:", height=250, key="jd_input")
+    if st.button("분석 시작하기", key="analyze_jd"):
+        if job_desc_input:
+            with st.spinner("Groq AI가 채용 공고를 분석 중입니다..."), span("llm.jd_analysis"):
+                chat_completion = client.chat.completions.create(messages=build_jd_messages(job_desc_input), model=selected_model, temperature=temperature, max_tokens=max_tokens)
+                st.session_state.jd_analysis_result = chat_completion.choices[0].message.content
+        else: st.warning("분석할 채용 공고를 입력해주세요.")
+    if "jd_analysis_result" in st.session_state:
+        st.markdown("---"); st.subheader("🤖 AI 분석 결과"); st.markdown(st.session_state.jd_analysis_result)
+
+@st.fragment
+def render_career_chat_tab(client, response_cache, profile_text, selected_model, temperature, max_tokens):
+    st.markdown("##### 현재 나의 프로필을 바탕으로 커리어에 대해 질문해보세요.")
+    if "ai_chat_history" not in st.session_state:
+        st.session_state.ai_chat_history = ChatHistory()
+    history = st.session_state.ai_chat_history
+    if history.folded:
+        with st.expander(f"🗂️ 이전 대화 {history.folded}개 (요약)"): st.text(history.summary)
+    with st.chat_message("assistant"): st.markdown(CHAT_GREETING)
+    for message in history.messages:
+        with st.chat_message(message["role"]): st.markdown(message["content"])
+    if user_question := st.chat_input("질문을 입력하세요..."):
+        with st.chat_message("user"): st.markdown(user_question)
+        # 이전 대화 없이 받은 답변만 FAQ 캐시에서 찾고 저장합니다 (대화 맥락에 따라 달라지는 답변은 재사용하지 않음).
+        standalone = not history.messages
+        cache_key = chat_cache_key(selected_model, temperature, max_tokens, profile_text, user_question)
+        with st.chat_message("assistant"):
+            response = response_cache.get(cache_key) if standalone else None
+            if response is not None:
+                st.markdown(response); st.caption("⚡ 같은 프로필로 같은 질문을 한 적이 있어 저장된 답변을 보여드립니다.")
+            else:
+                def remember(text, latency, tokens):
+                    if standalone and text: response_cache.set(cache_key, text, latency=latency, tokens=tokens)
+                try:
+                    with span("llm.chat"):  # 실패한 호출도 오류 수에 잡히도록 스트림 전체를 감쌉니다.
+                        response = st.write_stream(stream_chat_completion(client, history.api_messages(f"{profile_text}\n\n질문: {user_question}"), selected_model, temperature, max_tokens, on_finish=remember))
+                except Exception as e:
+                    print(f"[Error] AI 상담 응답 실패: {str(e)}")
+                    st.error(AI_ERROR_MESSAGE)
+                    return  # 실패한 질문과 오류 문구는 대화 기록에 남기지 않습니다 (다음 요청에 assistant 답변으로 보내지 않도록).
+        history.append("user", user_question)
+        history.append("assistant", response)
+
+def render_metrics_panel(metrics, rerun_spans):
+    with st.expander("🛠️ 성능 패널", expanded=True):
+        st.markdown("**이번 실행 단계별 소요 시간 (ms)**")
+        st.dataframe(pd.DataFrame(rerun_spans, columns=["단계", "ms"]).round(1), hide_index=True, use_container_width=True)
+        summary = metrics.summary()
+        st.markdown("**누적 p50 / p95 (ms)**")
+        stage_df = pd.DataFrame.from_dict(summary["stages"], orient="index")[["count", "p50_ms", "p95_ms", "errors"]] if summary["stages"] else pd.DataFrame()
+        st.dataframe(stage_df.sort_values("p95_ms", ascending=False).round(1) if not stage_df.empty else stage_df, use_container_width=True)
+        st.markdown("**캐시 적중률 / 풀 대기**")
+        for name, value in sorted(summary["gauges"].items()):
+            st.caption(f"{name}: {value:.0%}" if name.endswith("hit_ratio") else f"{name}: {value:.1f}")
 
 # --- 4. 분석 로직 ---
-job_category_map = { "데이터 분석": ["데이터", "분석", "Data", "BI"], "마케팅": ["마케팅", "마케터", "Marketing", "광고", "콘텐츠"], "기획": ["기획", "PM", "PO", "서비스", "Product"], "프론트엔드": ["프론트엔드", "Frontend", "React", "Vue", "웹 개발"], "백엔드": ["백엔드", "Backend", "Java", "Python", "서버", "Node.js"], "AI/ML": ["AI", "ML", "머신러닝", "딥러닝", "인공지능"], "디자인": ["디자인", "디자이너", "Designer", "UI", "UX", "BX", "그래픽"], "영업": ["영업", "Sales", "세일즈", "비즈니스", "Business Development"], "고객지원": ["CS", "CX", "고객", "지원", "서비스 운영"], "인사": ["인사", "HR", "채용", "조직문화", "Recruiting"] }
-def calculate_job_fit(work_style, work_env, interest_job):
-    job_fit_scores = {}
-    for job in job_category_map.keys():
-        score = 0
-        if "분석" in work_style and any(k in job for k in ["데이터", "AI/ML", "백엔드"]): score += 50
-        elif "창의" in work_style and any(k in job for k in ["마케팅", "디자인", "기획"]): score += 50
-        if "독립" in work_env and any(k in job for k in ["엔드", "분석", "AI/ML"]): score += 40
-        elif "팀워크" in work_env and any(k in job for k in ["기획", "마케팅", "디자인"]): score += 40
-        if job == interest_job: score += 15
-        job_fit_scores[job] = min(100, score + 5)
-    return job_fit_scores
-
-def prepare_ai_analysis_data(skills_df, levels_df, rallit_df, interest_job, career_level):
-    context_text = ""
-    skills_info = skills_df[skills_df['직무'] == interest_job]
-    if not skills_info.empty:
-        context_text += f"### [{interest_job} 직무 시장의 주요 기술스택]\n"
-        context_text += skills_info[['기술스택', '빈도']].to_markdown(index=False) + "\n\n"
-    levels_info = levels_df[levels_df['직무'] == interest_job]
-    if not levels_info.empty:
-        context_text += f"### [{interest_job} 직무 시장의 경력 레벨 분포]\n"
-        context_text += levels_info[['jobLevels', '공고수']].to_markdown(index=False) + "\n\n"
-    if rallit_df is not None and all(col in rallit_df.columns for col in ['title', 'jobLevels', 'companyName']):
-        search_keywords = job_category_map.get(interest_job, [interest_job])
-        keyword_regex = '|'.join(search_keywords)
-        job_mask = rallit_df["title"].str.contains(keyword_regex, case=False, na=False)
-        if career_level == "상관 없음": career_mask = pd.Series(True, index=rallit_df.index)
-        elif career_level == "신입": career_mask = rallit_df["jobLevels"].str.contains("신입|경력 무관|JUNIOR", case=False, na=False)
-        else: career_mask = rallit_df["jobLevels"].str.contains(career_level.replace('-','~'), case=False, na=False)
-        filtered_jobs = rallit_df[job_mask & career_mask].head(3)
-        if not filtered_jobs.empty:
-            context_text += "### [현재 조건에 맞는 채용 공고 예시]\n"
-            context_text += filtered_jobs[['title', 'companyName', 'jobLevels']].to_markdown(index=False) + "\n\n"
-    return context_text if context_text else "분석할 시장 데이터가 부족합니다."
-
-def get_ai_based_recommendation(client, model, temp, max_tokens, profile_text, context_text):
-    if client is None: return None
-    try:
-        system_prompt = "You are a highly-skilled Korean career consultant. Your primary mission is to provide ONE single best job recommendation based on the user's profile and market data."
-        user_prompt = f"""
-        당신은 최고의 커리어 코치입니다. 아래의 **[사용자 프로필]**과 **[시장 데이터]**를 종합적으로 분석하여, 이 사용자에게 가장 적합하다고 생각되는 **단 1개의 직무**를 추천하고 그 이유를 설명해주세요.
-
-        **[사용자 프로필]**
-        {profile_text}
-
-        **[참고용 시장 데이터]**
-        {context_text}
-
-        **[수행할 작업 및 출력 형식]**
-        아래 형식을 반드시 지켜서, 추천 직무와 그 사유를 **한국어로** 명확하게 작성해주세요.
-
-        - **추천 직무:** `여기에 추천하는 직무명 하나만 정확히 기입` (예: 데이터 분석)
-        - **추천 사유:** `사용자의 성향, 관심사, 경력 수준과 시장 데이터(기술스택, 경력분포 등)를 연결하여, 왜 이 직무가 최적의 선택인지 2~3문장으로 요약 설명`
-        """
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            temperature=temp,
-            max_tokens=max_tokens,
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        print(f"[Error] AI 응답 실패: {str(e)}")
-        return "[오류] AI 응답 생성에 실패했습니다. API 키 또는 네트워크 상태를 확인해주세요."
+def calculate_job_fit(scorer, work_style, work_env, interest_job):
+    return scorer.score_one(work_style, work_env, interest_job)
+
+def prepare_ai_analysis_data(context_builder, rallit_df, posting_index, interest_job, career_level, token_budget):
+    # (직무, 경력, 예산, 데이터 버전)별로 한 번만 만들어 둔 컨텍스트를 재사용합니다.
+    return context_builder.build(rallit_df, posting_index, interest_job, career_level, token_budget)
 
 # --- 5. 사이드바 UI ---
 with st.sidebar:
     st.title("My Job-Fit Profile")
     if st.button("🔄 데이터 새로고침", use_container_width=True):
+        init_connection().close()  # 캐시에서 빠진 풀의 연결이 열린 채 남지 않도록 먼저 닫습니다.
         st.cache_data.clear(); st.cache_resource.clear()
         st.toast("데이터를 성공적으로 새로고침했습니다!", icon="✅"); st.rerun()
     with st.container(border=True):
         st.header("👤 나의 프로필 설정")
         job_options = sorted(list(job_category_map.keys()))
         interest_job = st.selectbox("관심 직무", job_options, key="interest_job")
-        career_options = ["상관 없음", "신입", "1-3년", "4-6년", "7-10년 이상"]
-        career_level = st.selectbox("희망 경력 수준", career_options, key="career_level")
+        career_level = st.selectbox("희망 경력 수준", CAREER_OPTIONS, key="career_level")
     with st.container(border=True):
         st.header("🧠 나의 성향 진단")
-        work_style = st.radio("선호하는 업무 스타일은?", ["분석적이고 논리적", "창의적이고 혁신적", "체계적이고 계획적", "사교적이고 협력적"], key="work_style")
-        work_env = st.radio("선호하는 업무 환경은?", ["독립적으로 일하기", "팀워크 중심", "빠른 변화와 도전", "안정적이고 예측 가능한"], key="work_env")
+        work_style = st.radio("선호하는 업무 스타일은?", WORK_STYLE_OPTIONS, key="work_style")
+        work_env = st.radio("선호하는 업무 환경은?", WORK_ENV_OPTIONS, key="work_env")
     with st.container(border=True):
         st.header("🦙 AI 도우미 설정")
         selected_model = st.selectbox("사용할 AI 모델", ["llama3-70b-8192", "llama3-8b-8192", "mixtral-8x7b-32768"])
         temperature = st.slider("Temperature (창의성)", 0.0, 1.0, 0.2, 0.05)
         max_tokens = st.slider("Max Tokens (답변 길이)", 128, 8192, 1500, 128)
+        context_token_budget = st.slider("시장 데이터 토큰 예산", 200, 4000, DEFAULT_CONTEXT_TOKEN_BUDGET, 100, help="AI에게 보내는 시장 데이터(기술스택·경력 분포·공고 예시)의 최대 어림 토큰 수입니다.")
+        ai_timeout = st.slider("AI 추천 대기 시간 (초)", 1, 60, 15, 1, help="시간 안에 AI 응답이 오지 않으면 규칙 기반 추천을 유지합니다.")
 
 # --- 6. 메인 로직 실행 ---
-conn = init_connection()
-trend_df, skills_df, levels_df, rallit_df = load_all_data(conn)
-client = Groq(api_key=st.secrets.get("GROQ_API_KEY")) if "GROQ_API_KEY" in st.secrets and st.secrets.get("GROQ_API_KEY") else None
+metrics = default_metrics()
+metrics.begin_rerun()
+db_pool = init_connection()
+queries = get_market_queries(db_pool)
+wordcloud_cache = get_wordcloud_cache(queries)
+with span("data.load_all_data"):
+    rallit_df, posting_index = load_all_data()
+jd_results = load_jd_analysis(results_version())
+try:
+    groq_api_key = st.secrets.get("GROQ_API_KEY")
+except FileNotFoundError:  # secrets.toml이 없는 워커/예열 실행에서는 AI 기능 없이 표시합니다.
+    groq_api_key = None
+client = get_groq_client(groq_api_key) if groq_api_key else None
 
 user_profile_summary = f"현재 '{interest_job}' 직무에 관심이 있고, 희망 경력은 '{career_level}'입니다. 저의 성향은 '{work_style}'하며, '{work_env}' 환경을 선호합니다."
-context_text = prepare_ai_analysis_data(skills_df, levels_df, rallit_df, interest_job, career_level)
-ai_recommendation_reason = get_ai_based_recommendation(client, selected_model, temperature, max_tokens, user_profile_summary, context_text)
-
-job_fit_scores = calculate_job_fit(work_style, work_env, interest_job)
+context_builder = get_context_builder(queries)
+with span("context.build"):
+    context_text = prepare_ai_analysis_data(context_builder, rallit_df, posting_index, interest_job, career_level, context_token_budget)
+with span("scoring.job_fit"):
+    job_fit_scores = calculate_job_fit(get_job_fit_scorer(db_pool, db_pool.data_version()), work_style, work_env, interest_job)
 score_df = pd.DataFrame(job_fit_scores.items(), columns=["직무", "적합도"]).sort_values("적합도", ascending=False).reset_index(drop=True)
 top_job_rule_based = score_df.iloc[0]["직무"] if not score_df.empty else "분석 결과 없음"
 
-top_job = top_job_rule_based
-if ai_recommendation_reason and "[오류]" not in ai_recommendation_reason:
-    match = re.search(r"추천 직무:\s*(.+)", ai_recommendation_reason)
-    if match:
-        ai_top_job = match.group(1).strip()
-        if ai_top_job in job_category_map:
-            top_job = ai_top_job
+# AI 추천은 백그라운드에서 실행하고, 화면은 규칙 기반 결과로 먼저 그립니다.
+response_cache = get_response_cache()
+ai_task = get_recommendation_service().submit(client, selected_model, temperature, max_tokens, user_profile_summary, context_text)
+ai_top_job = parse_recommended_job(ai_task.text(), job_category_map) if ai_task is not None and ai_task.done() else None
+top_job = ai_top_job or top_job_rule_based
+cache_stats = response_cache.stats()
+st.sidebar.caption(f"⚡ AI 응답 캐시: 적중 {cache_stats['hits']}회 / 미스 {cache_stats['misses']}회 (적중률 {cache_stats['hit_ratio']:.0%}, 절약 {cache_stats['saved_seconds']:.1f}초 · {cache_stats['saved_tokens']:,} 토큰)")
+context_stats = context_builder.stats()
+st.sidebar.caption(f"🧾 시장 데이터 컨텍스트: 약 {context_stats['last_tokens']:,} 토큰 · 캐시 적중률 {context_stats['hit_ratio']:.0%}")
+pool_stats = db_pool.stats()
+st.sidebar.caption(f"🗄️ DB 연결 풀: {pool_stats['in_use']}/{pool_stats['size']} 사용 중 · 대기 평균 {pool_stats['avg_wait_ms']:.1f}ms / p95 {pool_stats['p95_wait_ms']:.1f}ms")
 
 # --- 7. 대시보드 본문 ---
 st.markdown('<div class="main-header"><h1>🧠 Job-Fit Insight Dashboard</h1><p>나의 성향과 시장 데이터를 결합한 최적의 커리어 인사이트를 찾아보세요.</p></div>', unsafe_allow_html=True)
@@ -222,57 +415,18 @@ with main_tabs[0]:
     st.subheader(f"사용자님을 위한 맞춤 직무 분석")
     col1, col2 = st.columns([0.5, 0.5])
     with col1:
-        st.markdown('<div class="highlight-card" style="height: 100%;">', unsafe_allow_html=True)
-        st.markdown(f"<h4>🏆 최적 추천 직무 (AI 기반)</h4><h1>{top_job}</h1>", unsafe_allow_html=True)
-        final_score = score_df[score_df['직무'] == top_job]['적합도'].values[0] if top_job in score_df['직무'].values else 80
-        st.progress(int(final_score) / 100)
-        st.markdown(f"**규칙 기반 적합도: {final_score}%** (참고용)")
-        st.markdown("---")
-        st.markdown("##### 🔍 분석 요약")
-        st.markdown(f"✓ **'{work_style}'** 성향과 **'{work_env}'** 환경 선호,")
-        st.markdown(f"✓ 그리고 **'{interest_job}'** 직무에 대한 관심을 종합했을 때,")
-        st.markdown(f"➔ **<span style='color:#ff6b35; font-weight:bold;'>{top_job}</span>** 직무를 가장 추천합니다!", unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-        if ai_recommendation_reason:
+        render_top_job_card(top_job, score_df, work_style, work_env, interest_job, badge="AI 기반" if ai_top_job else ("규칙 기반 · AI 분석 중..." if ai_task is not None and not ai_task.done() else "규칙 기반"))
+        if ai_task is not None:
             with st.expander("🦙 AI의 추천 사유 보기"):
-                st.markdown(ai_recommendation_reason)
+                if ai_task.done(): st.markdown(ai_task.text())
+                else: render_ai_reason(ai_task, ai_timeout)  # 완료되면 페이지를 다시 그려 추천 카드에 반영합니다.
     with col2:
-        skills_to_show_top = skills_df[skills_df["직무"] == top_job]
-        skills_to_show_interest = skills_df[skills_df["직무"] == interest_job]
-        levels_to_show_top = levels_df[levels_df['직무'] == top_job]
-        if not skills_to_show_top.empty:
-            st.markdown(f"##### ✨ **'{top_job}' 직무 핵심 역량**")
-            skill_tabs = st.tabs(["📊 기술 스택 빈도", "☁️ 워드 클라우드"])
-            with skill_tabs[0]:
-                fig_skill = px.bar(skills_to_show_top.sort_values("빈도", ascending=True), x="빈도", y="기술스택", orientation='h', title=f"'{top_job}' 핵심 기술")
-                fig_skill.update_layout(yaxis_title="", height=400); st.plotly_chart(fig_skill, use_container_width=True)
-            with skill_tabs[1]:
-                wc = create_word_cloud(skills_to_show_top)
-                if wc: fig, ax = plt.subplots(); ax.imshow(wc, interpolation='bilinear'); ax.axis('off'); st.pyplot(fig)
-                else: st.info("워드 클라우드를 생성하기 위한 한글 폰트를 찾을 수 없습니다.")
-        elif not skills_to_show_interest.empty:
-            st.info(f"'{top_job}'의 스킬 정보가 없어, 관심 직무 **'{interest_job}'**의 정보를 대신 표시합니다.")
-        elif not levels_to_show_top.empty:
-            with st.container(border=True):
-                st.warning(f"'{top_job}' 직무의 상세 스킬 정보가 아직 준비되지 않았습니다.")
-                st.info(f"대신 시장의 **'{top_job}' 직무 경력 분포**를 확인해보세요!")
-                fig_pie = px.pie(levels_to_show_top, names='jobLevels', values='공고수', title=f"'{top_job}' 직무 경력 분포", hole=0.3)
-                fig_pie.update_traces(textinfo='percent+label'); st.plotly_chart(fig_pie, use_container_width=True)
-        else:
-            with st.container(border=True):
-                st.warning("추천 직무에 대한 상세 정보가 부족합니다.")
-                st.info("상단의 **'시장 동향 분석'** 탭에서 다양한 직무의 트렌드를 직접 탐색해보세요!")
+        render_top_job_skills(top_job, queries, interest_job, wordcloud_cache)
     st.markdown("---")
     st.subheader("📌 나에게 맞는 Rallit 채용공고")
     if rallit_df is not None and all(col in rallit_df.columns for col in ['title', 'jobLevels']):
-        search_keywords = job_category_map.get(interest_job, [interest_job])
-        keyword_regex = '|'.join(search_keywords)
-        job_mask = rallit_df["title"].str.contains(keyword_regex, case=False, na=False)
-        if career_level == "상관 없음": career_mask = pd.Series(True, index=rallit_df.index)
-        elif career_level == "신입": career_mask = rallit_df["jobLevels"].str.contains("신입|경력 무관|JUNIOR", case=False, na=False)
-        else: career_mask = rallit_df["jobLevels"].str.contains(career_level.replace('-','~'), case=False, na=False)
-        filtered_jobs = rallit_df[job_mask & career_mask]
-        top_jobs = filtered_jobs.head(5)
+        # 직무 키워드 BM25 점수에 직무 주요 기술스택과 겹치는 정도를 더해 관련도 순으로 5개를 고릅니다.
+        top_jobs = search_postings(rallit_df, posting_index, interest_job, career_level, limit=5, skill_weights=skill_weights(queries.skills_for_job(interest_job)))
         if not top_jobs.empty:
             for _, row in top_jobs.iterrows():
                 st.markdown(f"""<div class="job-posting-card"><a href="{row['url']}" target="_blank">{row['title']}</a><p>🏢 **회사:** {row.get('companyName', '정보 없음')} | 📍 **지역:** {row.get('addressRegion', '정보 없음')}</p><p>🛠️ **기술스택:** {row.get('jobSkillKeywords', '정보 없음')}</p></div>""", unsafe_allow_html=True)
@@ -283,93 +437,35 @@ with main_tabs[1]:
     st.subheader("대한민국 채용 시장 트렌드 분석")
     market_tabs = st.tabs(["고용 동향", "기술 스택", "경력 분포"])
     with market_tabs[0]:
-        if not trend_df.empty:
-            age_options = sorted(trend_df["연령계층별"].unique())
-            selected_age = st.selectbox("🔎 연령 계층 선택", age_options, index=age_options.index("15-29세") if "15-29세" in age_options else 0)
-            st.markdown(f"#### **📊 {selected_age} 고용지표**")
-            month_options = sorted(trend_df["월"].unique(), reverse=True)
-            selected_month = st.selectbox("🗓️ 조회할 월 선택", month_options, key="selected_month_v4")
-            filtered_trend = trend_df[trend_df['연령계층별'] == selected_age]
-            current_overall_series = filtered_trend[(filtered_trend["월"] == selected_month) & (filtered_trend["성별"] == "전체")]
-            if not current_overall_series.empty:
-                current_overall = current_overall_series.iloc[0]
-                current_unemployment_rate, current_active_pop_k, current_employed_pop_k = current_overall['실업률'], current_overall['경제활동인구'] / 1000, current_overall['취업자'] / 1000
-                delta_unemployment, delta_active, delta_employed = None, None, None
-                prev_month_index = month_options.index(selected_month) + 1
-                if prev_month_index < len(month_options):
-                    prev_month = month_options[prev_month_index]
-                    prev_overall_series = filtered_trend[(filtered_trend["월"] == prev_month) & (filtered_trend["성별"] == "전체")]
-                    if not prev_overall_series.empty:
-                        prev_overall = prev_overall_series.iloc[0]
-                        delta_unemployment = f"{current_unemployment_rate - prev_overall['실업률']:.1f}%p"
-                        delta_active = f"{(current_active_pop_k - prev_overall['경제활동인구']/1000):,.0f} 천명"
-                        delta_employed = f"{(current_employed_pop_k - prev_overall['취업자']/1000):,.0f} 천명"
-                m_col1, m_col2, m_col3 = st.columns(3)
-                m_col1.metric(label="실업률 (전체)", value=f"{current_unemployment_rate:.1f}%", delta=delta_unemployment, delta_color="inverse")
-                m_col2.metric(label="경제활동인구 (단위: 천명)", value=f"{current_active_pop_k:,.0f}", delta=delta_active)
-                m_col3.metric(label="취업자 수 (단위: 천명)", value=f"{current_employed_pop_k:,.0f}", delta=delta_employed)
-                show_trend_chart(trend_df, selected_age)
-            else: st.warning(f"'{selected_age}', '{selected_month}'에 대한 데이터가 없습니다.")
-        else: st.warning("고용지표 데이터를 불러오지 못했습니다.")
+        render_employment_tab(queries)
     with market_tabs[1]:
-        st.markdown("#### **🛠️ 직무별 상위 기술스택 TOP 10**")
-        job_to_show = st.selectbox("분석할 직무 선택", sorted(skills_df["직무"].unique()), key="skill_job")
-        filtered_skills = skills_df[skills_df["직무"] == job_to_show]
-        fig_skills_market = px.bar(filtered_skills.sort_values("빈도"), x="빈도", y="기술스택", title=f"'{job_to_show}' 직무 주요 기술스택", orientation='h')
-        st.plotly_chart(fig_skills_market, use_container_width=True)
+        render_skills_tab(queries)
     with market_tabs[2]:
-        st.markdown("#### **📈 직무별 공고 경력레벨 분포**")
-        c1, c2 = st.columns(2)
-        with c1:
-            fig_levels = px.bar(levels_df, x="jobLevels", y="공고수", color="직무", title="전체 직무별 경력 분포", category_orders={"jobLevels": ["JUNIOR", "MIDDLE", "SENIOR"]}, labels={"jobLevels": "경력 수준", "공고수": "채용 공고 수"})
-            st.plotly_chart(fig_levels, use_container_width=True)
-        with c2:
-            st.markdown("#### **🎯 특정 직무 경력 분포**")
-            selected_pie_job = st.selectbox("직무 선택", sorted(levels_df["직무"].unique()), key="pie_job")
-            single_job_levels = levels_df[levels_df['직무'] == selected_pie_job]
-            if not single_job_levels.empty:
-                fig_pie = px.pie(single_job_levels, names='jobLevels', values='공고수', title=f"'{selected_pie_job}' 직무 경력 분포", hole=0.3)
-                fig_pie.update_traces(textinfo='percent+label'); st.plotly_chart(fig_pie, use_container_width=True)
-            else: st.info(f"'{selected_pie_job}' 직무에 대한 경력 분포 데이터가 없습니다.")
+        render_levels_tab(queries)
 
 with main_tabs[2]:
     st.subheader("Groq 기반 초고속 AI 분석")
     if client is None:
         st.error("AI 도우미를 사용하려면 Groq API 키를 설정해야 합니다.", icon="🔑")
+        render_stored_jd_results(jd_results)  # 배치 분석 결과는 API 키 없이도 볼 수 있습니다.
     else:
         ai_feature_tabs = st.tabs(["**📄 AI 채용공고 분석**", "**💬 AI 커리어 상담**"])
         with ai_feature_tabs[0]:
-            st.markdown("##### 채용 공고를 입력하면 AI가 분석해 드립니다.")
-            job_desc_input = st.text_area("여기에 채용 공고를 붙여넣으세요:", height=250, key="jd_input")
-            if st.button("분석 시작하기", key="analyze_jd"):
-                if job_desc_input:
-                    with st.spinner("Groq AI가 채용 공고를 분석 중입니다..."):
-                        system_prompt = "You are a professional HR analyst who provides structured summaries. All your responses must be in Korean."
-                        user_prompt = f"아래 채용공고를 분석해서, 지정된 형식에 맞춰 **반드시 한국어로** 요약해줘.\n\n**[채용공고 원문]**\n---\n{job_desc_input}\n---\n\n**[출력 형식]**\n### 📝 핵심 요약 (3가지)\n- [핵심 역할 및 책임 1]\n- [핵심 역할 및 책임 2]\n- [핵심 역할 및 책임 3]\n\n### 🛠️ 요구 기술 스택\n- [기술 1], [기술 2], ...\n\n### 📈 예상 경력 수준\n- [예: 신입, 1~3년차, 5년 이상 등]\n\n### 🗣️ 면접 예상 질문 (3가지)\n1. [기술 또는 경험 관련 질문 1]\n2. [문제 해결 능력 관련 질문 2]\n3. [조직 문화 적합성 관련 질문 3]"
-                        chat_completion = client.chat.completions.create(messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}], model=selected_model, temperature=temperature, max_tokens=max_tokens)
-                        st.session_state.jd_analysis_result = chat_completion.choices[0].message.content
-                else: st.warning("분석할 채용 공고를 입력해주세요.")
-            if "jd_analysis_result" in st.session_state:
-                st.markdown("---"); st.subheader("🤖 AI 분석 결과"); st.markdown(st.session_state.jd_analysis_result)
+            render_jd_analysis_tab(client, jd_results, selected_model, temperature, max_tokens)
         with ai_feature_tabs[1]:
-            st.markdown("##### 현재 나의 프로필을 바탕으로 커리어에 대해 질문해보세요.")
-            if "ai_chat_messages" not in st.session_state:
-                st.session_state.ai_chat_messages = [{"role": "assistant", "content": "안녕하세요! 프로필을 바탕으로 커리어에 대해 무엇이든 물어보세요."}]
-            for message in st.session_state.ai_chat_messages:
-                with st.chat_message(message["role"]): st.markdown(message["content"])
             user_profile_for_chat = f"저의 프로필은 다음과 같습니다: 현재 '{interest_job}' 직무에 관심이 있고, 희망 경력은 '{career_level}'입니다. 저의 성향은 '{work_style}'하며, '{work_env}' 환경을 선호합니다."
-            if user_question := st.chat_input("질문을 입력하세요..."):
-                st.session_state.ai_chat_messages.append({"role": "user", "content": user_question})
-                with st.chat_message("user"): st.markdown(user_question)
-                with st.chat_message("assistant"):
-                    with st.spinner("AI가 답변을 생각 중입니다..."):
-                        system_prompt = "You are a friendly and insightful career counselor. Your primary language for all responses is Korean."
-                        messages_for_api = [{"role": "system", "content": system_prompt}, {"role": "user", "content": f"{user_profile_for_chat}\n\n질문: {user_question}"}]
-                        chat_completion = client.chat.completions.create(messages=messages_for_api, model=selected_model, temperature=temperature, max_tokens=max_tokens)
-                        response = chat_completion.choices[0].message.content
-                        st.markdown(response)
-                st.session_state.ai_chat_messages.append({"role": "assistant", "content": response})
+            render_career_chat_tab(client, response_cache, user_profile_for_chat, selected_model, temperature, max_tokens)
 
 # 8. 푸터
 st.markdown("---")
 st.markdown('<div style="text-align: center; color: #666;"><p>🧠 Job-Fit Insight Dashboard | Powered by Streamlit & Groq</p></div>', unsafe_allow_html=True)
+
+# 성능 패널 (주소에 ?admin=1을 붙이면 사이드바에 표시)
+for name, stats in (("response_cache", cache_stats), ("market_queries", queries.stats()), ("context_builder", context_stats)):
+    metrics.gauge(f"{name}.hit_ratio", stats["hit_ratio"])
+metrics.gauge("db_pool.p95_wait_ms", pool_stats["p95_wait_ms"])
+# 재실행 기록을 닫은 뒤 그려 rerun.total까지 보여줍니다.
+rerun_spans = metrics.end_rerun()
+if st.query_params.get("admin") == "1":
+    with st.sidebar:
+        render_metrics_panel(metrics, rerun_spans)
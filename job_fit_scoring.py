@@ -0,0 +1,164 @@
+"""
+직무 적합도 점수 계산 엔진
+
+성향(업무 스타일·업무 환경)과 관심 직무를 직무별 가중치 행렬로 표현하고,
+프로필 N개를 한 번의 NumPy 연산으로 모든 직무에 대해 채점합니다.
+가중치는 DB의 job_fit_weights 테이블에서 읽으며, 대시보드와 오프라인 설문 배치 채점이 같은 행렬을 씁니다.
+
+    python job_fit_scoring.py respondents.csv --top-k 3 --output scores.csv
+"""
+import argparse
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+
+from job_taxonomy import WORK_ENV_OPTIONS, WORK_STYLE_OPTIONS, job_category_map
+
+WEIGHTS_TABLE = "job_fit_weights"
+PROFILE_DIMENSIONS = ["work_style", "work_env", "interest_job"]
+BASE_DIMENSION = "base"
+BASE_SCORE = 5
+INTEREST_BONUS = 15
+MAX_SCORE = 100
+
+# (차원, 선택지에 포함된 키워드, 직무명에 포함된 키워드 중 하나, 가점) - 차원별로 먼저 맞는 규칙 하나만 적용됩니다.
+DEFAULT_RULES = [
+    ("work_style", "분석", ["데이터", "AI/ML", "백엔드"], 50),
+    ("work_style", "창의", ["마케팅", "디자인", "기획"], 50),
+    ("work_env", "독립", ["엔드", "분석", "AI/ML"], 40),
+    ("work_env", "팀워크", ["기획", "마케팅", "디자인"], 40),
+]
+
+
+def default_weight_rows(jobs=None, options=None):
+    """DEFAULT_RULES를 (dimension, option, job, weight) 행 목록으로 펼칩니다."""
+    jobs = list(jobs or job_category_map.keys())
+    options = options or {"work_style": WORK_STYLE_OPTIONS, "work_env": WORK_ENV_OPTIONS}
+    rows = [(BASE_DIMENSION, "", job, BASE_SCORE) for job in jobs]
+    for dimension, values in options.items():
+        rules = [rule for rule in DEFAULT_RULES if rule[0] == dimension]
+        for option in values:
+            matched = next((rule for rule in rules if rule[1] in option), None)
+            if matched is None:
+                continue
+            for job in jobs:
+                if any(k in job for k in matched[2]):
+                    rows.append((dimension, option, job, matched[3]))
+    rows.extend(("interest_job", job, job, INTEREST_BONUS) for job in jobs)
+    return rows
+
+
+def write_job_fit_weights(conn, rows=None):
+    """job_fit_weights 테이블을 다시 만들고 가중치 행을 넣습니다."""
+    rows = rows if rows is not None else default_weight_rows()
+    conn.execute(f"DROP TABLE IF EXISTS {WEIGHTS_TABLE}")
+    conn.execute(f"""
+    CREATE TABLE {WEIGHTS_TABLE} (
+        dimension TEXT NOT NULL,
+        option TEXT NOT NULL,
+        job TEXT NOT NULL,
+        weight REAL NOT NULL,
+        PRIMARY KEY (dimension, option, job)
+    )
+    """)
+    conn.executemany(f"INSERT INTO {WEIGHTS_TABLE} (dimension, option, job, weight) VALUES (?,?,?,?)", rows)
+    conn.commit()
+    return len(rows)
+
+
+class JobFitScorer:
+    """차원별 (선택지 x 직무) 가중치 행렬로 프로필 묶음을 채점합니다."""
+
+    def __init__(self, rows, jobs=None, max_score=MAX_SCORE):
+        weights = pd.DataFrame(rows, columns=["dimension", "option", "job", "weight"])
+        self.jobs = pd.Index(jobs if jobs is not None else weights["job"].unique())
+        self.max_score = max_score
+        self.base = np.zeros(len(self.jobs), dtype=np.float32)
+        base_rows = weights[weights["dimension"] == BASE_DIMENSION]
+        self.base[self.jobs.get_indexer(base_rows["job"])] = base_rows["weight"].to_numpy()
+        self.options = {}
+        self.matrices = {}
+        for dimension in PROFILE_DIMENSIONS:
+            dim_rows = weights[(weights["dimension"] == dimension) & weights["job"].isin(self.jobs)]
+            options = pd.Index(dim_rows["option"].unique())
+            # 마지막 행은 모르는 선택지(get_indexer의 -1)를 위한 0 가중치입니다.
+            matrix = np.zeros((len(options) + 1, len(self.jobs)), dtype=np.float32)
+            matrix[options.get_indexer(dim_rows["option"]), self.jobs.get_indexer(dim_rows["job"])] = dim_rows["weight"].to_numpy()
+            self.options[dimension] = options
+            self.matrices[dimension] = matrix
+
+    @classmethod
+    def from_connection(cls, conn):
+        """DB의 가중치를 읽습니다. 테이블이 아직 없으면 기본 규칙을 씁니다."""
+        try:
+            rows = conn.execute(f"SELECT dimension, option, job, weight FROM {WEIGHTS_TABLE} ORDER BY rowid").fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        return cls(rows or default_weight_rows())
+
+    def score(self, profiles):
+        """profiles({차원: 값 배열} 또는 DataFrame)를 (N x 직무 수) 점수 행렬로 채점합니다."""
+        scores = None
+        for dimension in PROFILE_DIMENSIONS:
+            # 응답값 종류는 적으므로 고유값만 선택지 번호로 바꾼 뒤 코드로 펼칩니다.
+            codes, uniques = pd.factorize(np.asarray(profiles[dimension]))
+            rows = self.options[dimension].get_indexer(uniques)[codes]
+            contribution = self.matrices[dimension][rows]
+            scores = contribution if scores is None else scores + contribution
+        scores += self.base
+        return np.minimum(scores, self.max_score, out=scores)
+
+    def top_k(self, scores, k=3):
+        """점수 행렬에서 행마다 상위 k개 직무의 (인덱스, 점수)를 점수 내림차순으로 반환합니다. 동점은 직무 순서를 따릅니다."""
+        k = min(k, scores.shape[1])
+        if k < scores.shape[1]:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            # 경계 점수와 같은 직무가 후보 밖에 남지 않도록, 경계 점수 이상인 직무를 모두 모은 뒤 정렬합니다.
+            threshold = np.take_along_axis(scores, candidates, axis=1).min(axis=1, keepdims=True)
+            masked = np.where(scores >= threshold, scores, -np.inf)
+        else:
+            masked = scores
+        order = np.argsort(-masked, axis=1, kind="stable")[:, :k]
+        return order, np.take_along_axis(scores, order, axis=1)
+
+    def score_one(self, work_style, work_env, interest_job):
+        """대시보드용: 프로필 하나의 {직무: 점수}."""
+        scores = self.score({"work_style": [work_style], "work_env": [work_env], "interest_job": [interest_job]})[0]
+        return {job: int(score) if float(score).is_integer() else float(score) for job, score in zip(self.jobs, scores)}
+
+    def score_frame(self, profiles, k=3):
+        """프로필 DataFrame에 top1..topk 직무와 점수 컬럼을 붙여 반환합니다."""
+        order, top_scores = self.top_k(self.score(profiles), k)
+        result = profiles.reset_index(drop=True).copy()
+        job_names = self.jobs.to_numpy()
+        for rank in range(order.shape[1]):
+            result[f"top{rank + 1}_job"] = job_names[order[:, rank]]
+            result[f"top{rank + 1}_score"] = top_scores[:, rank]
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설문 응답자 프로필 일괄 직무 적합도 채점")
+    parser.add_argument("input", help=f"{', '.join(PROFILE_DIMENSIONS)} 컬럼을 가진 CSV")
+    parser.add_argument("--output", default="job_fit_scores.csv")
+    parser.add_argument("--db", default="data/job_fit_insight.db", help="가중치를 읽을 DB")
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    try:
+        scorer = JobFitScorer.from_connection(conn)
+    finally:
+        conn.close()
+    started, total = time.perf_counter(), 0
+    for i, chunk in enumerate(pd.read_csv(args.input, chunksize=args.chunksize, dtype=str)):
+        scorer.score_frame(chunk.fillna(""), args.top_k).to_csv(args.output, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        total += len(chunk)
+    print(f"{total:,}명 채점 완료 -> {args.output} ({time.perf_counter() - started:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
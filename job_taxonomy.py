@@ -0,0 +1,18 @@
+"""
+직무 분류 및 경력 수준 정의
+
+대시보드, 채용공고 색인, 배치 스크립트가 같은 분류 기준을 쓰도록 한곳에 모아둡니다.
+"""
+
+job_category_map = { "데이터 분석": ["데이터", "분석", "Data", "BI"], "마케팅": ["마케팅", "마케터", "Marketing", "광고", "콘텐츠"], "기획": ["기획", "PM", "PO", "서비스", "Product"], "프론트엔드": ["프론트엔드", "Frontend", "React", "Vue", "웹 개발"], "백엔드": ["백엔드", "Backend", "Java", "Python", "서버", "Node.js"], "AI/ML": ["AI", "ML", "머신러닝", "딥러닝", "인공지능"], "디자인": ["디자인", "디자이너", "Designer", "UI", "UX", "BX", "그래픽"], "영업": ["영업", "Sales", "세일즈", "비즈니스", "Business Development"], "고객지원": ["CS", "CX", "고객", "지원", "서비스 운영"], "인사": ["인사", "HR", "채용", "조직문화", "Recruiting"] }
+
+CAREER_OPTIONS = ["상관 없음", "신입", "1-3년", "4-6년", "7-10년 이상"]
+WORK_STYLE_OPTIONS = ["분석적이고 논리적", "창의적이고 혁신적", "체계적이고 계획적", "사교적이고 협력적"]
+WORK_ENV_OPTIONS = ["독립적으로 일하기", "팀워크 중심", "빠른 변화와 도전", "안정적이고 예측 가능한"]
+
+
+def career_level_pattern(career_level):
+    """경력 수준 선택값을 jobLevels 검색 정규식으로 바꿉니다. '상관 없음'이면 None입니다."""
+    if career_level == "상관 없음": return None
+    if career_level == "신입": return "신입|경력 무관|JUNIOR"
+    return career_level.replace('-', '~')
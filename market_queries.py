@@ -0,0 +1,100 @@
+"""
+시장 데이터 조회 계층
+
+테이블 전체를 pandas로 올려두는 대신, 화면의 각 위젯이 그리는 조각만 매개변수화된 SQL로 조회합니다.
+결과는 (쿼리, 매개변수, 데이터 버전) 키로 크기가 제한된 LRU 캐시에 보관되며,
+DB 파일이 갱신되면 연결 풀의 data_version이 바뀌어 이전 결과는 자연히 쓰이지 않습니다.
+"""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from instrumentation import span
+from setup_database import compute_employment_trend
+
+TREND_SELECT = "SELECT 연령계층별, 성별, 월, 실업률, 경제활동인구, 취업자 FROM employment_trend"
+
+
+class MarketQueries:
+    def __init__(self, pool, max_entries=256):
+        self._pool = pool
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    # --- 내부 유틸 ---
+    def _cached(self, key, loader):
+        key = key + (self._pool.data_version(),)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+        with span("db.query"), self._pool.connection() as conn:
+            result = loader(conn)
+        with self._cache_lock:
+            self._cache[key] = result
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    def _query(self, sql, params=()):
+        params = tuple(params)
+        return self._cached((sql, params), lambda conn: pd.read_sql(sql, conn, params=params))
+
+    def _trend_query(self, where="", params=(), order_by="월"):
+        try:
+            return self._query(f"{TREND_SELECT} {where} ORDER BY {order_by}", params)
+        except pd.io.sql.DatabaseError:
+            # employment_trend가 아직 없으면 같은 규칙으로 메모리에서 계산합니다 (데이터 버전당 한 번).
+            trend_df = self._cached(("employment_trend:fallback", ()), compute_employment_trend)
+            for column, value in zip(["연령계층별", "성별"], params):
+                trend_df = trend_df[trend_df[column] == value]
+            return trend_df.sort_values(order_by).reset_index(drop=True)
+
+    def stats(self):
+        with self._cache_lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache), "hit_ratio": self.hits / total if total else 0.0}
+
+    # --- 기술스택 (top10_skills_per_job) ---
+    def skill_jobs(self):
+        return self._query("SELECT DISTINCT 직무 FROM top10_skills_per_job ORDER BY 직무")["직무"].tolist()
+
+    def skills_for_job(self, job):
+        return self._query("SELECT 직무, 기술스택, 빈도 FROM top10_skills_per_job WHERE 직무 = ? ORDER BY 빈도 DESC", (job,))
+
+    # --- 경력 분포 (joblevel_counts) ---
+    def level_jobs(self):
+        return self._query("SELECT DISTINCT 직무 FROM joblevel_counts ORDER BY 직무")["직무"].tolist()
+
+    def levels_for_job(self, job):
+        return self._query("SELECT 직무, jobLevels, 공고수 FROM joblevel_counts WHERE 직무 = ? ORDER BY jobLevels", (job,))
+
+    def level_counts(self):
+        return self._query("SELECT 직무, jobLevels, 공고수 FROM joblevel_counts ORDER BY 직무, jobLevels")
+
+    # --- 고용 동향 (employment_trend) ---
+    def data_version(self):
+        return self._pool.data_version()
+
+    def trend_age_groups(self):
+        try:
+            return self._query("SELECT DISTINCT 연령계층별 FROM employment_trend ORDER BY 연령계층별")["연령계층별"].tolist()
+        except pd.io.sql.DatabaseError:
+            return sorted(self._trend_query()["연령계층별"].unique())
+
+    def trend_months(self, age_group):
+        try:
+            return self._query("SELECT DISTINCT 월 FROM employment_trend WHERE 연령계층별 = ? ORDER BY 월 DESC", (age_group,))["월"].tolist()
+        except pd.io.sql.DatabaseError:
+            return sorted(self._trend_query("WHERE 연령계층별 = ?", (age_group,))["월"].unique(), reverse=True)
+
+    def trend_for(self, age_group, gender=None):
+        if gender is None:
+            return self._trend_query("WHERE 연령계층별 = ?", (age_group,))
+        return self._trend_query("WHERE 연령계층별 = ? AND 성별 = ?", (age_group, gender))
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Rallit 채용공고 컬럼형 저장소와 합성 공고 생성기
+
+공고 저장소(data/rallit_postings.db)에서 대시보드가 실제로 쓰는 컬럼만 골라 Feather(Arrow IPC, 무압축) 또는
+Parquet 파일로 내보냅니다. 지역·경력·회사명은 사전(dictionary) 인코딩해 pandas에서 categorical로, 나머지 문자열은
+Arrow 문자열로 읽습니다. Feather 파일은 메모리 매핑으로 읽으므로 문자열 버퍼를 복사하지 않고, 여러 워커 프로세스가
+운영체제의 페이지 캐시를 공유합니다. 파일은 적재 매니페스트의 지문을 메타데이터로 담고 있어, CSV가 바뀌면 다시 만듭니다.
+
+    python posting_columnar.py build                                      # data/rallit_postings.feather 생성
+    python posting_columnar.py build --output data/rallit_postings.parquet
+    python posting_columnar.py generate --rows 1000000 --output /tmp/rallit_synthetic_jobs.csv
+"""
+import argparse
+import glob
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from posting_store import DEFAULT_CSV_PATTERN, DEFAULT_STORE_PATH, _quote, _table_columns, sync_postings
+
+DEFAULT_COLUMNAR_PATH = "data/rallit_postings.feather"
+# 대시보드(색인, AI 컨텍스트, 공고 카드)가 읽는 컬럼
+POSTING_UI_COLUMNS = ["url", "title", "companyName", "addressRegion", "jobLevels", "jobSkillKeywords", "startedAt"]
+CATEGORY_COLUMNS = ["addressRegion", "jobLevels", "companyName"]
+MANIFEST_METADATA_KEY = b"jobfit.manifest"
+
+
+def manifest_digest(store_path=DEFAULT_STORE_PATH):
+    """적재된 CSV 목록과 각 파일 해시의 지문. 저장소 내용이 바뀌면 값이 바뀝니다."""
+    conn = sqlite3.connect(store_path)
+    try:
+        rows = conn.execute("SELECT path, sha256 FROM rallit_ingest_manifest ORDER BY path").fetchall()
+    finally:
+        conn.close()
+    return hashlib.sha256(repr(rows).encode("utf-8")).hexdigest()
+
+
+def _is_parquet(path):
+    return Path(path).suffix.lower() in (".parquet", ".pq")
+
+
+def _dictionary(conn, column):
+    import pyarrow as pa
+
+    values = [row[0] for row in conn.execute(f"SELECT DISTINCT {_quote(column)} FROM rallit_postings WHERE {_quote(column)} IS NOT NULL ORDER BY 1")]
+    return pa.array([str(v) for v in values], type=pa.string())
+
+
+def _record_batch(chunk, schema, dictionaries):
+    import pyarrow as pa
+
+    arrays = []
+    for field in schema:
+        values = chunk[field.name]
+        if field.name in dictionaries:
+            dictionary = dictionaries[field.name]
+            codes = pd.Categorical(values.astype("string"), categories=dictionary.to_pylist()).codes.astype(np.int32)
+            arrays.append(pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0, type=pa.int32()), dictionary))
+        else:
+            arrays.append(pa.array(values.astype("string"), type=pa.string(), from_pandas=True))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def export_columnar(output_path=DEFAULT_COLUMNAR_PATH, store_path=DEFAULT_STORE_PATH, chunksize=100_000):
+    """
+    저장소의 공고를 chunksize 행씩 읽어 컬럼형 파일로 씁니다. 사전은 먼저 SQL로 구해 모든 배치가 같은 사전을 쓰므로
+    전체 공고를 한꺼번에 메모리에 올리지 않습니다. 쓴 행 수를 반환합니다.
+    """
+    import pyarrow as pa
+
+    conn = sqlite3.connect(store_path)
+    try:
+        available = set(_table_columns(conn, "rallit_postings"))
+        columns = [c for c in POSTING_UI_COLUMNS if c in available]
+        dictionaries = {c: _dictionary(conn, c) for c in CATEGORY_COLUMNS if c in available}
+        schema = pa.schema([pa.field(c, pa.dictionary(pa.int32(), pa.string()) if c in dictionaries else pa.string()) for c in columns],
+                           metadata={MANIFEST_METADATA_KEY: manifest_digest(store_path).encode()})
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        rows = 0
+        query = f"SELECT {', '.join(_quote(c) for c in columns)} FROM rallit_postings ORDER BY source_file, seq"
+        if _is_parquet(output_path):
+            import pyarrow.parquet as pq
+            writer = pq.ParquetWriter(tmp_path, schema)
+        else:
+            writer = pa.ipc.new_file(tmp_path, schema)  # 무압축 Arrow IPC = Feather V2. 메모리 매핑으로 바로 읽힙니다.
+        try:
+            for chunk in pd.read_sql(query, conn, chunksize=chunksize):
+                batch = _record_batch(chunk, schema, dictionaries)
+                if _is_parquet(output_path):
+                    writer.write_batch(batch)
+                else:
+                    writer.write(batch)
+                rows += len(chunk)
+        finally:
+            writer.close()
+    finally:
+        conn.close()
+    # 다른 워커가 읽고 있는 옛 파일은 교체 후에도 기존 매핑으로 계속 읽힙니다.
+    os.replace(tmp_path, output_path)
+    return rows
+
+
+def _file_manifest(path):
+    import pyarrow as pa
+
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        metadata = pq.read_schema(path).metadata
+    else:
+        with pa.memory_map(str(path), "r") as source:
+            metadata = pa.ipc.open_file(source).schema.metadata
+    return (metadata or {}).get(MANIFEST_METADATA_KEY, b"").decode()
+
+
+def _types_mapper(arrow_type):
+    import pyarrow as pa
+
+    if arrow_type in (pa.string(), pa.large_string()):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def read_columnar(path=DEFAULT_COLUMNAR_PATH):
+    """컬럼형 파일을 DataFrame으로 읽습니다. 사전 인코딩 컬럼은 categorical, 나머지는 Arrow 문자열입니다."""
+    import pyarrow as pa
+
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, memory_map=True)
+    else:
+        table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()  # 문자열 버퍼는 파일 매핑을 그대로 가리킵니다.
+    return table.to_pandas(types_mapper=_types_mapper)
+
+
+def load_compact_postings(columnar_path=DEFAULT_COLUMNAR_PATH, csv_pattern=DEFAULT_CSV_PATTERN, store_path=DEFAULT_STORE_PATH):
+    """저장소를 최신 상태로 맞추고, 컬럼형 파일이 오래됐으면 다시 만든 뒤 읽습니다. 공고가 없으면 None입니다."""
+    sync_postings(csv_pattern, store_path)
+    if not Path(columnar_path).exists() or _file_manifest(columnar_path) != manifest_digest(store_path):
+        export_columnar(columnar_path, store_path)
+    df = read_columnar(columnar_path)
+    return df if len(df.columns) > 1 and not df.empty else None
+
+
+def memory_mb(df):
+    return df.memory_usage(deep=True).sum() / 1e6 if df is not None else 0.0
+
+
+# --- 합성 공고 생성기 ---
+SYNTHETIC_REGIONS = ["GANGNAM", "SEOUL", "GYEONGGI", "PANGYO", "MAPO", "GURO_GASAN", "ETC"]
+SYNTHETIC_LEVELS = ["BEGINNER", "JUNIOR", "MIDDLE", "SENIOR", "TOP", "IRRELEVANT"]
+SYNTHETIC_CSV_COLUMNS = ["addressRegion", "companyId", "companyName", "companyRepresentativeImage", "endedAt", "id", "isBookmarked", "isPartner",
+                         "jobLevel", "jobLevels", "jobSkillKeywords", "joinReward", "partnerLogo", "startedAt", "status_code", "status_name", "title", "url"]
+
+
+def _vocabulary(csv_pattern):
+    """기존 CSV에서 제목·회사·기술 키워드 어휘를 모읍니다. CSV가 없으면 직무 분류 키워드로 대신합니다."""
+    titles, companies, skills = [], [], []
+    for path in sorted(glob.glob(csv_pattern)):
+        df = pd.read_csv(path, usecols=lambda c: c in ("title", "companyName", "jobSkillKeywords"), dtype=str)
+        titles.extend(df.get("title", pd.Series(dtype=str)).dropna().unique())
+        companies.extend(df.get("companyName", pd.Series(dtype=str)).dropna().unique())
+        for keywords in df.get("jobSkillKeywords", pd.Series(dtype=str)).dropna():
+            skills.extend(k.strip() for k in keywords.split(",") if k.strip())
+    if not titles:
+        from job_taxonomy import job_category_map
+        titles = [f"{keyword} 채용" for keywords in job_category_map.values() for keyword in keywords]
+    return (np.array(sorted(set(titles)), dtype=object), np.array(sorted(set(companies)) or ["합성회사"], dtype=object),
+            np.array(sorted(set(skills)) or ["Python", "SQL", "Figma"], dtype=object))
+
+
+def generate_postings(rows, seed=0, start=0, vocabulary=None, csv_pattern=DEFAULT_CSV_PATTERN):
+    """Rallit CSV와 같은 스키마의 합성 공고 rows개를 만듭니다. start는 url·id 번호의 시작값입니다."""
+    titles, companies, skills = vocabulary or _vocabulary(csv_pattern)
+    rng = np.random.default_rng(seed + start)
+    ids = np.arange(start, start + rows)
+    company_codes = rng.integers(0, len(companies), rows)
+    level_counts = rng.integers(1, 4, rows)
+    level_picks = rng.integers(0, len(SYNTHETIC_LEVELS), (rows, 3))
+    skill_counts = rng.integers(1, 6, rows)
+    skill_picks = rng.integers(0, len(skills), (rows, 5))
+    started = pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 180, rows), unit="D")
+    return pd.DataFrame({
+        "addressRegion": np.array(SYNTHETIC_REGIONS, dtype=object)[rng.integers(0, len(SYNTHETIC_REGIONS), rows)],
+        "companyId": company_codes,
+        "companyName": companies[company_codes],
+        "companyRepresentativeImage": "",
+        "endedAt": (started + pd.Timedelta(days=30)).strftime("%Y-%m-%d"),
+        "id": ids,
+        "isBookmarked": False,
+        "isPartner": False,
+        "jobLevel": np.array(SYNTHETIC_LEVELS, dtype=object)[level_picks[:, 0]],
+        "jobLevels": [", ".join(dict.fromkeys(SYNTHETIC_LEVELS[j] for j in picks[:n])) for picks, n in zip(level_picks, level_counts)],
+        "jobSkillKeywords": [", ".join(dict.fromkeys(skills[picks[:n]])) for picks, n in zip(skill_picks, skill_counts)],
+        "joinReward": 0,
+        "partnerLogo": "",
+        "startedAt": started.strftime("%Y-%m-%d"),
+        "status_code": "HIRING",
+        "status_name": "모집 중",
+        "title": titles[rng.integers(0, len(titles), rows)],
+        "url": [f"https://www.rallit.com/positions/synthetic-{i}" for i in ids],
+    })[SYNTHETIC_CSV_COLUMNS]
+
+
+def write_synthetic_csv(output_path, rows, seed=0, chunksize=100_000, csv_pattern=DEFAULT_CSV_PATTERN):
+    """합성 공고를 chunksize 행씩 만들어 CSV에 이어 씁니다. 행 수와 상관없이 메모리 사용량이 일정합니다."""
+    vocabulary = _vocabulary(csv_pattern)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    for start in range(0, rows, chunksize):
+        chunk = generate_postings(min(chunksize, rows - start), seed=seed, start=start, vocabulary=vocabulary)
+        chunk.to_csv(output_path, mode="w" if start == 0 else "a", header=start == 0, index=False)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rallit 공고 컬럼형 저장소 / 합성 공고 생성")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="공고 저장소를 컬럼형 파일로 내보내기")
+    build.add_argument("--output", default=DEFAULT_COLUMNAR_PATH, help=".feather(기본) 또는 .parquet")
+    build.add_argument("--csv-pattern", default=DEFAULT_CSV_PATTERN)
+    build.add_argument("--store", default=DEFAULT_STORE_PATH)
+    generate = sub.add_parser("generate", help="합성 공고 CSV 생성")
+    generate.add_argument("--rows", type=int, required=True)
+    generate.add_argument("--output", required=True, help="data/rallit_*.csv 이름으로 저장하면 대시보드 적재 대상이 됩니다.")
+    generate.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.command == "generate":
+        write_synthetic_csv(args.output, args.rows, seed=args.seed)
+        print(f"✅ 합성 공고 {args.rows:,}건 생성 -> {args.output} ({time.perf_counter() - started:.1f}초)")
+        return
+    sync_postings(args.csv_pattern, args.store)
+    rows = export_columnar(args.output, args.store)
+    compact = read_columnar(args.output)
+    print(f"✅ 공고 {rows:,}건 -> {args.output} ({Path(args.output).stat().st_size / 1e6:.1f} MB, "
+          f"DataFrame {memory_mb(compact):.1f} MB, {time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
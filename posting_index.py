@@ -0,0 +1,345 @@
+"""
+Rallit 채용공고 색인
+
+데이터를 불러올 때 공고 제목과 기술 키워드를 토큰으로 나눠 역색인(BM25)을 한 번만 만들고, 경력 수준별 일치
+여부를 미리 계산해 둡니다. 검색 시에는 직무 키워드로 후보와 BM25 점수를 구하고(직무별로 캐시), 경력 조건으로
+후보를 거른 뒤 직무 주요 기술스택과 겹치는 공고에 가산점을 주고 상위 k개만 고릅니다.
+
+영문 키워드는 단어 단위로 비교해 "AI"가 "MAIN"에, "CS"가 "CSS"에 걸리지 않게 하고, 띄어쓰지 않은 복합어가 많은
+한글은 두 글자씩(bigram) 나눠 색인합니다. 여러 토큰으로 된 키워드는 제목에 토큰이 같은 순서로 붙어 나오는 공고만
+일치로 봅니다("웹 개발"은 "웹 개발자"에는 걸리지만 "웹 백엔드 개발자"에는 걸리지 않습니다).
+
+cache_dir를 주면 완성된 색인을 공고 목록 지문별 폴더에 .npy로 저장하고, 다음 프로세스는 다시 만들지 않고
+메모리 매핑으로 읽습니다. 여러 워커 프로세스가 같은 색인 파일을 공유합니다.
+"""
+import json
+import os
+import re
+import shutil
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from job_taxonomy import CAREER_OPTIONS, career_level_pattern, job_category_map
+
+DEFAULT_INDEX_DIR = "data/posting_index"
+INDEX_FORMAT = 2  # 저장 형식이 바뀌면 올립니다. 이전 형식의 색인은 다시 만듭니다.
+TOKEN_PATTERN = re.compile(r"[0-9a-z][0-9a-z+#.]*|[가-힣]+")
+TITLE_WEIGHT = 2.0  # 제목에 나온 단어는 기술 키워드보다 두 배로 셉니다 (BM25F).
+SKILL_BOOST = 1.5   # 직무 주요 기술스택 중 가장 많이 쓰이는 기술 하나와 겹칠 때의 가산점
+
+
+def tokenize(text):
+    """소문자 영문·숫자 단어와 한글 bigram 목록. 'Node.js', 'C++', 'C#' 같은 기술명은 한 단어로 둡니다."""
+    terms = []
+    for token in TOKEN_PATTERN.findall(str(text).casefold()):
+        if "가" <= token[0] <= "힣" and len(token) > 1:
+            terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            terms.append(token.rstrip("."))
+    return terms
+
+
+def skill_weights(skills_info):
+    """top10_skills_per_job 조회 결과(기술스택, 빈도)를 {기술(소문자): 빈도}로 바꿉니다."""
+    return {str(s).casefold(): float(n) for s, n in zip(skills_info["기술스택"], skills_info["빈도"])}
+
+
+def split_skills(keywords):
+    return [k.strip() for k in keywords.split(",") if k.strip()] if isinstance(keywords, str) else []
+
+
+def _csr(keys, docs, columns, size):
+    """(키, 문서, 값...) 목록을 키별로 모은 (offsets, docs, [값 배열...])로 만듭니다. 문서 번호는 키 안에서 오름차순입니다."""
+    keys = np.asarray(keys, dtype=np.int32)
+    order = np.argsort(keys, kind="stable")  # 문서는 순서대로 추가되므로 안정 정렬이면 문서 순서가 유지됩니다.
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=offsets[1:])
+    return offsets, np.asarray(docs, dtype=np.int32)[order], [np.asarray(values, dtype=np.float32)[order] for values in columns]
+
+
+BM25_ARRAYS = ("_offsets", "_docs", "_tfs", "_in_title", "_skill_offsets", "_skill_docs", "_idf", "_norm", "_title_offsets", "_title_terms")
+
+
+class BM25Index:
+    """
+    제목·기술 키워드 역색인. 구문 확인을 위해 공고별 제목 토큰 순서(_title_terms)도 함께 저장합니다.
+    직무별 점수는 (키워드, 주요 기술스택)마다 한 번만 계산해 보관합니다.
+    """
+
+    def __init__(self, titles, skills, k1=1.2, b=0.75, max_cached_queries=64):
+        self.size = len(titles)
+        self._terms, self._skills = {}, {}
+        term_keys, term_docs, term_tfs, term_in_title = [], [], [], []
+        skill_keys, skill_docs = [], []
+        title_offsets, title_sequence = np.zeros(self.size + 1, dtype=np.int64), []
+        lengths = np.zeros(self.size, dtype=np.float32)
+        tokens = {}  # 같은 제목·기술명이 많으므로 토큰화 결과를 재사용합니다.
+        for doc, (title, keywords) in enumerate(zip(titles, skills)):
+            counts = Counter()
+            if isinstance(title, str):
+                for term in tokens.get(title) or tokens.setdefault(title, tokenize(title)):
+                    counts[term] += TITLE_WEIGHT
+                    title_sequence.append(self._terms.setdefault(term, len(self._terms)))
+            title_offsets[doc + 1] = len(title_sequence)
+            title_terms = set(counts)
+            for skill in split_skills(keywords):
+                skill_keys.append(self._skills.setdefault(skill.casefold(), len(self._skills)))
+                skill_docs.append(doc)
+                for term in tokens.get(skill) or tokens.setdefault(skill, tokenize(skill)):
+                    counts[term] += 1
+            lengths[doc] = sum(counts.values())
+            for term, tf in counts.items():
+                term_keys.append(self._terms.setdefault(term, len(self._terms)))
+                term_docs.append(doc)
+                term_tfs.append(tf)
+                term_in_title.append(term in title_terms)
+        self._offsets, self._docs, (self._tfs, self._in_title) = _csr(term_keys, term_docs, [term_tfs, term_in_title], len(self._terms))
+        self._in_title = self._in_title.astype(bool)
+        self._skill_offsets, self._skill_docs, _ = _csr(skill_keys, skill_docs, [], len(self._skills))
+        self._title_offsets, self._title_terms = title_offsets, np.asarray(title_sequence, dtype=np.int32)
+        df = np.diff(self._offsets)
+        self._idf = np.log1p((self.size - df + 0.5) / (df + 0.5)).astype(np.float32)
+        avgdl = float(lengths.mean()) if self.size and lengths.mean() > 0 else 1.0
+        self._k1 = k1
+        self._norm = (k1 * (1 - b + b * lengths / avgdl)).astype(np.float32)
+        self._init_cache(max_cached_queries)
+
+    def _init_cache(self, max_cached_queries):
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_cached_queries = max_cached_queries
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in BM25_ARRAYS:
+            np.save(directory / f"{name.lstrip('_')}.npy", getattr(self, name))
+        meta = {"size": self.size, "k1": self._k1, "terms": list(self._terms), "skills": list(self._skills)}
+        (directory / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory, max_cached_queries=64):
+        """save()로 저장한 색인을 읽습니다. 배열은 복사하지 않고 메모리 매핑합니다."""
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        self = cls.__new__(cls)
+        self.size, self._k1 = meta["size"], meta["k1"]
+        self._terms = {term: i for i, term in enumerate(meta["terms"])}
+        self._skills = {skill: i for i, skill in enumerate(meta["skills"])}
+        for name in BM25_ARRAYS:
+            setattr(self, name, np.load(directory / f"{name.lstrip('_')}.npy", mmap_mode="r"))
+        self._init_cache(max_cached_queries)
+        return self
+
+    def _term_scores(self, term):
+        term_id = self._terms.get(term)
+        if term_id is None:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32), np.empty(0, dtype=bool)
+        start, end = self._offsets[term_id], self._offsets[term_id + 1]
+        docs, tfs = self._docs[start:end], self._tfs[start:end]
+        return docs, self._idf[term_id] * tfs * (self._k1 + 1) / (tfs + self._norm[docs]), self._in_title[start:end]
+
+    def _phrase_docs(self, terms):
+        """제목에 terms가 이 순서로 붙어 나오는 공고 번호(오름차순)."""
+        term_ids = [self._terms.get(term) for term in terms]
+        if not term_ids or None in term_ids:
+            return np.empty(0, dtype=np.int32)
+        starts = np.flatnonzero(self._title_terms == term_ids[0])
+        ends = self._title_offsets[np.searchsorted(self._title_offsets, starts, side="right")]
+        for i, term_id in enumerate(term_ids[1:], start=1):
+            keep = starts + i < ends
+            starts, ends = starts[keep], ends[keep]
+            keep = self._title_terms[starts + i] == term_id
+            starts, ends = starts[keep], ends[keep]
+        return np.unique(np.searchsorted(self._title_offsets, starts, side="right") - 1).astype(np.int32)
+
+    def _keyword_scores(self, keyword):
+        """키워드의 모든 토큰이 들어 있는 공고, 토큰 BM25 점수의 합, 제목에 키워드가 구문으로 나오는지 여부."""
+        terms = tokenize(keyword)
+        ids, total, in_title = np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32), np.empty(0, dtype=bool)
+        for i, term in enumerate(dict.fromkeys(terms)):
+            docs, scores, term_in_title = self._term_scores(term)
+            if i == 0:
+                ids, total, in_title = docs, scores, term_in_title
+            else:
+                ids, left, right = np.intersect1d(ids, docs, assume_unique=True, return_indices=True)
+                total, in_title = total[left] + scores[right], in_title[left] & term_in_title[right]
+            if len(ids) == 0:
+                break
+        if len(terms) > 1 and in_title.any():
+            # 토큰이 제목에 모두 있어도 떨어져 있으면 다른 뜻이므로, 후보 중에서 구문으로 나오는 공고만 남깁니다.
+            in_title &= np.isin(ids, self._phrase_docs(terms), assume_unique=True)
+        return ids, total, in_title
+
+    def match(self, keywords):
+        """
+        제목이 키워드 중 하나 이상과 일치하는 공고 번호(오름차순)와 BM25 점수(키워드별 합).
+        점수는 제목과 기술 키워드를 모두 반영하지만, 기술 키워드에만 나온 공고는 후보로 삼지 않습니다.
+        """
+        scores = np.zeros(self.size, dtype=np.float32)
+        title_hit = np.zeros(self.size, dtype=bool)
+        for keyword in keywords:
+            ids, keyword_scores, in_title = self._keyword_scores(keyword)
+            scores[ids] += keyword_scores
+            title_hit[ids[in_title]] = True
+        ids = np.flatnonzero(title_hit)
+        return ids, scores[ids]
+
+    def skill_docs(self, skill):
+        skill_id = self._skills.get(str(skill).casefold())
+        if skill_id is None:
+            return np.empty(0, dtype=np.int32)
+        return self._skill_docs[self._skill_offsets[skill_id]:self._skill_offsets[skill_id + 1]]
+
+    def scores(self, keywords, skill_weights=None):
+        """(공고 번호, 점수). 점수는 BM25에 주요 기술스택 가산점(빈도 비율 × SKILL_BOOST)을 더한 값입니다."""
+        skill_weights = skill_weights or {}
+        key = (tuple(keywords), tuple(sorted(skill_weights.items())))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        ids, scores = self.match(keywords)
+        if skill_weights and len(ids):
+            top = max(skill_weights.values()) or 1.0
+            boost = np.zeros(self.size, dtype=np.float32)
+            for skill, weight in skill_weights.items():
+                boost[self.skill_docs(skill)] += SKILL_BOOST * weight / top
+            scores = scores + boost[ids]
+        with self._lock:
+            self._cache[key] = (ids, scores)
+            while len(self._cache) > self.max_cached_queries:
+                self._cache.popitem(last=False)
+        return ids, scores
+
+
+def classify_titles(titles, categories=None):
+    """
+    제목 목록을 {직무: 행 번호(오름차순)}로 분류합니다. 대시보드 검색(rank_postings)과 같은 토큰·구문 규칙이므로
+    setup_database.py의 직무별 집계가 검색 탭과 같은 공고를 셉니다.
+    """
+    categories = job_category_map if categories is None else categories
+    index = BM25Index(titles, [None] * len(titles))
+    return {job: index.match(keywords)[0] for job, keywords in categories.items()}
+
+
+def top_k(ids, scores, k):
+    """점수가 높은 k개의 공고 번호를 점수 내림차순으로 반환합니다. 동점은 원래 순서(번호가 작은 쪽)를 따릅니다."""
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if len(ids) > k:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        # 경계 점수와 같은 공고가 후보 밖에 남지 않도록, 경계 점수 이상인 공고를 모두 모은 뒤 정렬합니다.
+        keep = scores >= scores[candidates].min()
+        ids, scores = ids[keep], scores[keep]
+    order = np.lexsort((ids, -scores))[:k]
+    return ids[order]
+
+
+def posting_version(rallit_df):
+    """공고 목록이 바뀌면 달라지는 값. 공고를 쓰는 캐시의 키에 넣습니다."""
+    return (len(rallit_df), int(pd.util.hash_pandas_object(rallit_df["url"] if "url" in rallit_df.columns else rallit_df["title"], index=False).sum()))
+
+
+def _index_dir(cache_dir, version):
+    return Path(cache_dir) / "_".join(str(v) for v in (f"v{INDEX_FORMAT}", *version))
+
+
+def save_posting_index(index, cache_dir):
+    """색인을 cache_dir/<지문>/에 저장합니다. 다른 프로세스가 먼저 저장했으면 그대로 둡니다."""
+    target = _index_dir(cache_dir, index["version"])
+    if target.exists():
+        return target
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    index["search"].save(tmp / "search")
+    levels = list(index["level_masks"])
+    for i, level in enumerate(levels):
+        np.save(tmp / f"level_{i}.npy", index["level_masks"][level])
+    meta = {"size": index["size"], "version": list(index["version"]), "categories": index["categories"], "levels": levels}
+    (tmp / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    try:
+        os.rename(tmp, target)
+    except OSError:  # 다른 워커가 먼저 저장한 경우
+        shutil.rmtree(tmp, ignore_errors=True)
+        return target
+    # 이전 지문의 색인은 지웁니다. 아직 매핑 중인 프로세스가 있어도 POSIX에서는 계속 읽을 수 있습니다.
+    for old in Path(cache_dir).iterdir():
+        if old != target and old.is_dir() and not old.name.endswith(".tmp"):
+            shutil.rmtree(old, ignore_errors=True)
+    return target
+
+
+def load_posting_index(cache_dir, version, categories, career_levels):
+    """저장된 색인을 읽습니다. 지문이나 분류 기준이 다르면 None입니다."""
+    directory = _index_dir(cache_dir, version)
+    try:
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    expected_levels = [level for level in career_levels if career_level_pattern(level) is not None]
+    if tuple(meta["version"]) != tuple(version) or meta["categories"] != categories or meta["levels"] != expected_levels:
+        return None
+    index = {"level_masks": {}, "size": meta["size"], "version": tuple(version),
+             "search": BM25Index.load(directory / "search"), "categories": categories}
+    for i, level in enumerate(meta["levels"]):
+        index["level_masks"][level] = np.load(directory / f"level_{i}.npy", mmap_mode="r")
+    return index
+
+
+def build_posting_index(rallit_df, categories=None, career_levels=None, cache_dir=None):
+    """
+    {"level_masks": {경력 수준: 행별 일치 여부}, "size": 전체 행 수, "version": 공고 목록 지문, "search": BM25Index, "categories": {직무: 키워드}} 형태의 색인을 만듭니다.
+    cache_dir에 같은 지문의 색인이 저장되어 있으면 그것을 읽고, 없으면 만든 뒤 저장합니다.
+    """
+    categories = job_category_map if categories is None else categories
+    career_levels = CAREER_OPTIONS if career_levels is None else career_levels
+    index = {"level_masks": {}, "size": 0, "version": None, "search": None, "categories": categories}
+    if rallit_df is None or not all(col in rallit_df.columns for col in ['title', 'jobLevels']):
+        return index
+    version = posting_version(rallit_df)
+    if cache_dir is not None:
+        cached = load_posting_index(cache_dir, version, categories, career_levels)
+        if cached is not None:
+            return cached
+    index["size"] = len(rallit_df)
+    index["version"] = version
+    skills = rallit_df["jobSkillKeywords"].to_numpy(dtype=object) if "jobSkillKeywords" in rallit_df.columns else [None] * len(rallit_df)
+    index["search"] = BM25Index(rallit_df["title"].to_numpy(dtype=object), skills)
+    levels = rallit_df["jobLevels"].astype("string")
+    for level in career_levels:
+        pattern = career_level_pattern(level)
+        if pattern is not None:
+            index["level_masks"][level] = levels.str.contains(pattern, case=False, na=False).to_numpy(dtype=bool)
+    if cache_dir is not None:
+        try:
+            save_posting_index(index, cache_dir)
+        except OSError as e:
+            print(f"[Warning] 공고 색인 저장 실패: {e}")
+    return index
+
+
+def rank_postings(index, interest_job, career_level, skill_weights=None, limit=5):
+    """조건에 맞는 공고 중 BM25 + 기술스택 가산점이 높은 limit개의 행 번호를 반환합니다."""
+    search = index.get("search")
+    keywords = index["categories"].get(interest_job)
+    if search is None or keywords is None:
+        return np.empty(0, dtype=np.intp)
+    ids, scores = search.scores(keywords, skill_weights)
+    if career_level_pattern(career_level) is not None:
+        mask = index["level_masks"].get(career_level)
+        if mask is None:
+            return np.empty(0, dtype=np.intp)
+        ids, scores = ids[mask[ids]], scores[mask[ids]]
+    return top_k(ids, scores, limit)
+
+
+def search_postings(rallit_df, index, interest_job, career_level, limit=None, skill_weights=None):
+    """관련도 순으로 정렬된 공고. limit이 없으면 조건에 맞는 공고 전체를 관련도 순으로 반환합니다."""
+    ids = rank_postings(index, interest_job, career_level, skill_weights, limit if limit is not None else index["size"])
+    return rallit_df.iloc[ids]
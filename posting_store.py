@@ -0,0 +1,184 @@
+"""
+Rallit 채용공고 증분 적재 모듈
+
+data/rallit_*.csv 파일마다 수정 시각·크기·해시를 기록해 두고, 새로 생기거나 바뀐 파일만 읽어
+SQLite 저장소(data/rallit_postings.db)에 반영합니다. url 기준 중복 제거도 바뀐 파일에 속한
+url만 다시 계산하므로, 새로고침 비용이 전체 공고 수가 아니라 변경분에 비례합니다.
+
+    python posting_store.py   # 수동 적재
+"""
+import glob
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_STORE_PATH = "data/rallit_postings.db"
+DEFAULT_CSV_PATTERN = str(Path("data") / "rallit_*.csv")
+
+_sync_lock = threading.Lock()
+
+
+def file_fingerprint(path):
+    stat = Path(path).stat()
+    return stat.st_mtime, stat.st_size
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _connect(store_path):
+    Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(store_path, timeout=30)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS rallit_ingest_manifest (
+        path TEXT PRIMARY KEY,
+        mtime REAL NOT NULL,
+        size INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        rows INTEGER NOT NULL,
+        ingested_at REAL NOT NULL
+    )
+    """)
+    # 파일별 원본 행 (파일 안의 중복 url은 첫 행만 유지)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS rallit_posting_rows (
+        source_file TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        url TEXT NOT NULL,
+        PRIMARY KEY (source_file, url)
+    )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rallit_posting_rows_url ON rallit_posting_rows(url, source_file)")
+    # url당 한 행으로 중복 제거된 공고 (파일명 순서상 먼저 나온 파일의 행이 남습니다)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS rallit_postings (
+        url TEXT PRIMARY KEY,
+        source_file TEXT NOT NULL,
+        seq INTEGER NOT NULL
+    )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rallit_postings_order ON rallit_postings(source_file, seq)")
+    return conn
+
+
+def _table_columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _ensure_columns(conn, columns):
+    for table in ("rallit_posting_rows", "rallit_postings"):
+        existing = set(_table_columns(conn, table))
+        for col in columns:
+            if col not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(col)}")
+
+
+def _replace_file_rows(conn, path, df):
+    """한 파일의 원본 행을 교체하고, 영향을 받은 url의 대표 행을 다시 고릅니다."""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS affected_urls (url TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM affected_urls")
+    conn.execute("INSERT OR IGNORE INTO affected_urls SELECT url FROM rallit_posting_rows WHERE source_file = ?", (path,))
+    conn.execute("DELETE FROM rallit_posting_rows WHERE source_file = ?", (path,))
+    if df is not None and not df.empty:
+        columns = list(df.columns)
+        _ensure_columns(conn, columns)
+        col_sql = ", ".join(_quote(c) for c in ["source_file", "seq"] + columns)
+        placeholders = ", ".join("?" for _ in range(len(columns) + 2))
+        records = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        conn.executemany(
+            f"INSERT INTO rallit_posting_rows ({col_sql}) VALUES ({placeholders})",
+            ((path, seq) + tuple(rec) for seq, rec in enumerate(records)),
+        )
+        conn.executemany("INSERT OR IGNORE INTO affected_urls VALUES (?)", ((u,) for u in df["url"].dropna().unique()))
+    conn.execute("DELETE FROM rallit_postings WHERE url IN (SELECT url FROM affected_urls)")
+    row_columns = ", ".join(_quote(c) for c in _table_columns(conn, "rallit_posting_rows"))
+    conn.execute(f"""
+    INSERT INTO rallit_postings ({row_columns})
+    SELECT {row_columns} FROM rallit_posting_rows r
+    WHERE r.url IN (SELECT url FROM affected_urls)
+      AND r.source_file = (SELECT MIN(source_file) FROM rallit_posting_rows r2 WHERE r2.url = r.url)
+    """)
+
+
+def sync_postings(csv_pattern=DEFAULT_CSV_PATTERN, store_path=DEFAULT_STORE_PATH):
+    """
+    바뀐 CSV만 저장소에 반영하고 {"added": [...], "updated": [...], "removed": [...], "skipped": n, "dropped": n}를 반환합니다.
+    dropped는 url이 없거나 같은 파일 안에서 url이 중복되어 저장하지 않은 행 수입니다.
+    """
+    report = {"added": [], "updated": [], "removed": [], "skipped": 0, "dropped": 0}
+    with _sync_lock:
+        conn = _connect(store_path)
+        try:
+            manifest = {row[0]: row[1:] for row in conn.execute("SELECT path, mtime, size, sha256 FROM rallit_ingest_manifest")}
+            current = sorted(glob.glob(csv_pattern))
+            for path in current:
+                mtime, size = file_fingerprint(path)
+                known = manifest.get(path)
+                if known is not None and known[0] == mtime and known[1] == size:
+                    report["skipped"] += 1
+                    continue
+                digest = file_hash(path)
+                if known is not None and known[2] == digest:
+                    # 내용은 같고 수정 시각만 바뀐 경우
+                    conn.execute("UPDATE rallit_ingest_manifest SET mtime = ?, size = ? WHERE path = ?", (mtime, size, path))
+                    report["skipped"] += 1
+                    continue
+                df = pd.read_csv(path)
+                if "url" not in df.columns:
+                    print(f"[Warning] url 컬럼이 없어 건너뜁니다: {path}")
+                    continue
+                # url이 없는 행은 저장하지 않고, 같은 파일 안의 중복 url은 첫 행만 남깁니다.
+                missing = int(df["url"].isna().sum())
+                df = df.dropna(subset=["url"])
+                duplicated = int(df["url"].duplicated().sum())
+                df = df.drop_duplicates(subset=["url"])
+                if missing or duplicated:
+                    print(f"[Info] {path}: url 없는 행 {missing}개, 중복 url 행 {duplicated}개를 제외했습니다.")
+                    report["dropped"] += missing + duplicated
+                _replace_file_rows(conn, path, df)
+                conn.execute(
+                    "INSERT OR REPLACE INTO rallit_ingest_manifest (path, mtime, size, sha256, rows, ingested_at) VALUES (?,?,?,?,?,?)",
+                    (path, mtime, size, digest, len(df), time.time()),
+                )
+                report["updated" if known is not None else "added"].append(path)
+            for path in set(manifest) - set(current):
+                _replace_file_rows(conn, path, None)
+                conn.execute("DELETE FROM rallit_ingest_manifest WHERE path = ?", (path,))
+                report["removed"].append(path)
+            conn.commit()
+        finally:
+            conn.close()
+    return report
+
+
+def load_postings(csv_pattern=DEFAULT_CSV_PATTERN, store_path=DEFAULT_STORE_PATH):
+    """저장소를 최신 상태로 맞춘 뒤 중복 제거된 공고를 DataFrame으로 반환합니다. 공고가 없으면 None입니다."""
+    sync_postings(csv_pattern, store_path)
+    conn = _connect(store_path)
+    try:
+        columns = [c for c in _table_columns(conn, "rallit_postings") if c not in ("source_file", "seq")]
+        if len(columns) <= 1:
+            return None
+        df = pd.read_sql(f"SELECT {', '.join(_quote(c) for c in columns)} FROM rallit_postings ORDER BY source_file, seq", conn)
+    finally:
+        conn.close()
+    return df if not df.empty else None
+
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    result = sync_postings()
+    print(f"추가 {len(result['added'])}개, 갱신 {len(result['updated'])}개, 삭제 {len(result['removed'])}개, 변경 없음 {result['skipped']}개, 제외한 행 {result['dropped']}개 ({time.perf_counter() - started:.2f}초)")
@@ -0,0 +1,131 @@
+"""
+AI 응답 캐시 모듈
+
+(model, temperature, max_tokens, profile_text, context_text) 내용으로 만든 해시 키에
+LLM 응답을 저장합니다. 메모리 LRU 계층과 선택적인 SQLite 디스크 계층(TTL, 용량 기반 정리)을
+함께 사용하며, 적중/미스 횟수와 절약한 지연 시간·토큰 수를 집계합니다.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_CACHE_DB = "data/llm_cache.db"
+
+
+def make_cache_key(model, temperature, max_tokens, profile_text, context_text):
+    """요청 내용을 정규화해 SHA-256 키를 만듭니다."""
+    payload = json.dumps(
+        [model, round(float(temperature), 4), int(max_tokens), profile_text, context_text],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """메모리 LRU + SQLite 디스크 2단 응답 캐시. 여러 세션/스레드에서 공유해도 안전합니다."""
+
+    def __init__(self, db_path=DEFAULT_CACHE_DB, max_memory_items=256, ttl_seconds=7 * 24 * 3600, max_disk_items=5000):
+        self.max_memory_items = max_memory_items
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_items = max_disk_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0, "saved_seconds": 0.0, "saved_tokens": 0}
+        self._conn = None
+        if db_path:
+            try:
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                # 여러 워커 프로세스가 같은 파일에 읽고 쓰므로 WAL 모드로 열고, 잠금은 timeout초까지 기다립니다.
+                self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    latency REAL NOT NULL DEFAULT 0,
+                    tokens INTEGER NOT NULL DEFAULT 0
+                )
+                """)
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses(last_access)")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"[Warning] 디스크 응답 캐시를 사용할 수 없습니다: {e}")
+                self._conn = None
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry["created_at"] <= self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self._record_hit(entry, "memory_hits")
+                return entry["response"]
+            if entry is not None:
+                del self._memory[key]
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT response, created_at, latency, tokens FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] <= self.ttl_seconds:
+                    self._conn.execute("UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key))
+                    self._conn.commit()
+                    entry = {"response": row[0], "created_at": row[1], "latency": row[2], "tokens": row[3]}
+                    self._remember(key, entry)
+                    self._record_hit(entry, "disk_hits")
+                    return entry["response"]
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key, response, latency=0.0, tokens=0):
+        now = time.time()
+        entry = {"response": response, "created_at": now, "latency": float(latency), "tokens": int(tokens or 0)}
+        with self._lock:
+            self._remember(key, entry)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, created_at, last_access, latency, tokens) VALUES (?,?,?,?,?,?)",
+                    (key, response, now, now, entry["latency"], entry["tokens"]),
+                )
+                self._evict_disk(now)
+                self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_responses")
+                self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_items"] = len(self._memory)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / total if total else 0.0
+        return stats
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def _record_hit(self, entry, tier):
+        self._stats["hits"] += 1
+        self._stats[tier] += 1
+        self._stats["saved_seconds"] += entry["latency"]
+        self._stats["saved_tokens"] += entry["tokens"]
+
+    def _evict_disk(self, now):
+        # 만료된 항목을 지우고, 용량을 넘으면 가장 오래 사용되지 않은 항목부터 정리합니다.
+        self._conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        self._conn.execute(
+            "DELETE FROM llm_responses WHERE key IN (SELECT key FROM llm_responses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_items,),
+        )
@@ -1,33 +1,278 @@
 #!/usr/bin/env python3
 """
 Job-Fit Insight Dashboard 실행 스크립트
+
+    python run_dashboard.py                 # streamlit 프로세스 하나 (기본)
+    python run_dashboard.py --workers 4     # 워커 4개 + 로컬 프록시
+
+--workers가 2 이상이면 워커마다 별도 포트에서 streamlit을 띄우고, 앞단의 작은 프록시가 --port로 받은 연결을 나눠 줍니다.
+- 새 브라우저는 준비된 워커에 라운드 로빈으로 배정하고, 쿠키(jobfit_worker)로 같은 워커에 계속 붙입니다.
+  Streamlit 세션 상태와 이미지(media) 파일은 워커 메모리에 있으므로 연결마다 워커를 바꾸면 안 됩니다.
+- 워커를 띄우기 전에 공고 컬럼형 파일(Feather)과 공고 색인을 한 번 만들어 두어, 워커는 load_all_data에서
+  다시 계산하지 않고 메모리 매핑으로 읽습니다. SQLite DB, AI 응답 캐시, 워드 클라우드 캐시는 원래 디스크에서 공유됩니다.
+  성능 지표는 워커마다 data/metrics.<워커 번호>.prom에 worker 레이블을 붙여 따로 내보냅니다.
+- 워커는 /_stcore/health가 응답한 뒤 /_stcore/script-health-check로 스크립트를 한 번 실행해 캐시를 채운 다음에야
+  트래픽을 받습니다. 실행 중에도 주기적으로 상태를 확인해, 응답이 없거나 종료된 워커는 빼고 다시 띄웁니다.
 """
+import argparse
+import asyncio
+import itertools
+import os
+import re
+import signal
 import subprocess
 import sys
+import time
+import urllib.request
 from pathlib import Path
 
+DASHBOARD_FILE = "job_fit_dashboard.py"
+DB_FILE = Path("data/job_fit_insight.db")
+WORKER_COOKIE = "jobfit_worker"
+WORKER_COOKIE_PATTERN = re.compile(rb"^cookie:.*?\b" + WORKER_COOKIE.encode() + rb"=(\d+)", re.I | re.M)
+HEALTH_TIMEOUT = 60.0
+PREWARM_TIMEOUT = 180.0
+HEALTH_INTERVAL = 5.0
+MAX_HEALTH_FAILURES = 3
+
+
+def run_single(port, address):
+    subprocess.run([
+        sys.executable, "-m", "streamlit", "run",
+        DASHBOARD_FILE,
+        f"--server.port={port}",
+        f"--server.address={address}"
+    ], check=True)
+
+
+def prepare_shared_data():
+    """워커들이 공유할 공고 컬럼형 파일과 색인을 미리 만듭니다."""
+    from posting_columnar import DEFAULT_COLUMNAR_PATH, load_compact_postings
+    from posting_index import DEFAULT_INDEX_DIR, build_posting_index
+
+    started = time.perf_counter()
+    rallit_df = load_compact_postings(DEFAULT_COLUMNAR_PATH)
+    index = build_posting_index(rallit_df, cache_dir=DEFAULT_INDEX_DIR)
+    print(f"📦 공유 데이터 준비 완료: 공고 {index['size']:,}건 -> {DEFAULT_COLUMNAR_PATH}, {DEFAULT_INDEX_DIR} ({time.perf_counter() - started:.1f}초)")
+
+
+def _http_get(url, timeout):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status, response.read().decode("utf-8", "replace").strip()
+    except Exception as e:
+        return None, str(e)
+
+
+class Worker:
+    def __init__(self, number, port):
+        self.number = number
+        self.port = port
+        self.process = None
+        self.ready = False
+        self.failures = 0
+
+    def start(self):
+        self.ready = False
+        self.failures = 0
+        self.process = subprocess.Popen([
+            sys.executable, "-m", "streamlit", "run", DASHBOARD_FILE,
+            f"--server.port={self.port}",
+            "--server.address=127.0.0.1",
+            "--server.headless=true",
+            "--server.scriptHealthCheckEnabled=true",
+            "--browser.gatherUsageStats=false",
+        ], stdout=subprocess.DEVNULL, env={**os.environ, "JOBFIT_WORKER": str(self.number)})  # 성능 지표를 워커별 파일에 씁니다.
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.port}{path}"
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    async def warm_up(self):
+        """health 응답을 기다린 뒤 스크립트를 한 번 실행해 캐시를 채웁니다. 성공하면 True입니다."""
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + HEALTH_TIMEOUT
+        while time.monotonic() < deadline:
+            if not self.alive():
+                return False
+            status, _ = await loop.run_in_executor(None, _http_get, self.url("/_stcore/health"), 2.0)
+            if status == 200:
+                break
+            await asyncio.sleep(0.5)
+        else:
+            return False
+        started = time.perf_counter()
+        status, body = await loop.run_in_executor(None, _http_get, self.url("/_stcore/script-health-check"), PREWARM_TIMEOUT)
+        if status != 200:
+            print(f"⚠️ 워커 {self.number} (포트 {self.port}) 예열 실패: {body}")
+            return False
+        print(f"🔥 워커 {self.number} (포트 {self.port}) 준비 완료 (예열 {time.perf_counter() - started:.1f}초)")
+        return True
+
+    def stop(self):
+        if self.alive():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class WorkerPool:
+    def __init__(self, count, base_port):
+        self.workers = [Worker(i, base_port + i) for i in range(count)]
+        self._round_robin = itertools.cycle(range(count))
+
+    def ready_workers(self):
+        return [w for w in self.workers if w.ready]
+
+    def pick(self, preferred=None):
+        """쿠키의 워커가 준비되어 있으면 그대로, 아니면 라운드 로빈으로 다음 준비된 워커를 고릅니다."""
+        if preferred is not None and 0 <= preferred < len(self.workers) and self.workers[preferred].ready:
+            return self.workers[preferred]
+        for _ in range(len(self.workers)):
+            worker = self.workers[next(self._round_robin)]
+            if worker.ready:
+                return worker
+        return None
+
+    async def start_worker(self, worker):
+        worker.start()
+        worker.ready = await worker.warm_up()
+        if not worker.ready:
+            worker.stop()
+        return worker.ready
+
+    async def monitor(self):
+        """주기적으로 상태를 확인하고, 종료됐거나 연속으로 응답하지 않는 워커를 빼고 다시 띄웁니다."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(HEALTH_INTERVAL)
+            for worker in self.workers:
+                if worker.ready and worker.alive():
+                    status, _ = await loop.run_in_executor(None, _http_get, worker.url("/_stcore/health"), 2.0)
+                    worker.failures = 0 if status == 200 else worker.failures + 1
+                    if worker.failures < MAX_HEALTH_FAILURES:
+                        continue
+                if worker.ready or not worker.alive():
+                    print(f"♻️ 워커 {worker.number} (포트 {worker.port})를 다시 시작합니다.")
+                    worker.ready = False
+                    worker.stop()
+                    asyncio.ensure_future(self.start_worker(worker))
+
+    def stop(self):
+        for worker in self.workers:
+            worker.stop()
+
+
+async def _pipe(reader, writer):
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        try:
+            writer.close()
+        except Exception:
+            pass
+
+
+def _with_cookie(response_head, worker):
+    cookie = f"Set-Cookie: {WORKER_COOKIE}={worker.number}; Path=/; HttpOnly; SameSite=Lax\r\n".encode()
+    return response_head[:-2] + cookie + b"\r\n"
+
+
+async def handle_client(pool, client_reader, client_writer):
+    """첫 요청 헤더의 쿠키로 워커를 정한 뒤, 이후 바이트는 양방향으로 그대로 전달합니다 (WebSocket 포함)."""
+    try:
+        head = await client_reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        client_writer.close()
+        return
+    match = WORKER_COOKIE_PATTERN.search(head)
+    preferred = int(match.group(1)) if match else None
+    worker = pool.pick(preferred)
+    if worker is None:
+        client_writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nRetry-After: 5\r\nConnection: close\r\n\r\n")
+        await client_writer.drain()
+        client_writer.close()
+        return
+    try:
+        backend_reader, backend_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+    except OSError:
+        worker.failures = MAX_HEALTH_FAILURES  # 다음 상태 확인 때 다시 띄웁니다.
+        client_writer.close()
+        return
+    backend_writer.write(head)
+    await backend_writer.drain()
+    if preferred != worker.number:
+        # 처음 온 브라우저이거나 워커가 바뀐 경우 응답 헤더에 워커 쿠키를 붙입니다.
+        try:
+            response_head = await backend_reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            backend_writer.close()
+            client_writer.close()
+            return
+        client_writer.write(_with_cookie(response_head, worker))
+    await asyncio.gather(_pipe(client_reader, backend_writer), _pipe(backend_reader, client_writer))
+
+
+async def serve(workers, port, address, base_port):
+    pool = WorkerPool(workers, base_port)
+    try:
+        starts = [asyncio.ensure_future(pool.start_worker(w)) for w in pool.workers]
+        # 워커가 하나라도 준비되면 받기 시작하고, 나머지는 준비되는 대로 순번에 들어갑니다.
+        for started in asyncio.as_completed(starts):
+            if await started:
+                break
+        if not pool.ready_workers():
+            print("❌ 준비된 워커가 없습니다. 'streamlit run job_fit_dashboard.py'로 단독 실행해 오류를 확인해주세요.")
+            return
+        server = await asyncio.start_server(lambda r, w: handle_client(pool, r, w), address, port)
+        print(f"📊 브라우저에서 http://{address}:{port} 을 열어주세요. (워커 {workers}개, 포트 {base_port}-{base_port + workers - 1})")
+        print("⏹️  종료하려면 Ctrl+C를 누르세요.")
+        print("-" * 50)
+        monitor = asyncio.ensure_future(pool.monitor())
+        async with server:
+            await server.serve_forever()
+        monitor.cancel()
+    finally:
+        pool.stop()
+
+
 def main():
-    dashboard_file = "job_fit_dashboard.py"
-    db_file = Path("data/job_fit_insight.db")
+    parser = argparse.ArgumentParser(description="Job-Fit Insight Dashboard 실행")
+    parser.add_argument("--workers", type=int, default=1, help="streamlit 워커 프로세스 수 (2 이상이면 프록시 사용)")
+    parser.add_argument("--port", type=int, default=8501)
+    parser.add_argument("--address", default="localhost")
+    parser.add_argument("--worker-base-port", type=int, default=None, help="워커 포트 시작 번호 (기본: --port + 1)")
+    args = parser.parse_args()
 
-    if not db_file.exists():
-        print(f"❌ 오류: 데이터베이스 파일('{db_file}')을 찾을 수 없습니다.")
+    if not DB_FILE.exists():
+        print(f"❌ 오류: 데이터베이스 파일('{DB_FILE}')을 찾을 수 없습니다.")
         print("💡 'setup_database.py'를 먼저 실행하여 데이터베이스를 생성해주세요.")
         print("👉 python setup_database.py")
         sys.exit(1)
 
     print("🚀 Job-Fit Insight Dashboard를 시작합니다...")
-    print("📊 브라우저에서 http://localhost:8501 을 열어주세요.")
-    print("⏹️  종료하려면 Ctrl+C를 누르세요.")
-    print("-" * 50)
-    
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
-            dashboard_file,
-            "--server.port=8501",
-            "--server.address=localhost"
-        ], check=True)
+        if args.workers <= 1:
+            print(f"📊 브라우저에서 http://{args.address}:{args.port} 을 열어주세요.")
+            print("⏹️  종료하려면 Ctrl+C를 누르세요.")
+            print("-" * 50)
+            run_single(args.port, args.address)
+        else:
+            # docker stop / systemd 종료(SIGTERM)에서도 워커를 정리하도록 Ctrl+C와 같게 처리합니다.
+            signal.signal(signal.SIGTERM, signal.default_int_handler)
+            prepare_shared_data()
+            asyncio.run(serve(args.workers, args.port, args.address, args.worker_base_port or args.port + 1))
     except KeyboardInterrupt:
         print("\n👋 대시보드를 종료합니다.")
     except Exception as e:
@@ -1,6 +1,394 @@
 import sqlite3
+import hashlib
+import re
+import time
+import numpy as np
 import pandas as pd
+from collections import Counter
 from pathlib import Path
+from db_pool import enable_wal
+from job_fit_scoring import write_job_fit_weights
+from posting_index import classify_titles
+
+KOSIS_PERIOD_PATTERN = re.compile(r"^\d{4}(\.\d{2})?$")
+KOSIS_TIMESTAMP_SUFFIX = re.compile(r"_(\d{14})$")
+KOSIS_UNIT_PATTERN = re.compile(r"^(.*?)\s*\(([^()]*)\)\s*$")
+# 항목명 끝 괄호 중 단위로 볼 값. '건강보험(직장가입자)', '…증감(전년동월)'처럼 단위가 아닌 괄호는 항목명에 남깁니다.
+KOSIS_UNITS = {"%", "%p", "명", "천명", "만명", "개", "천개", "개소", "원", "천원", "만원", "백만원", "억원", "시간", "세", "건", "가구", "천가구", "배"}
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _kosis_source_name(path):
+    """'성_연령별_실업률_20250621090112.xlsx' -> '성_연령별_실업률'"""
+    return KOSIS_TIMESTAMP_SUFFIX.sub("", Path(path).stem)
+
+def _kosis_period(value):
+    if isinstance(value, float):
+        value = f"{value:.2f}"
+    value = str(value).strip()
+    return value if KOSIS_PERIOD_PATTERN.match(value) else None
+
+def _split_kosis_unit(item):
+    """'실업률 (%)' -> ('실업률', '%'). 끝 괄호가 알려진 단위가 아니면 (item, None)입니다."""
+    match = KOSIS_UNIT_PATTERN.match(item)
+    if match is None or match.group(2).strip() not in KOSIS_UNITS:
+        return item, None
+    return match.group(1), match.group(2).strip()
+
+def parse_kosis_workbook(path):
+    """
+    KOSIS 엑셀(가로형: 분류 열 + 시점별 열)을 세로형 DataFrame으로 바꿉니다.
+    반환 컬럼: 항목, 단위, 분류1, 분류2, 시점, 값 / 분류 이름 목록
+    """
+    raw = pd.read_excel(path, header=None, dtype=object)
+    periods = [_kosis_period(v) for v in raw.iloc[0]]
+    value_cols = [i for i, p in enumerate(periods) if p is not None]
+    if not value_cols:
+        raise ValueError(f"시점 열을 찾을 수 없습니다: {path}")
+    dim_cols = list(range(value_cols[0]))
+    dim_names = [str(raw.iat[0, c]) for c in dim_cols]
+    # 두 번째 행의 분류 칸이 첫 행과 같으면 항목(지표명) 헤더가 한 줄 더 있는 형식입니다.
+    two_header_rows = len(raw) > 1 and all(str(raw.iat[1, c]) == dim_names[i] for i, c in enumerate(dim_cols))
+    if two_header_rows:
+        items = [str(raw.iat[1, c]).strip() for c in value_cols]
+        body = raw.iloc[2:]
+    else:
+        items = [_kosis_source_name(path).split("_")[-1]] * len(value_cols)
+        body = raw.iloc[1:]
+    dims = body.iloc[:, dim_cols].ffill().astype(str).apply(lambda col: col.str.strip())
+    values = body.iloc[:, value_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+
+    n_rows, n_cols = values.shape
+    item_unit = [_split_kosis_unit(item) for item in items]
+    long_df = pd.DataFrame({
+        "항목": [name for name, _ in item_unit] * n_rows,
+        "단위": [unit for _, unit in item_unit] * n_rows,
+        "시점": [periods[c] for c in value_cols] * n_rows,
+        "값": values.reshape(-1),
+    })
+    for i, name in enumerate(["분류1", "분류2"]):
+        long_df[name] = dims.iloc[:, i].repeat(n_cols).to_numpy() if i < len(dim_cols) else None
+    if len(dim_cols) > 2:
+        # 분류가 세 단계 이상이면 나머지를 분류2에 이어 붙입니다.
+        long_df["분류2"] = dims.iloc[:, 1:].agg(" / ".join, axis=1).repeat(n_cols).to_numpy()
+    long_df = long_df.dropna(subset=["값"])
+    return long_df[["항목", "단위", "분류1", "분류2", "시점", "값"]], dim_names
+
+def load_kosis_workbooks(conn, data_dir="data"):
+    """
+    data/ 폴더의 KOSIS 엑셀을 kosis_observations 테이블에 적재합니다.
+    같은 통계표의 파일이 여러 개면 가장 최근 파일만 사용하며, 해시가 같은 파일은 다시 읽지 않습니다.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS kosis_sources (
+        source TEXT PRIMARY KEY,
+        path TEXT NOT NULL,
+        mtime REAL NOT NULL,
+        size INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        분류1_이름 TEXT,
+        분류2_이름 TEXT,
+        rows INTEGER NOT NULL,
+        loaded_at REAL NOT NULL
+    )
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS kosis_observations (
+        source TEXT NOT NULL,
+        항목 TEXT NOT NULL,
+        단위 TEXT,
+        분류1 TEXT,
+        분류2 TEXT,
+        시점 TEXT NOT NULL,
+        값 REAL NOT NULL
+    )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_kosis_obs_series ON kosis_observations(source, 항목, 시점)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_kosis_obs_dims ON kosis_observations(source, 분류1, 분류2)")
+
+    latest = {}
+    for path in sorted(Path(data_dir).glob("*.xlsx")):
+        latest[_kosis_source_name(path)] = path  # 파일명 끝의 타임스탬프 순으로 정렬되므로 마지막 파일이 최신
+    known = {row[0]: row[1:] for row in cursor.execute("SELECT source, mtime, size, sha256 FROM kosis_sources")}
+    # 단위가 아닌 괄호('직장가입자', '전년동월')를 단위로 떼어 저장했던 통계표는 파일이 같아도 다시 읽습니다.
+    units = sorted(KOSIS_UNITS)
+    stale = {row[0] for row in cursor.execute(
+        f"SELECT DISTINCT source FROM kosis_observations WHERE 단위 IS NOT NULL AND 단위 NOT IN ({','.join('?' * len(units))})", units)}
+
+    loaded, skipped = 0, 0
+    for source, path in latest.items():
+        stat = path.stat()
+        prev = None if source in stale else known.get(source)
+        if prev is not None and prev[0] == stat.st_mtime and prev[1] == stat.st_size:
+            skipped += 1
+            continue
+        digest = _file_sha256(path)
+        if prev is not None and prev[2] == digest:
+            cursor.execute("UPDATE kosis_sources SET path = ?, mtime = ?, size = ? WHERE source = ?", (str(path), stat.st_mtime, stat.st_size, source))
+            skipped += 1
+            continue
+        try:
+            long_df, dim_names = parse_kosis_workbook(path)
+        except Exception as e:
+            print(f"'{path.name}' 파일을 읽지 못했습니다: {e}")
+            continue
+        cursor.execute("DELETE FROM kosis_observations WHERE source = ?", (source,))
+        long_df.insert(0, "source", source)
+        long_df.to_sql("kosis_observations", conn, if_exists="append", index=False)
+        dim_names = dim_names + [None] * (2 - len(dim_names))
+        cursor.execute(
+            "INSERT OR REPLACE INTO kosis_sources (source, path, mtime, size, sha256, 분류1_이름, 분류2_이름, rows, loaded_at) VALUES (?,?,?,?,?,?,?,?,?)",
+            (source, str(path), stat.st_mtime, stat.st_size, digest, dim_names[0], dim_names[1], len(long_df), time.time()),
+        )
+        loaded += 1
+    removed = set(known) - set(latest)
+    for source in removed:
+        cursor.execute("DELETE FROM kosis_observations WHERE source = ?", (source,))
+        cursor.execute("DELETE FROM kosis_sources WHERE source = ?", (source,))
+    conn.commit()
+    print(f"KOSIS 통계표 적재 완료: 신규/변경 {loaded}개, 변경 없음 {skipped}개, 삭제 {len(removed)}개.")
+
+KOSIS_EMPLOYMENT_SOURCE = "성_연령별_경제활동인구"
+KOSIS_GENDER_LABELS = {"계": "전체", "남자": "남성", "여자": "여성"}
+TREND_COLUMNS = ["연령계층별", "성별", "월", "실업률", "경제활동인구", "취업자"]
+
+def generate_sample_youth_data():
+    data = {'성별': ['남성', '여성', '남성', '여성'], '연령계층별': ['15-29세', '15-29세', '30-39세', '30-39세'], '2025.03_실업률': [6.8, 6.1, 3.1, 3.5], '2025.03_경제활동인구': [2450000, 2150000, 3400000, 3100000], '2025.03_취업자': [2283000, 2018000, 3295000, 2990000], '2025.04_실업률': [7.0, 6.3, 3.2, 3.6], '2025.04_경제활동인구': [2460000, 2160000, 3420000, 3120000], '2025.04_취업자': [2287000, 2023000, 3310000, 3010000], '2025.05_실업률': [6.9, 6.2, 3.0, 3.4], '2025.05_경제활동인구': [2470000, 2170000, 3430000, 3130000], '2025.05_취업자': [2299000, 2035000, 3325000, 3020000]}
+    return pd.DataFrame(data)
+
+def _employment_trend_from_kosis(conn):
+    query = """
+    SELECT 분류1 AS 성별, 분류2 AS 연령계층별, 시점 AS 월, 항목, 단위, 값
+    FROM kosis_observations
+    WHERE source = ? AND 항목 IN ('실업률', '경제활동인구', '취업자')
+    """
+    try:
+        long_df = pd.read_sql(query, conn, params=(KOSIS_EMPLOYMENT_SOURCE,))
+    except pd.io.sql.DatabaseError:
+        return None
+    if long_df.empty:
+        return None
+    long_df.loc[long_df["단위"] == "천명", "값"] *= 1000  # 대시보드는 명 단위를 기준으로 표시합니다.
+    long_df["성별"] = long_df["성별"].replace(KOSIS_GENDER_LABELS)
+    return long_df
+
+def _employment_trend_from_youth_summary(youth_df):
+    youth_df = youth_df.copy()
+    if "연령계층별" not in youth_df.columns:
+        youth_df["연령계층별"] = "15-29세"  # 기본 youth_summary 스키마는 청년층(15-29세) 한 구간만 담고 있습니다.
+    youth_df["성별"] = youth_df["성별"].fillna("미상")
+    metric_cols = [c for c in youth_df.columns if re.match(r"^\d{4}\.\d{2}_", str(c))]
+    long_df = youth_df.melt(id_vars=["성별", "연령계층별"], value_vars=metric_cols, var_name="월_항목", value_name="값")
+    long_df[["월", "항목"]] = long_df["월_항목"].str.split("_", n=1, expand=True)
+    return long_df.drop(columns="월_항목")
+
+def compute_employment_trend(conn):
+    """
+    고용 동향 차트용 세로형 데이터를 만듭니다.
+    KOSIS 통계표가 있으면 그것을, 없으면 youth_summary(또는 예시 데이터)를 사용하며 '전체' 성별 합계를 포함합니다.
+    """
+    long_df = _employment_trend_from_kosis(conn)
+    if long_df is None:
+        try:
+            youth_df = pd.read_sql("SELECT * FROM youth_summary", conn)
+        except pd.io.sql.DatabaseError:
+            youth_df = generate_sample_youth_data()
+        long_df = _employment_trend_from_youth_summary(youth_df)
+    long_df["연령계층별"] = long_df["연령계층별"].str.replace(" ", "", regex=False)
+    trend_df = long_df.pivot_table(index=["연령계층별", "성별", "월"], columns="항목", values="값", aggfunc="first").reset_index()
+    trend_df.columns.name = None
+    if not (trend_df["성별"] == "전체").any():
+        overall = trend_df.groupby(["연령계층별", "월"], as_index=False).agg(실업률=("실업률", "mean"), 경제활동인구=("경제활동인구", "sum"), 취업자=("취업자", "sum"))
+        overall["성별"] = "전체"
+        trend_df = pd.concat([trend_df, overall], ignore_index=True)
+    return trend_df[TREND_COLUMNS].sort_values(["월", "연령계층별", "성별"]).reset_index(drop=True)
+
+def build_employment_trend(conn):
+    """employment_trend 테이블을 (연령계층별, 성별, 월) 기본키로 다시 만듭니다."""
+    trend_df = compute_employment_trend(conn)
+    cursor = conn.cursor()
+    cursor.execute("DROP TABLE IF EXISTS employment_trend")
+    cursor.execute("""
+    CREATE TABLE employment_trend (
+        연령계층별 TEXT NOT NULL,
+        성별 TEXT NOT NULL,
+        월 TEXT NOT NULL,
+        실업률 REAL,
+        경제활동인구 INTEGER,
+        취업자 INTEGER,
+        PRIMARY KEY (연령계층별, 성별, 월)
+    )
+    """)
+    trend_df.to_sql("employment_trend", conn, if_exists="append", index=False)
+    conn.commit()
+    print(f"'employment_trend' 테이블 생성 완료 ({len(trend_df)}행).")
+
+POSTING_CSV_PATTERN = "rallit_*.csv"
+POSTING_AGG_COLUMNS = ["url", "title", "jobSkillKeywords", "jobLevels"]
+TOP_SKILLS_PER_JOB = 10
+
+def _split_keywords(series):
+    """'Figma, ChatGPT' 같은 쉼표 구분 문자열을 (원래 행 번호, 값) 세로형 Series로 펼칩니다."""
+    exploded = series.dropna().astype(str).str.split(",").explode().str.strip()
+    return exploded[exploded != ""]
+
+def _url_hashes(urls):
+    """url을 SQLite INTEGER에 들어가는 64비트 해시(부호 있는 정수) 목록으로 바꿉니다."""
+    return pd.util.hash_array(urls.to_numpy(dtype=object)).view(np.int64).tolist()
+
+def aggregate_posting_file(path, earlier_urls=frozenset(), chunksize=50_000):
+    """
+    공고 CSV 한 개를 chunksize 행씩 읽어 직무별 기술스택 빈도와 경력 수준별 공고 수를 셉니다.
+    직무는 posting_index.classify_titles(대시보드 검색과 같은 규칙)로 분류하며, 한 공고가 여러 직무에 속할 수 있습니다.
+    대시보드의 공고 저장소(posting_store.py)처럼 url이 없는 행, 같은 파일 안의 중복, earlier_urls(앞 파일들의 url 해시)에
+    있는 공고는 세지 않습니다. (기술 카운터, 경력 카운터, 센 공고 수, 이 파일의 url 해시 집합)을 반환합니다.
+    """
+    skill_counts, level_counts = Counter(), Counter()
+    file_urls, rows = set(), 0
+    for chunk in pd.read_csv(path, chunksize=chunksize, usecols=lambda c: c in POSTING_AGG_COLUMNS, dtype=str):
+        if "url" in chunk.columns:
+            # url 문자열 대신 64비트 해시만 기억합니다.
+            chunk = chunk[chunk["url"].notna()]
+            keep = []
+            for h in _url_hashes(chunk["url"]):
+                keep.append(h not in file_urls and h not in earlier_urls)
+                file_urls.add(h)
+            chunk = chunk[keep]
+        rows += len(chunk)
+        if "title" not in chunk.columns or chunk.empty:
+            continue
+        skills = _split_keywords(chunk["jobSkillKeywords"]) if "jobSkillKeywords" in chunk.columns else pd.Series(dtype=str)
+        levels = _split_keywords(chunk["jobLevels"]) if "jobLevels" in chunk.columns else pd.Series(dtype=str)
+        for job, ids in classify_titles(chunk["title"].to_numpy(dtype=object)).items():
+            matched = chunk.index[ids]
+            if matched.empty:
+                continue
+            for value, count in skills[skills.index.isin(matched)].value_counts().items():
+                skill_counts[(job, value)] += int(count)
+            for value, count in levels[levels.index.isin(matched)].value_counts().items():
+                level_counts[(job, value)] += int(count)
+    return skill_counts, level_counts, rows, file_urls
+
+def build_posting_aggregates(conn, data_dir="data", top_k=TOP_SKILLS_PER_JOB):
+    """
+    data/rallit_*.csv에서 top10_skills_per_job과 joblevel_counts를 다시 만듭니다.
+    파일별 집계(posting_skill_partials, posting_level_partials)를 보관해 두고 새로 생기거나 바뀐 파일만 다시 집계하므로,
+    공고 파일이 추가될 때의 비용은 추가된 파일 크기에 비례합니다.
+    url이 여러 파일에 있으면 파일 이름 순으로 처음 나온 파일에서만 셉니다. 이를 위해 파일별 url 해시(posting_agg_urls)를
+    보관하고, 앞 파일이 바뀌거나 지워지면 그 파일과 url이 겹치는 뒤 파일도 다시 집계합니다.
+    공고 파일이 하나도 없으면 기존 표본 데이터를 그대로 둡니다.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS posting_agg_files (
+        path TEXT PRIMARY KEY,
+        mtime REAL NOT NULL,
+        size INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        rows INTEGER NOT NULL,
+        aggregated_at REAL NOT NULL
+    )
+    """)
+    cursor.execute("CREATE TABLE IF NOT EXISTS posting_skill_partials (source_file TEXT NOT NULL, 직무 TEXT NOT NULL, 기술스택 TEXT NOT NULL, 빈도 INTEGER NOT NULL)")
+    cursor.execute("CREATE TABLE IF NOT EXISTS posting_level_partials (source_file TEXT NOT NULL, 직무 TEXT NOT NULL, jobLevels TEXT NOT NULL, 공고수 INTEGER NOT NULL)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_posting_skill_partials_file ON posting_skill_partials(source_file)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_posting_level_partials_file ON posting_level_partials(source_file)")
+    # url 해시 테이블이 없던 DB는 파일 간 중복 제거와 현재 직무 분류 규칙 이전에 집계된 것이므로 모두 다시 집계합니다.
+    upgrade = cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posting_agg_urls'").fetchone() is None
+    if upgrade:
+        for table in ("posting_skill_partials", "posting_level_partials", "posting_agg_files"):
+            cursor.execute(f"DELETE FROM {table}")
+    cursor.execute("CREATE TABLE IF NOT EXISTS posting_agg_urls (source_file TEXT NOT NULL, url_hash INTEGER NOT NULL, PRIMARY KEY (source_file, url_hash)) WITHOUT ROWID")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_posting_agg_urls_hash ON posting_agg_urls(url_hash)")
+    # 이번 실행에서 바뀐 파일들의 (이전·현재) url 해시. 뒤 파일 중 이 url을 가진 파일은 다시 집계해야 합니다.
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS posting_agg_changed_urls (url_hash INTEGER PRIMARY KEY)")
+    cursor.execute("DELETE FROM posting_agg_changed_urls")
+
+    def clear_file(name):
+        cursor.execute("INSERT OR IGNORE INTO posting_agg_changed_urls SELECT url_hash FROM posting_agg_urls WHERE source_file = ?", (name,))
+        for table in ("posting_skill_partials", "posting_level_partials"):
+            cursor.execute(f"DELETE FROM {table} WHERE source_file = ?", (name,))
+        cursor.execute("DELETE FROM posting_agg_urls WHERE source_file = ?", (name,))
+
+    def overlaps_changed(name):
+        return cursor.execute(
+            "SELECT EXISTS(SELECT 1 FROM posting_agg_urls u JOIN posting_agg_changed_urls c USING (url_hash) WHERE u.source_file = ?)", (name,)
+        ).fetchone()[0]
+
+    current = {str(path): path for path in sorted(Path(data_dir).glob(POSTING_CSV_PATTERN))}
+    known = {} if upgrade else {row[0]: row[1:] for row in cursor.execute("SELECT path, mtime, size, sha256 FROM posting_agg_files")}
+    removed = set(known) - set(current)
+    for name in removed:
+        clear_file(name)
+        cursor.execute("DELETE FROM posting_agg_files WHERE path = ?", (name,))
+
+    aggregated, skipped = 0, 0
+    earlier = []
+    for name, path in current.items():
+        stat = path.stat()
+        prev = known.get(name)
+        changed = True
+        if prev is not None and prev[0] == stat.st_mtime and prev[1] == stat.st_size:
+            changed, digest = False, prev[2]
+        else:
+            digest = _file_sha256(path)
+            if prev is not None and prev[2] == digest:
+                cursor.execute("UPDATE posting_agg_files SET mtime = ?, size = ? WHERE path = ?", (stat.st_mtime, stat.st_size, name))
+                changed = False
+        if not changed and not overlaps_changed(name):
+            skipped += 1
+            earlier.append(name)
+            continue
+        earlier_urls = {h for other in earlier for (h,) in cursor.execute("SELECT url_hash FROM posting_agg_urls WHERE source_file = ?", (other,))}
+        skill_counts, level_counts, rows, file_urls = aggregate_posting_file(path, earlier_urls)
+        if changed:
+            clear_file(name)
+        else:  # url은 그대로이고 앞 파일과의 중복만 달라졌으므로, 뒤 파일에 영향을 주지 않습니다.
+            for table in ("posting_skill_partials", "posting_level_partials"):
+                cursor.execute(f"DELETE FROM {table} WHERE source_file = ?", (name,))
+            cursor.execute("DELETE FROM posting_agg_urls WHERE source_file = ?", (name,))
+        cursor.executemany("INSERT INTO posting_skill_partials VALUES (?,?,?,?)", ((name, job, skill, n) for (job, skill), n in skill_counts.items()))
+        cursor.executemany("INSERT INTO posting_level_partials VALUES (?,?,?,?)", ((name, job, level, n) for (job, level), n in level_counts.items()))
+        cursor.executemany("INSERT INTO posting_agg_urls VALUES (?,?)", ((name, h) for h in file_urls))
+        if changed:
+            cursor.executemany("INSERT OR IGNORE INTO posting_agg_changed_urls VALUES (?)", ((h,) for h in file_urls))
+        cursor.execute(
+            "INSERT OR REPLACE INTO posting_agg_files (path, mtime, size, sha256, rows, aggregated_at) VALUES (?,?,?,?,?,?)",
+            (name, stat.st_mtime, stat.st_size, digest, rows, time.time()),
+        )
+        aggregated += 1
+        earlier.append(name)
+
+    if current:
+        # 파일별 집계를 합산해 대시보드가 읽는 두 테이블을 교체합니다.
+        cursor.execute("DELETE FROM top10_skills_per_job")
+        cursor.execute("""
+        INSERT INTO top10_skills_per_job (직무, 기술스택, 빈도)
+        SELECT 직무, 기술스택, 빈도 FROM (
+            SELECT 직무, 기술스택, SUM(빈도) AS 빈도,
+                   ROW_NUMBER() OVER (PARTITION BY 직무 ORDER BY SUM(빈도) DESC, 기술스택) AS 순위
+            FROM posting_skill_partials GROUP BY 직무, 기술스택
+        ) WHERE 순위 <= ?
+        """, (top_k,))
+        cursor.execute("DELETE FROM joblevel_counts")
+        cursor.execute("INSERT INTO joblevel_counts (직무, jobLevels, 공고수) SELECT 직무, jobLevels, SUM(공고수) FROM posting_level_partials GROUP BY 직무, jobLevels")
+    conn.commit()
+    print(f"채용공고 집계 완료: 신규/변경 {aggregated}개, 변경 없음 {skipped}개, 삭제 {len(removed)}개.")
+
+def create_query_indexes(conn):
+    """대시보드 조회 계층(market_queries.py)이 사용하는 필터 컬럼에 인덱스를 만듭니다."""
+    cursor = conn.cursor()
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_top10_skills_job ON top10_skills_per_job(직무, 빈도)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_joblevel_counts_job ON joblevel_counts(직무, jobLevels)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_employment_trend_month ON employment_trend(월)")
+    conn.commit()
+    print("조회용 인덱스 생성 완료.")
 
 def create_db_and_tables(db_path="data/job_fit_insight.db"):
     """SQLite 데이터베이스와 테이블을 생성하고 초기 데이터를 삽입합니다."""
@@ -105,8 +493,39 @@ AI/ML,4~6년,250
     print("'joblevel_counts' 테이블 생성 및 데이터 삽입 완료.")
 
     conn.commit()
+
+    # --- 3-1. 채용공고 CSV가 있으면 위 표본 대신 실제 공고에서 집계 ---
+    build_posting_aggregates(conn)
+
+    # --- 4. KOSIS 통계표 적재 ---
+    load_kosis_workbooks(conn)
+
+    # --- 5. 고용 동향 테이블 생성 (대시보드가 그대로 조회하는 세로형 테이블) ---
+    build_employment_trend(conn)
+
+    # --- 6. 직무 적합도 가중치 행렬 ---
+    print(f"'job_fit_weights' 테이블 생성 완료 ({write_job_fit_weights(conn)}행).")
+
+    # --- 7. 대시보드 조회용 인덱스 생성 ---
+    create_query_indexes(conn)
+
+    # 대시보드의 읽기 전용 연결 풀이 서로 막지 않도록 WAL 모드로 전환합니다.
+    print(f"저널 모드: {enable_wal(conn)}")
+
     conn.close()
     print("데이터베이스 설정이 완료되었습니다.")
 
+def refresh_posting_aggregates(db_path="data/job_fit_insight.db"):
+    """전체 설정을 다시 하지 않고, 새로 들어온 공고 CSV만 top10_skills_per_job/joblevel_counts에 반영합니다."""
+    conn = sqlite3.connect(db_path)
+    try:
+        build_posting_aggregates(conn)
+    finally:
+        conn.close()
+
 if __name__ == "__main__":
-    create_db_and_tables()
+    import sys
+    if "--postings-only" in sys.argv[1:]:
+        refresh_posting_aggregates()
+    else:
+        create_db_and_tables()
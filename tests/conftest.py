@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 스크립트 모듈들은 저장소 최상위에 있으므로 테스트에서 바로 import할 수 있게 합니다.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
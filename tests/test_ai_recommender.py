@@ -0,0 +1,59 @@
+"""ai_recommender.py 백그라운드 추천 테스트."""
+import time
+from types import SimpleNamespace
+
+from ai_recommender import AI_ERROR_MESSAGE, RecommendationService
+from groq_standin import StandInGroqClient
+from response_cache import ResponseCache
+
+
+def _wait(task, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not task.done() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return task.done()
+
+
+def test_recommendation_streams_and_caches():
+    cache = ResponseCache(db_path=None)
+    service = RecommendationService(cache=cache)
+    client = StandInGroqClient(latency=0)
+    task = service.submit(client, "m", 0.2, 100, "프로필", "추천 직무 데이터")
+    assert _wait(task)
+    assert "추천 직무" in task.text() and task.elapsed() >= 0
+    cached = service.submit(client, "m", 0.2, 100, "프로필", "추천 직무 데이터")
+    assert cached.done() and cached.text() == task.text() and client.calls == 1
+
+
+def test_type_error_while_streaming_does_not_resend_request():
+    calls = []
+
+    def broken_stream():
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="- **추천"))])
+        raise TypeError("bad chunk")
+
+    def create(stream=False, **kwargs):
+        calls.append(stream)
+        return broken_stream()
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    task = RecommendationService().submit(client, "m", 0.2, 100, "프로필", "데이터")
+    assert _wait(task)
+    assert calls == [True]
+    assert task.text() == AI_ERROR_MESSAGE
+
+
+def test_client_without_streaming_falls_back_once():
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs.get("stream", False))
+        if kwargs.get("stream"):
+            raise TypeError("unexpected keyword argument 'stream'")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="- **추천 직무:** 백엔드"))], usage=None)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    task = RecommendationService().submit(client, "m", 0.2, 100, "프로필", "데이터")
+    assert _wait(task)
+    assert calls == [True, False]
+    assert task.text() == "- **추천 직무:** 백엔드"
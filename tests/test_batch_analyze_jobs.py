@@ -0,0 +1,210 @@
+"""batch_analyze_jobs.py 테스트. Groq 대신 groq_standin.StandInGroqClient로 실행합니다."""
+import sqlite3
+import time
+
+import pandas as pd
+import pytest
+
+import batch_analyze_jobs
+from batch_analyze_jobs import TokenBucket, call_with_retry, is_retryable, run_batch
+from groq_standin import StandInConnectionError, StandInGroqClient, StandInRateLimitError, _reply_for
+from jd_analysis import RESULTS_TABLE, build_jd_messages, load_jd_results, parse_jd_analysis
+
+POSTINGS = [
+    {"url": f"https://www.rallit.com/positions/{i}", "title": title, "companyName": f"회사{i}", "jobLevels": level,
+     "jobSkillKeywords": skills}
+    for i, (title, level, skills) in enumerate([
+        ("백엔드 개발자", "JUNIOR", "Python, Django"),
+        ("프론트엔드 개발자", "MIDDLE", "React, TypeScript"),
+        ("데이터 엔지니어", "SENIOR", "Spark, Airflow"),
+        ("Android Engineer", "MIDDLE", "Kotlin, Android"),
+        ("프로덕트 디자이너", "IRRELEVANT", "Figma"),
+    ])
+]
+
+
+@pytest.fixture
+def csv_pattern(tmp_path):
+    pd.DataFrame(POSTINGS).to_csv(tmp_path / "rallit_test_jobs.csv", index=False)
+    return str(tmp_path / "rallit_*.csv")
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """재시도 대기 시간을 0으로 만들고, 요청된 최대 대기 시간을 기록합니다."""
+    delays = []
+
+    def uniform(low, high):
+        delays.append(high)
+        return 0.0
+
+    monkeypatch.setattr(batch_analyze_jobs.random, "uniform", uniform)
+    return delays
+
+
+def _run(client, csv_pattern, db_path, **kwargs):
+    kwargs.setdefault("rpm", 60_000)
+    return run_batch(client, csv_pattern=csv_pattern, db_path=db_path, **kwargs)
+
+
+def _rows(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql(f"SELECT * FROM {RESULTS_TABLE} ORDER BY url", conn)
+    finally:
+        conn.close()
+
+
+def test_token_bucket_paces_requests_after_burst():
+    bucket = TokenBucket(rate=50, capacity=2)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    # 처음 2개는 바로 나가고, 나머지 4개는 초당 50개 속도(0.02초 간격)로 나갑니다.
+    assert time.monotonic() - started >= 4 / 50 * 0.9
+
+
+def test_token_bucket_does_not_wait_within_capacity():
+    bucket = TokenBucket(rate=1, capacity=3)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.5
+
+
+def test_is_retryable_only_for_transient_errors():
+    assert is_retryable(StandInRateLimitError("429"))
+    assert is_retryable(StandInConnectionError("reset"))
+    assert not is_retryable(KeyError("choices"))
+    assert not is_retryable(TypeError("bad response"))
+    assert not is_retryable(type("BadRequest", (Exception,), {"status_code": 400})())
+
+
+def test_call_with_retry_backs_off_exponentially_on_429(no_backoff):
+    failures = iter([StandInRateLimitError("429"), StandInRateLimitError("429"), StandInRateLimitError("429")])
+
+    def request():
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        return "ok"
+
+    assert call_with_retry(request, retries=5, base_delay=1.0) == ("ok", 4)
+    assert no_backoff == [1.0, 2.0, 4.0]
+
+
+def test_call_with_retry_fails_fast_on_non_retryable_error(no_backoff):
+    calls = []
+
+    def request():
+        calls.append(1)
+        raise KeyError("choices")
+
+    with pytest.raises(KeyError) as excinfo:
+        call_with_retry(request, retries=5)
+    assert excinfo.value.attempts == 1
+    assert len(calls) == 1 and no_backoff == []
+
+
+def test_call_with_retry_gives_up_after_retries(no_backoff):
+    def request():
+        raise StandInRateLimitError("429")
+
+    with pytest.raises(StandInRateLimitError) as excinfo:
+        call_with_retry(request, retries=2)
+    assert excinfo.value.attempts == 3
+
+
+def test_run_batch_retries_simulated_429s(csv_pattern, tmp_path, no_backoff):
+    client = StandInGroqClient(latency=0, failure_rate=0.5, seed=7)
+    report = _run(client, csv_pattern, str(tmp_path / "results.db"), retries=20)
+    assert (report["ok"], report["error"]) == (len(POSTINGS), 0)
+    assert client.calls > len(POSTINGS)
+    rows = _rows(tmp_path / "results.db")
+    assert rows["attempts"].sum() == client.calls
+    assert no_backoff
+
+
+def test_run_batch_resumes_from_checkpoint(csv_pattern, tmp_path):
+    db_path = str(tmp_path / "results.db")
+    client = StandInGroqClient(latency=0)
+    first = _run(client, csv_pattern, db_path, limit=3)
+    assert (first["ok"], first["skipped"], client.calls) == (3, 0, 3)
+
+    client = StandInGroqClient(latency=0)
+    second = _run(client, csv_pattern, db_path)
+    assert (second["ok"], second["skipped"], client.calls) == (2, 3, 2)
+
+    client = StandInGroqClient(latency=0)
+    third = _run(client, csv_pattern, db_path)
+    assert (third["ok"], third["skipped"], client.calls) == (0, len(POSTINGS), 0)
+
+    client = StandInGroqClient(latency=0)
+    forced = _run(client, csv_pattern, db_path, force=True)
+    assert (forced["ok"], forced["skipped"], client.calls) == (len(POSTINGS), 0, len(POSTINGS))
+
+
+def test_run_batch_reanalyzes_failed_and_changed_postings(csv_pattern, tmp_path):
+    db_path = str(tmp_path / "results.db")
+    failing = StandInGroqClient(latency=0, failure_rate=1.0)
+    report = _run(failing, csv_pattern, db_path, retries=0)
+    assert (report["ok"], report["error"]) == (0, len(POSTINGS))
+    assert set(_rows(db_path)["status"]) == {"error"}
+
+    postings = [dict(p) for p in POSTINGS]
+    postings[0]["jobSkillKeywords"] = "Python, FastAPI"
+    pd.DataFrame(postings).to_csv(csv_pattern.replace("*", "test_jobs"), index=False)
+    _run(StandInGroqClient(latency=0), csv_pattern, db_path, limit=2)
+
+    client = StandInGroqClient(latency=0)
+    report = _run(client, csv_pattern, db_path)
+    assert (report["ok"], report["skipped"], client.calls) == (3, 2, 3)
+
+
+def test_parse_jd_analysis_reads_stand_in_reply():
+    text = "공고명: 백엔드 개발자\n경력: 3년 이상\n기술 키워드: Python, Django"
+    parsed = parse_jd_analysis(_reply_for(build_jd_messages(text)))
+    assert parsed["summary"][0] == "백엔드 개발자 업무 수행"
+    assert len(parsed["summary"]) == 3
+    assert parsed["skills"] == ["Python", "Django"]
+    assert parsed["career_level"] == "3년 이상"
+    assert len(parsed["interview_questions"]) == 3
+
+
+def test_parse_jd_analysis_tolerates_formatting_and_missing_sections():
+    markdown = (
+        "## 📝 핵심 요약 (3가지)\n* **API 설계**\n• 코드 리뷰\n\n"
+        "#### 🛠️ 요구 기술 스택\n- Java, Spring,  JPA\n- AWS\n\n"
+        "### 기타\n- 무시되는 섹션\n"
+    )
+    assert parse_jd_analysis(markdown) == {
+        "summary": ["API 설계", "코드 리뷰"],
+        "skills": ["Java", "Spring", "JPA", "AWS"],
+        "career_level": "",
+        "interview_questions": [],
+    }
+    assert parse_jd_analysis(None) == {"summary": [], "skills": [], "career_level": "", "interview_questions": []}
+
+
+def test_results_table_rows_feed_dashboard(csv_pattern, tmp_path):
+    db_path = str(tmp_path / "results.db")
+    _run(StandInGroqClient(latency=0), csv_pattern, db_path, model="test-model")
+
+    rows = _rows(db_path).set_index("url")
+    backend = rows.loc[POSTINGS[0]["url"]]
+    assert (backend["status"], backend["model"], backend["title"]) == ("ok", "test-model", "백엔드 개발자")
+    assert backend["tokens"] > 0 and backend["attempts"] == 1 and backend["error"] is None
+
+    df = load_jd_results(db_path)
+    assert len(df) == len(POSTINGS)
+    loaded = df.set_index("url").loc[POSTINGS[0]["url"]]
+    assert loaded["skills"] == ["Python", "Django"]
+    assert loaded["career_level"] == "JUNIOR"
+    assert len(loaded["summary"]) == 3 and len(loaded["interview_questions"]) == 3
+
+
+def test_load_jd_results_skips_errors_and_missing_db(csv_pattern, tmp_path):
+    assert load_jd_results(str(tmp_path / "missing.db")) is None
+    db_path = str(tmp_path / "results.db")
+    _run(StandInGroqClient(latency=0, failure_rate=1.0), csv_pattern, db_path, retries=0)
+    assert load_jd_results(db_path) is None
@@ -0,0 +1,40 @@
+"""instrumentation.py Prometheus 내보내기 테스트."""
+import threading
+
+from instrumentation import Metrics, prometheus_path_for
+
+
+def test_worker_metrics_use_own_file_and_label():
+    assert prometheus_path_for(None) == "data/metrics.prom"
+    assert prometheus_path_for("3") == "data/metrics.3.prom"
+
+
+def test_write_prometheus_labels_worker(tmp_path):
+    metrics = Metrics(db_path=None, prometheus_path=None, worker="1")
+    metrics.observe("db.query", 0.002, ok=False)
+    metrics.gauge("response_cache.hit_ratio", 0.25)
+    metrics.write_prometheus(tmp_path / "metrics.prom")
+    text = (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+    assert 'jobfit_stage_errors_total{stage="db.query",worker="1"} 1' in text
+    assert 'jobfit_response_cache_hit_ratio{worker="1"} 0.250000' in text
+
+
+def test_concurrent_prometheus_writes(tmp_path):
+    metrics = Metrics(db_path=None, prometheus_path=None)
+    metrics.observe("rerun.total", 0.1)
+    errors = []
+
+    def write():
+        try:
+            for _ in range(20):
+                metrics.write_prometheus(tmp_path / "metrics.prom")
+        except Exception as e:  # pragma: no cover - 실패 시 원인을 보여줍니다.
+            errors.append(e)
+
+    threads = [threading.Thread(target=write) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert [p.name for p in tmp_path.iterdir()] == ["metrics.prom"]
@@ -0,0 +1,57 @@
+"""posting_index.py 검색 정밀도 테스트."""
+import numpy as np
+import pandas as pd
+
+from posting_index import BM25Index, build_posting_index, search_postings
+
+TITLES = [
+    "웹 개발자",                    # 0
+    "웹(Web) 백엔드 개발자",         # 1
+    "글로벌 웹 분석 관련 개발자",     # 2
+    "MAIN 서버 개발자",              # 3
+    "AI 엔지니어",                   # 4
+    "AI개발자",                      # 5
+    "프론트엔트/백엔드",              # 6
+    "Backend Engineer(메세징 서비스 기술 운영)",  # 7
+    "고객 서비스 운영 매니저",        # 8
+    "CSS 퍼블리셔",                  # 9
+]
+
+
+def _matches(index, *keywords):
+    return set(index.match(list(keywords))[0].tolist())
+
+
+def test_latin_keywords_match_whole_words():
+    index = BM25Index(TITLES, [None] * len(TITLES))
+    assert _matches(index, "AI") == {4, 5}
+    assert _matches(index, "CS") == set()
+
+
+def test_multi_token_keywords_match_as_phrase():
+    index = BM25Index(TITLES, [None] * len(TITLES))
+    assert _matches(index, "웹 개발") == {0}
+    assert _matches(index, "서비스 운영") == {8}
+    assert _matches(index, "프론트엔드") == set()
+    assert _matches(index, "개발자") == {0, 1, 2, 3, 5}
+
+
+def test_phrase_does_not_span_titles():
+    index = BM25Index(["모바일 웹", "개발자", "웹 개발 리드"], [None] * 3)
+    assert _matches(index, "웹 개발") == {2}
+
+
+def test_skill_keywords_score_but_do_not_select():
+    index = BM25Index(["웹 개발자", "데이터 엔지니어"], ["React", "웹 개발, Python"])
+    ids, scores = index.match(["웹 개발"])
+    assert ids.tolist() == [0] and scores[0] > 0
+
+
+def test_saved_index_keeps_phrase_matching(tmp_path):
+    df = pd.DataFrame({"url": [f"u{i}" for i in range(len(TITLES))], "title": TITLES, "jobLevels": ["JUNIOR"] * len(TITLES)})
+    categories = {"프론트엔드": ["프론트엔드", "웹 개발"], "AI/ML": ["AI"]}
+    build_posting_index(df, categories=categories, cache_dir=tmp_path)
+    index = build_posting_index(df, categories=categories, cache_dir=tmp_path)
+    assert isinstance(index["search"]._title_terms, np.memmap)
+    assert search_postings(df, index, "프론트엔드", "상관 없음")["title"].tolist() == ["웹 개발자"]
+    assert set(search_postings(df, index, "AI/ML", "신입")["title"]) == {"AI 엔지니어", "AI개발자"}
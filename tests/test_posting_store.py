@@ -0,0 +1,32 @@
+"""posting_store.py 증분 적재 테스트."""
+import sqlite3
+
+import pandas as pd
+
+from posting_store import load_postings, sync_postings
+
+
+def test_rows_without_url_or_duplicated_are_dropped_and_counted(tmp_path):
+    pd.DataFrame({
+        "url": ["u1", None, "u1", "u2"],
+        "title": ["백엔드 개발자", "url 없음", "중복", "디자이너"],
+    }).to_csv(tmp_path / "rallit_a_jobs.csv", index=False)
+    store = str(tmp_path / "store.db")
+    report = sync_postings(str(tmp_path / "rallit_*.csv"), store)
+    assert report["dropped"] == 2
+
+    conn = sqlite3.connect(store)
+    try:
+        stored = conn.execute("SELECT COUNT(*) FROM rallit_posting_rows").fetchone()[0]
+        manifest_rows = conn.execute("SELECT rows FROM rallit_ingest_manifest").fetchone()[0]
+    finally:
+        conn.close()
+    assert stored == manifest_rows == 2
+    assert load_postings(str(tmp_path / "rallit_*.csv"), store)["title"].tolist() == ["백엔드 개발자", "디자이너"]
+
+
+def test_duplicate_url_across_files_keeps_first_file(tmp_path):
+    pd.DataFrame({"url": ["u1"], "title": ["첫 파일"]}).to_csv(tmp_path / "rallit_a_jobs.csv", index=False)
+    pd.DataFrame({"url": ["u1", "u2"], "title": ["둘째 파일", "새 공고"]}).to_csv(tmp_path / "rallit_b_jobs.csv", index=False)
+    df = load_postings(str(tmp_path / "rallit_*.csv"), str(tmp_path / "store.db"))
+    assert df["title"].tolist() == ["첫 파일", "새 공고"]
@@ -0,0 +1,77 @@
+"""setup_database.py 집계·적재 테스트."""
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from setup_database import build_posting_aggregates, parse_kosis_workbook
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "test.db")
+    conn.execute("CREATE TABLE top10_skills_per_job (직무 TEXT, 기술스택 TEXT, 빈도 INTEGER)")
+    conn.execute("CREATE TABLE joblevel_counts (직무 TEXT, jobLevels TEXT, 공고수 INTEGER)")
+    yield conn
+    conn.close()
+
+
+def _write(path, rows):
+    pd.DataFrame(rows, columns=["url", "title", "jobSkillKeywords", "jobLevels"]).to_csv(path, index=False)
+
+
+def _levels(conn, job):
+    return dict(conn.execute("SELECT jobLevels, 공고수 FROM joblevel_counts WHERE 직무 = ?", (job,)))
+
+
+def test_postings_classified_like_dashboard_search(conn, tmp_path):
+    _write(tmp_path / "rallit_a_jobs.csv", [
+        ("u1", "AI 엔지니어", "Python", "JUNIOR"),
+        ("u2", "MAIN 서버 개발자", "Java", "SENIOR"),
+        ("u3", "CSS 퍼블리셔", "CSS", "JUNIOR"),
+        ("u4", "CS 매니저", "Zendesk", "MIDDLE"),
+        ("u5", "웹(Web) 백엔드 개발자", "Java", "MIDDLE"),
+    ])
+    build_posting_aggregates(conn, data_dir=tmp_path)
+    assert _levels(conn, "AI/ML") == {"JUNIOR": 1}
+    assert _levels(conn, "고객지원") == {"MIDDLE": 1}
+    assert "SENIOR" not in _levels(conn, "AI/ML")
+    assert _levels(conn, "프론트엔드") == {}
+
+
+def test_urls_deduplicated_across_files(conn, tmp_path):
+    _write(tmp_path / "rallit_a_jobs.csv", [("u1", "AI 엔지니어", "Python", "JUNIOR"), (None, "AI 연구원", "PyTorch", "SENIOR")])
+    _write(tmp_path / "rallit_b_jobs.csv", [("u1", "AI 엔지니어", "Python", "MIDDLE"), ("u2", "AI 리서처", "Python", "JUNIOR")])
+    build_posting_aggregates(conn, data_dir=tmp_path)
+    # url이 없는 행은 세지 않고, 두 파일에 있는 u1은 먼저 나온 파일(a)의 행만 셉니다.
+    assert _levels(conn, "AI/ML") == {"JUNIOR": 2}
+    assert dict(conn.execute("SELECT path, rows FROM posting_agg_files")) == {str(tmp_path / "rallit_a_jobs.csv"): 1, str(tmp_path / "rallit_b_jobs.csv"): 1}
+
+    # 앞 파일이 지워지면 바뀌지 않은 뒤 파일도 다시 집계해 u1을 셉니다.
+    (tmp_path / "rallit_a_jobs.csv").unlink()
+    build_posting_aggregates(conn, data_dir=tmp_path)
+    assert _levels(conn, "AI/ML") == {"MIDDLE": 1, "JUNIOR": 1}
+
+    # 같은 url을 가진 앞 파일이 다시 생기면 뒤 파일의 u1은 빠집니다.
+    _write(tmp_path / "rallit_a_jobs.csv", [("u1", "AI 엔지니어", "Python", "SENIOR")])
+    build_posting_aggregates(conn, data_dir=tmp_path)
+    assert _levels(conn, "AI/ML") == {"SENIOR": 1, "JUNIOR": 1}
+
+
+def _kosis_workbook(path, items):
+    rows = [["성별", *["2024.01"] * len(items)], ["성별", *items], ["계", *range(1, len(items) + 1)]]
+    pd.DataFrame(rows).to_excel(path, header=False, index=False)
+    return path
+
+
+def test_kosis_known_unit_split_from_item(tmp_path):
+    df, dims = parse_kosis_workbook(_kosis_workbook(tmp_path / "성별_실업률_20250621090112.xlsx", ["실업률 (%)", "취업자 (천명)"]))
+    assert dims == ["성별"]
+    assert list(zip(df["항목"], df["단위"])) == [("실업률", "%"), ("취업자", "천명")]
+
+
+def test_kosis_non_unit_parenthetical_stays_in_item(tmp_path):
+    items = ["건강보험(직장가입자)", "건강보험증감(전년동월)", "국민연금(직장가입자)"]
+    df, _ = parse_kosis_workbook(_kosis_workbook(tmp_path / "사회보험가입자_비율_20250621090154.xlsx", items))
+    assert df["항목"].tolist() == items
+    assert df["단위"].isna().all()
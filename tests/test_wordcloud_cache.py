@@ -0,0 +1,66 @@
+"""wordcloud_cache.py 디스크 캐시 동시성 테스트. 실제 렌더링 대신 고정 바이트를 돌려줍니다."""
+import threading
+import time
+
+from wordcloud_cache import WordCloudCache
+
+FREQUENCIES = {"Python": 10, "SQL": 5}
+
+
+def _cache(tmp_path, **kwargs):
+    cache = WordCloudCache(cache_dir=tmp_path, font_path="test.ttf", **kwargs)
+    renders = []
+
+    def render(frequencies):
+        renders.append(frequencies)
+        time.sleep(0.01)
+        return b"png:" + ",".join(sorted(frequencies)).encode()
+
+    cache._render = render
+    return cache, renders
+
+
+def test_concurrent_writers_of_one_key_do_not_fail(tmp_path):
+    errors = []
+    for trial in range(10):
+        caches = [_cache(tmp_path / str(trial))[0] for _ in range(6)]  # 프로세스별 캐시처럼 메모리 LRU를 나눕니다.
+        barrier = threading.Barrier(len(caches))
+
+        def worker(cache, barrier):
+            barrier.wait()
+            try:
+                assert cache.get_png(FREQUENCIES) == b"png:Python,SQL"
+            except Exception as e:  # pragma: no cover - 실패 시 원인을 보여줍니다.
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(cache, barrier)) for cache in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [f.name for f in (tmp_path / str(trial)).iterdir() if f.suffix == ".tmp"] == []
+    assert errors == []
+
+
+def test_disk_hit_skips_render(tmp_path):
+    first, _ = _cache(tmp_path)
+    first.get_png(FREQUENCIES)
+    second, renders = _cache(tmp_path)
+    assert second.get_png(FREQUENCIES) == b"png:Python,SQL"
+    assert renders == []
+
+
+def test_failed_disk_write_is_a_cache_miss(tmp_path):
+    cache, renders = _cache(tmp_path / "cache")
+    (tmp_path / "cache").rmdir()
+    assert cache.get_png(FREQUENCIES) == b"png:Python,SQL"
+    assert cache.get_png(FREQUENCIES) == b"png:Python,SQL"  # 메모리 캐시에서 읽습니다.
+    assert len(renders) == 1
+
+
+def test_prune_keeps_newest_files(tmp_path):
+    cache, _ = _cache(tmp_path, max_disk_items=2)
+    for i in range(4):
+        cache.get_png({f"skill{i}": 1})
+        time.sleep(0.01)
+    assert len(list(tmp_path.glob("*.png"))) == 2
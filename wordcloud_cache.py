@@ -0,0 +1,141 @@
+"""
+워드 클라우드 이미지 캐시
+
+직무별 기술스택 빈도로 만든 워드 클라우드를 PNG 바이트로 미리 그려 두고 st.image로 바로 보여줍니다.
+키는 빈도 데이터의 해시이며, 메모리 LRU와 선택적인 디스크 폴더에 보관합니다.
+한글 폰트 탐색은 프로세스당 한 번만 수행하고, 렌더링에는 matplotlib 그림을 쓰지 않습니다.
+"""
+import hashlib
+import io
+import json
+import os
+import platform
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+from instrumentation import timed
+
+DEFAULT_CACHE_DIR = "data/wordcloud_cache"
+FONT_CANDIDATES = [
+    "NanumGothic.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/Library/Fonts/NanumGothic.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+]
+
+
+@lru_cache(maxsize=1)
+def resolve_font_path():
+    """사용 가능한 한글 폰트 경로를 찾습니다. 없으면 None입니다."""
+    for candidate in FONT_CANDIDATES:
+        if Path(candidate).exists():
+            return candidate
+    return 'malgun' if platform.system() == 'Windows' else None
+
+
+def frequencies_key(frequencies, width, height, font_path):
+    payload = json.dumps([sorted((str(k), float(v)) for k, v in frequencies.items()), width, height, font_path], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class WordCloudCache:
+    def __init__(self, max_items=128, cache_dir=DEFAULT_CACHE_DIR, max_disk_items=512, width=400, height=300, font_path=None):
+        self.max_items = max_items
+        self.max_disk_items = max_disk_items
+        self.width = width
+        self.height = height
+        self.font_path = font_path if font_path is not None else resolve_font_path()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    @timed("figure.wordcloud")
+    def _render(self, frequencies):
+        from wordcloud import WordCloud  # 첫 렌더링 때만 불러옵니다.
+        wc = WordCloud(font_path=self.font_path, background_color='white', width=self.width, height=self.height, colormap='viridis').generate_from_frequencies(frequencies)
+        buffer = io.BytesIO()
+        wc.to_image().save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+
+    def _remember(self, key, png):
+        with self._lock:
+            self._images[key] = png
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_items:
+                self._images.popitem(last=False)
+
+    def _prune_disk(self):
+        def mtime(f):
+            try:
+                return f.stat().st_mtime
+            except FileNotFoundError:  # 다른 프로세스가 먼저 지운 파일
+                return 0.0
+
+        files = sorted(self.cache_dir.glob("*.png"), key=mtime)
+        for stale in files[:max(0, len(files) - self.max_disk_items)]:
+            stale.unlink(missing_ok=True)
+
+    @staticmethod
+    def _read_disk(disk_file):
+        """디스크 캐시를 읽습니다. 파일이 없거나 읽는 사이 지워졌으면 None입니다."""
+        try:
+            return disk_file.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, disk_file, png):
+        """
+        고유한 임시 파일에 쓴 뒤 이름을 바꿔, 같은 키를 동시에 쓰는 스레드·워커 프로세스끼리 부딪치지 않게 합니다.
+        쓰기에 실패해도 캐시에 저장하지 못한 것뿐이므로 경고만 남깁니다.
+        """
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=f"{disk_file.stem}.", suffix=".tmp", delete=False) as tmp:
+                tmp_path = tmp.name
+                tmp.write(png)
+            os.replace(tmp_path, disk_file)
+            tmp_path = None
+            self._prune_disk()
+        except OSError as e:
+            print(f"[Warning] 워드 클라우드 캐시 저장 실패: {e}")
+        finally:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def get_png(self, frequencies):
+        """빈도 dict({기술: 빈도})의 워드 클라우드 PNG 바이트를 반환합니다. 폰트나 데이터가 없으면 None입니다."""
+        frequencies = {str(k): float(v) for k, v in frequencies.items() if v and v > 0}
+        if self.font_path is None or not frequencies:
+            return None
+        key = frequencies_key(frequencies, self.width, self.height, self.font_path)
+        with self._lock:
+            png = self._images.get(key)
+            if png is not None:
+                self._images.move_to_end(key)
+                return png
+        disk_file = self.cache_dir / f"{key}.png" if self.cache_dir is not None else None
+        png = self._read_disk(disk_file) if disk_file is not None else None
+        if png is None:
+            png = self._render(frequencies)
+            if disk_file is not None:
+                self._write_disk(disk_file, png)
+        self._remember(key, png)
+        return png
+
+    def warm(self, frequencies_by_job):
+        """직무별 빈도 dict를 받아 워드 클라우드를 미리 렌더링합니다."""
+        for frequencies in frequencies_by_job.values():
+            try:
+                self.get_png(frequencies)
+            except Exception as e:
+                print(f"[Warning] 워드 클라우드 사전 생성 실패: {e}")
+
+    def warm_async(self, frequencies_by_job):
+        thread = threading.Thread(target=self.warm, args=(frequencies_by_job,), name="wordcloud-warmup", daemon=True)
+        thread.start()
+        return thread